@@ -0,0 +1,154 @@
+import os
+import json
+
+EXCLUDED_FOLDERS = {'.git', '__pycache__', 'actual-flags'}
+
+
+class CorpusManifest:
+    """Index of every model run (images and command file), shared by the rating and efficiency tools.
+
+    The index is saved next to the corpus and revalidated by directory mtime, so only
+    folders that changed since the last run are listed again.
+    """
+    def __init__(self, root=".", cache_path=".corpus-manifest.json"):
+        self.root = root
+        self.cache_path = os.path.join(root, cache_path)
+        self.models = {}  # model -> {"mtime": ..., "runs": {run: run entry}}
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.cache_path, 'r') as f:
+                self.models = json.load(f).get("models", {})
+        except (OSError, ValueError):
+            self.models = {}
+
+    def save(self):
+        try:
+            with open(self.cache_path, 'w') as f:
+                json.dump({"models": self.models}, f, indent=2)
+        except OSError as e:
+            print(f"Could not save corpus manifest: {e}")
+
+    def refresh(self):
+        """Bring the index up to date, re-listing only model and run folders whose mtime moved."""
+        models = {}
+        with os.scandir(self.root) as entries:
+            for entry in entries:
+                if not entry.is_dir() or entry.name in EXCLUDED_FOLDERS or entry.name.startswith('.'):
+                    continue
+
+                mtime = entry.stat().st_mtime
+                cached = self.models.get(entry.name)
+                if cached is None or cached["mtime"] != mtime:
+                    run_names = self.list_runs(entry.path)
+                else:
+                    run_names = list(cached["runs"])
+                if not run_names:
+                    continue
+
+                runs = {}
+                for run in run_names:
+                    cached_run = cached["runs"].get(run) if cached else None
+                    run_entry = self.refresh_run(entry.name, run, cached_run)
+                    if run_entry is not None:
+                        runs[run] = run_entry
+
+                models[entry.name] = {"mtime": mtime, "runs": runs}
+
+        if models != self.models:
+            self.models = models
+            self.save()
+        return self
+
+    def list_runs(self, model_path):
+        with os.scandir(model_path) as entries:
+            return sorted(entry.name for entry in entries if entry.is_dir() and 'flags' in entry.name.lower())
+
+    def refresh_run(self, model, run, cached_run):
+        run_path = os.path.join(self.root, model, run)
+        try:
+            mtime = os.stat(run_path).st_mtime
+        except OSError:
+            return None
+
+        if cached_run is not None and cached_run["mtime"] == mtime:
+            # Listing is unchanged, but the command file can be rewritten in place
+            command = cached_run["command"]
+            if command is None:
+                return cached_run
+            try:
+                command_mtime = os.stat(command["path"]).st_mtime
+            except OSError:
+                command_mtime = None
+            if command_mtime == command["mtime"]:
+                return cached_run
+
+        return self.scan_run(model, run, mtime)
+
+    def scan_run(self, model, run, mtime):
+        images = {}
+        command_files = {}
+        with os.scandir(os.path.join(self.root, model, run)) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                name, ext = os.path.splitext(entry.name)
+                if ext.lower() == '.png':
+                    images[name] = {
+                        "path": os.path.normpath(os.path.join(self.root, model, run, entry.name)),
+                        "mtime": entry.stat().st_mtime
+                    }
+                elif ext.lower() == '.json':
+                    command_files[entry.name] = entry
+
+        # Runs store cmd.json; older exports used {model}-flags-cmd.json
+        command = None
+        for filename in ("cmd.json", f"{model}-flags-cmd.json"):
+            if filename in command_files:
+                command = {
+                    "path": os.path.normpath(os.path.join(self.root, model, run, filename)),
+                    "mtime": command_files[filename].stat().st_mtime
+                }
+                break
+
+        return {
+            "mtime": mtime,
+            "command": command,
+            "images": dict(sorted(images.items()))
+        }
+
+    def model_folders(self):
+        return sorted(self.models)
+
+    def flag_images(self):
+        """One record per image: model, run, country, image path, command path and mtime."""
+        records = []
+        for model in sorted(self.models):
+            for run, run_entry in sorted(self.models[model]["runs"].items()):
+                command = run_entry["command"]
+                for country, image in run_entry["images"].items():
+                    records.append({
+                        'ai_folder': model,
+                        'subfolder': run,
+                        'country': country,
+                        'path': image["path"],
+                        'command_path': command["path"] if command else None,
+                        'mtime': image["mtime"]
+                    })
+        return records
+
+    def command_files(self):
+        """One record per run that has a command file."""
+        records = []
+        for model in sorted(self.models):
+            for run, run_entry in sorted(self.models[model]["runs"].items()):
+                command = run_entry["command"]
+                if command:
+                    records.append({
+                        'path': command["path"],
+                        'ai_folder': model,
+                        'subfolder': run,
+                        'mtime': command["mtime"]
+                    })
+        return records
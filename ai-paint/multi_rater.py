@@ -0,0 +1,188 @@
+import os
+import glob
+import json
+import argparse
+from rating_journal import RatingJournal
+
+
+class FlagStats:
+    """Ratings for one (model, run, country) unit, with running sums for the agreement statistic."""
+    def __init__(self):
+        self.scores = {}  # rater -> latest score
+        self.total = 0
+        self.total_sq = 0
+
+    @property
+    def count(self):
+        return len(self.scores)
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0
+
+    def disagreement(self):
+        """Sum of squared differences over ordered pairs of ratings, divided by (m - 1)."""
+        m = self.count
+        if m < 2:
+            return 0
+        return 2 * (m * self.total_sq - self.total ** 2) / (m - 1)
+
+
+class MultiRaterAggregator:
+    """Merge many raters' journals and keep Krippendorff's alpha (interval) up to date."""
+    def __init__(self):
+        self.units = {}  # (ai_folder, subfolder, country) -> FlagStats
+        self.raters = set()
+        self.journals = {}  # path -> [RatingJournal, byte offset already read, rater]
+        self.rater_paths = {}  # rater name -> journal that first used it
+
+        # Totals over pairable units (two or more ratings), maintained per rating
+        self.pairable_count = 0
+        self.pairable_total = 0
+        self.pairable_total_sq = 0
+        self.observed_disagreement = 0
+
+    def add_journal(self, path):
+        if path not in self.journals:
+            default_rater = os.path.splitext(os.path.basename(path))[0]
+            self.journals[path] = [RatingJournal(path), 0, default_rater]
+        self.refresh(path)
+
+    def refresh(self, path=None):
+        """Fold in ratings appended since the last read; only the new bytes are parsed."""
+        paths = [path] if path else list(self.journals)
+        for journal_path in paths:
+            entry = self.journals[journal_path]
+            journal, offset, rater = entry
+            records, entry[1] = journal.read_records(offset)
+
+            for record in records:
+                if record.get("type") == "session":
+                    if record.get("rater"):
+                        rater = record["rater"]
+                    entry[2] = rater
+                elif record.get("type") == "rating":
+                    key = (record["ai_folder"], record["subfolder"], record["country"])
+                    self.add_rating(self.rater_label(journal_path, rater), key, record["score"])
+
+    def rater_label(self, path, name):
+        """`name` as the rater of this journal. Different journals are different raters, so a
+        name another journal already used (e.g. a shared OS account) is qualified by the path."""
+        owner = self.rater_paths.setdefault(name, path)
+        return name if owner == path else f"{name} ({path})"
+
+    def unit_contribution(self, unit):
+        if unit.count < 2:
+            return 0, 0, 0, 0
+        return unit.count, unit.total, unit.total_sq, unit.disagreement()
+
+    def add_rating(self, rater, key, score):
+        """Record one rating; a rater re-scoring a flag replaces their earlier score."""
+        self.raters.add(rater)
+        unit = self.units.setdefault(key, FlagStats())
+
+        # Swap the unit's old contribution for its new one so totals stay O(1) per rating
+        count, total, total_sq, disagreement = self.unit_contribution(unit)
+        self.pairable_count -= count
+        self.pairable_total -= total
+        self.pairable_total_sq -= total_sq
+        self.observed_disagreement -= disagreement
+
+        previous = unit.scores.get(rater)
+        if previous is not None:
+            unit.total -= previous
+            unit.total_sq -= previous * previous
+        unit.scores[rater] = score
+        unit.total += score
+        unit.total_sq += score * score
+
+        count, total, total_sq, disagreement = self.unit_contribution(unit)
+        self.pairable_count += count
+        self.pairable_total += total
+        self.pairable_total_sq += total_sq
+        self.observed_disagreement += disagreement
+
+    def krippendorff_alpha(self):
+        """Interval-metric alpha, or None until there is variation among pairable ratings."""
+        n = self.pairable_count
+        if n < 2:
+            return None
+
+        expected = 2 * (n * self.pairable_total_sq - self.pairable_total ** 2) / (n * (n - 1))
+        if expected == 0:
+            return None
+        observed = self.observed_disagreement / n
+        return 1 - observed / expected
+
+    def lookup(self, ai_folder, subfolder, country):
+        return self.units.get((ai_folder, subfolder, country))
+
+    def results(self):
+        """Build a flag_ratings.json-style structure with per-flag mean, count and scores."""
+        alpha = self.krippendorff_alpha()
+        results = {
+            "raters": sorted(self.raters),
+            "krippendorff_alpha": round(alpha, 4) if alpha is not None else None,
+            "overall_average": 0,
+            "ai_folders": {}
+        }
+
+        # Averages are taken over per-flag means so each flag weighs the same regardless of rater count
+        ai_sums = {}
+        subfolder_sums = {}
+        for (ai_folder, subfolder, country), unit in self.units.items():
+            ai_data = results["ai_folders"].setdefault(ai_folder, {
+                "average": 0,
+                "subfolders": {}
+            })
+            subfolder_data = ai_data["subfolders"].setdefault(subfolder, {
+                "average": 0,
+                "flags": {}
+            })
+            subfolder_data["flags"][country] = {
+                "mean": round(unit.mean, 2),
+                "count": unit.count,
+                "scores": dict(unit.scores)
+            }
+
+            for sums, key in ((ai_sums, ai_folder), (subfolder_sums, (ai_folder, subfolder))):
+                entry = sums.setdefault(key, [0, 0])
+                entry[0] += unit.mean
+                entry[1] += 1
+
+        for ai_folder, ai_data in results["ai_folders"].items():
+            total, count = ai_sums[ai_folder]
+            ai_data["average"] = round(total / count, 2)
+            for subfolder, subfolder_data in ai_data["subfolders"].items():
+                total, count = subfolder_sums[(ai_folder, subfolder)]
+                subfolder_data["average"] = round(total / count, 2)
+
+        if self.units:
+            grand_total = sum(total for total, _ in ai_sums.values())
+            results["overall_average"] = round(grand_total / len(self.units), 2)
+
+        return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Merge several raters' flag rating journals.")
+    parser.add_argument("journals", nargs="+", help="Journal files or glob patterns")
+    parser.add_argument("-o", "--output", default="flag_ratings_multi.json", help="Where to write the merged ratings")
+    args = parser.parse_args()
+
+    aggregator = MultiRaterAggregator()
+    for pattern in args.journals:
+        for path in sorted(glob.glob(pattern)):
+            aggregator.add_journal(path)
+
+    results = aggregator.results()
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=4)
+
+    print(f"Merged {len(aggregator.raters)} raters over {len(aggregator.units)} flags")
+    print(f"Krippendorff's alpha (interval): {results['krippendorff_alpha']}")
+    print(f"Results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
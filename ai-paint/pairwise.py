@@ -0,0 +1,215 @@
+import math
+import random
+import numpy as np
+
+# Adjacent models count as separated once their score gap exceeds this many standard errors
+# (about 84% confidence in each pair's order; stricter levels rarely fit in the budget)
+SEPARATION_Z = 1.0
+# Default budget as a share of the flags, which is what rating every flag once would take
+BUDGET_PER_FLAG = 0.5
+
+
+class PairwiseRanker:
+    """Bradley-Terry ranking of flags from "which is closer to the reference" judgments.
+
+    Flags are only compared against other models' flags for the same country, so every
+    comparison is made against one shared reference image. The model ranking comes from
+    a Bradley-Terry fit over the models themselves, which pools every judgment a model
+    took part in; per-flag strengths are fitted alongside for the report. A session is
+    done once every adjacent pair of models is separated by more than SEPARATION_Z
+    standard errors, or after `max_judgments` (by default half as many as there are flags).
+    """
+    def __init__(self, items, prior=1.0, seed=None, max_judgments=None):
+        # items: list of (ai_folder, subfolder, country) keys
+        self.items = list(items)
+        self.prior = prior
+        if max_judgments is None:
+            max_judgments = max(1, int(BUDGET_PER_FLAG * len(self.items)))
+        self.max_judgments = max_judgments
+        self.rng = random.Random(seed)
+        self.judgments = 0
+
+        # Per-flag fit
+        self.strength = {item: 1.0 for item in self.items}
+        self.wins = {item: 0 for item in self.items}
+        self.pair_counts = {}  # frozenset({a, b}) -> number of comparisons
+        self.opponents = {item: set() for item in self.items}
+        self.comparisons = {item: 0 for item in self.items}
+
+        # Per-model fit
+        self.models = sorted({item[0] for item in self.items})
+        self.model_strength = {model: 1.0 for model in self.models}
+        self.model_wins = {model: 0 for model in self.models}
+        self.model_pair_counts = {}  # frozenset({model, model}) -> number of comparisons
+        self.covariance = None  # of the models' log-strengths, refreshed by fit()
+
+        self.flags = {}  # (model, country) -> that model's flags of the country
+        self.by_country = {}
+        for item in self.items:
+            self.flags.setdefault((item[0], item[2]), []).append(item)
+            self.by_country.setdefault(item[2], []).append(item)
+        self.shared_countries = {}  # (model, model) -> countries both have flags for
+        for i, a in enumerate(self.models):
+            for b in self.models[i + 1:]:
+                countries = [country for country in self.by_country
+                             if (a, country) in self.flags and (b, country) in self.flags]
+                if countries:
+                    self.shared_countries[(a, b)] = countries
+
+    def record(self, winner, loser, refit=True):
+        """Add one judgment and refit the strengths (pass refit=False when replaying many)."""
+        pair = frozenset((winner, loser))
+        self.pair_counts[pair] = self.pair_counts.get(pair, 0) + 1
+        self.wins[winner] += 1
+        self.opponents[winner].add(loser)
+        self.opponents[loser].add(winner)
+        self.comparisons[winner] += 1
+        self.comparisons[loser] += 1
+        self.judgments += 1
+
+        # Two runs of one model say nothing about the model ranking
+        if winner[0] != loser[0]:
+            model_pair = frozenset((winner[0], loser[0]))
+            self.model_pair_counts[model_pair] = self.model_pair_counts.get(model_pair, 0) + 1
+            self.model_wins[winner[0]] += 1
+        if refit:
+            self.fit()
+
+    def fit(self, iterations=50):
+        """Minorization-maximization updates (Hunter, 2004) with a weak prior, for flags
+        and for models.
+
+        The prior is one virtual win and one virtual loss against a fixed opponent of
+        strength 1, which keeps unbeaten or winless flags finite.
+        """
+        strength = self.strength
+        for _ in range(iterations):
+            for item in self.items:
+                denominator = 2 * self.prior / (strength[item] + 1.0)
+                for other in self.opponents[item]:
+                    n = self.pair_counts[frozenset((item, other))]
+                    denominator += n / (strength[item] + strength[other])
+                strength[item] = (self.wins[item] + self.prior) / denominator
+
+        strength = self.model_strength
+        for _ in range(iterations):
+            for model in self.models:
+                denominator = 2 * self.prior / (strength[model] + 1.0)
+                for pair, n in self.model_pair_counts.items():
+                    if model in pair:
+                        other, = pair - {model}
+                        denominator += n / (strength[model] + strength[other])
+                strength[model] = (self.model_wins[model] + self.prior) / denominator
+        self.covariance = self.model_covariance()
+
+    def model_covariance(self):
+        """Approximate covariance of the models' log-strengths, the inverse of the Fisher
+        information of the model fit."""
+        index = {model: i for i, model in enumerate(self.models)}
+        information = np.zeros((len(self.models), len(self.models)))
+        for model, s in self.model_strength.items():
+            information[index[model], index[model]] = 2 * self.prior * s / (s + 1.0) ** 2
+        for pair, n in self.model_pair_counts.items():
+            a, b = (index[model] for model in pair)
+            sa, sb = self.model_strength[self.models[a]], self.model_strength[self.models[b]]
+            weight = n * sa * sb / (sa + sb) ** 2
+            information[a, a] += weight
+            information[b, b] += weight
+            information[a, b] -= weight
+            information[b, a] -= weight
+        return np.linalg.inv(information)
+
+    def separation(self, a, b):
+        """Gap between two models' log-strengths in standard errors of that gap."""
+        if self.covariance is None:
+            self.fit()
+        i, j = self.models.index(a), self.models.index(b)
+        variance = self.covariance[i, i] + self.covariance[j, j] - 2 * self.covariance[i, j]
+        gap = abs(math.log(self.model_strength[a]) - math.log(self.model_strength[b]))
+        return gap / math.sqrt(variance)
+
+    def next_pair(self):
+        """Pick the two models whose order is least certain, then the country where their
+        flags have been compared least. None if no country has flags of two models."""
+        best_models = None
+        best_separation = math.inf
+        for a, b in self.shared_countries:
+            # Random jitter breaks ties so equal pairs are not always shown in list order
+            separation = self.separation(a, b) + 1e-6 * self.rng.random()
+            if separation < best_separation:
+                best_separation = separation
+                best_models = (a, b)
+        if best_models is None:
+            return None
+
+        a, b = best_models
+        best_pair = None
+        best_count = math.inf
+        for country in self.shared_countries[best_models]:
+            # The least compared flag of each model, so judgments spread over runs and countries
+            pair = tuple(min(self.flags[(model, country)],
+                             key=lambda item: (self.comparisons[item], self.rng.random()))
+                         for model in (a, b))
+            count = sum(self.comparisons[item] for item in pair) + self.rng.random()
+            if count < best_count:
+                best_count = count
+                best_pair = pair
+
+        if self.rng.random() < 0.5:
+            best_pair = (best_pair[1], best_pair[0])
+        return best_pair
+
+    def item_scores(self):
+        """Log-strength of each flag, centred per country so countries are comparable."""
+        scores = {}
+        for country_items in self.by_country.values():
+            logs = [math.log(self.strength[item]) for item in country_items]
+            centre = sum(logs) / len(logs)
+            for item, value in zip(country_items, logs):
+                scores[item] = value - centre
+        return scores
+
+    def model_scores(self):
+        """Log-strength of each model, centred on zero."""
+        logs = {model: math.log(self.model_strength[model]) for model in self.models}
+        centre = sum(logs.values()) / len(logs) if logs else 0.0
+        return {model: value - centre for model, value in logs.items()}
+
+    def model_order(self):
+        scores = self.model_scores()
+        return sorted(scores, key=scores.get, reverse=True)
+
+    def unresolved(self):
+        """Adjacent models in the ranking whose score gap is within SEPARATION_Z standard errors."""
+        order = self.model_order()
+        return [(a, b) for a, b in zip(order, order[1:]) if self.separation(a, b) <= SEPARATION_Z]
+
+    def is_stable(self):
+        """True once every adjacent pair of models is separated, or the judgment budget
+        is used up."""
+        if self.judgments >= self.max_judgments:
+            return True
+        return not self.unresolved()
+
+    def results(self):
+        item_scores = self.item_scores()
+        results = {
+            "judgments": self.judgments,
+            # Adjacent models whose order is still within the noise, if the budget ran out
+            "unresolved": [list(pair) for pair in self.unresolved()],
+            "models": {},
+        }
+        model_scores = self.model_scores()
+        for ai_folder in self.model_order():
+            results["models"][ai_folder] = {
+                "score": round(model_scores[ai_folder], 4),
+                "subfolders": {}
+            }
+        for item, score in item_scores.items():
+            ai_folder, subfolder, country = item
+            flags = results["models"][ai_folder]["subfolders"].setdefault(subfolder, {})
+            flags[country] = {
+                "score": round(score, 4),
+                "comparisons": self.comparisons[item]
+            }
+        return results
@@ -1,402 +1,619 @@
-import os
-import json
-import tkinter as tk
-from tkinter import ttk
-from PIL import Image, ImageTk
-import matplotlib.pyplot as plt
-import random
-import numpy as np  # Required for grouped bar chart
-
-# Mapping of country names to ISO codes
-COUNTRY_TO_ISO = {
-    "Germany": "DE",
-    "Sweden": "SE",
-    "Brazil": "BR",
-    "Nepal": "NP",
-    "Zambia": "ZM",
-    "Australia": "AU",
-    "Bhutan": "BT",
-    "Saudi Arabia": "SA",
-    "Kazakhstan": "KZ",
-    "Tanzania": "TZ"
-}
-
-class FlagRatingApp:
-    def __init__(self, root):
-        self.root = root
-        self.root.title("Flag Rating Application")
-        self.root.geometry("1000x700")  # Larger window for side-by-side display
-        
-        # Data structures to store paths and ratings
-        self.ai_folders = []
-        self.flag_paths = []
-        self.current_index = 0
-        self.ratings = {}
-        self.actual_flags_dir = "actual-flags"
-        
-        # Find all AI folders and flag images
-        self.find_flag_images()
-        
-        # Shuffle the flag paths to randomize the order
-        random.shuffle(self.flag_paths)
-        
-        # Create UI elements
-        self.setup_ui()
-        
-        # Start showing flags
-        if self.flag_paths:
-            self.show_current_flag()
-        else:
-            self.info_label.config(text="No flag images found!")
-    
-    def find_flag_images(self):
-        # Get all directories in the root that might be AI model folders
-        potential_ai_folders = [d for d in os.listdir() if os.path.isdir(d) and 
-                               d not in ['.git', '__pycache__', self.actual_flags_dir]]
-        
-        for ai_folder in potential_ai_folders:
-            # Check if this folder contains flag subfolders
-            subfolders = [d for d in os.listdir(ai_folder) if os.path.isdir(os.path.join(ai_folder, d)) and 'flags' in d.lower()]
-            
-            if subfolders:
-                self.ai_folders.append(ai_folder)
-                
-                # For each subfolder, find all PNG files
-                for subfolder in subfolders:
-                    subfolder_path = os.path.join(ai_folder, subfolder)
-                    flag_files = [f for f in os.listdir(subfolder_path) if f.endswith('.png')]
-                    
-                    for flag_file in flag_files:
-                        flag_path = os.path.join(ai_folder, subfolder, flag_file)
-                        country_name = os.path.splitext(flag_file)[0]
-                        
-                        # Only include flags that have a corresponding actual flag
-                        if country_name in COUNTRY_TO_ISO:
-                            self.flag_paths.append({
-                                'path': flag_path,
-                                'ai_folder': ai_folder,
-                                'subfolder': subfolder,
-                                'country': country_name,
-                                'iso_code': COUNTRY_TO_ISO[country_name]
-                            })
-    
-    def setup_ui(self):
-        # Main frame
-        main_frame = ttk.Frame(self.root)
-        main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
-        
-        # Title label
-        title_label = ttk.Label(main_frame, text="Flag Comparison and Rating", font=("Arial", 16, "bold"))
-        title_label.pack(pady=(0, 20))
-        
-        # Frame for displaying flags side by side
-        self.flags_frame = ttk.Frame(main_frame)
-        self.flags_frame.pack(fill=tk.BOTH, expand=True)
-        
-        # Left side - Actual flag
-        self.actual_flag_frame = ttk.LabelFrame(self.flags_frame, text="Actual Flag")
-        self.actual_flag_frame.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
-        
-        self.actual_flag_label = ttk.Label(self.actual_flag_frame)
-        self.actual_flag_label.pack(padx=10, pady=10, expand=True)
-        
-        # Right side - AI-generated flag
-        self.ai_flag_frame = ttk.LabelFrame(self.flags_frame, text="AI-Generated Flag")
-        self.ai_flag_frame.grid(row=0, column=1, padx=10, pady=10, sticky="nsew")
-        
-        self.ai_flag_label = ttk.Label(self.ai_flag_frame)
-        self.ai_flag_label.pack(padx=10, pady=10, expand=True)
-        
-        # Configure grid weights
-        self.flags_frame.columnconfigure(0, weight=1)
-        self.flags_frame.columnconfigure(1, weight=1)
-        self.flags_frame.rowconfigure(0, weight=1)
-        
-        # Info label for country name
-        self.info_label = ttk.Label(main_frame, font=("Arial", 14))
-        self.info_label.pack(pady=10)
-        
-        # Frame for rating buttons
-        rating_frame = ttk.Frame(main_frame)
-        rating_frame.pack(pady=10)
-        
-        rating_label = ttk.Label(rating_frame, text="Rate similarity (1-10):", font=("Arial", 12))
-        rating_label.grid(row=0, column=0, columnspan=10, pady=(0, 10))
-        
-        # Create rating buttons (1-10)
-        for i in range(1, 11):
-            btn = ttk.Button(rating_frame, text=str(i), width=5,
-                            command=lambda score=i: self.rate_flag(score))
-            btn.grid(row=1, column=i-1, padx=5)
-        
-        # Progress label
-        self.progress_label = ttk.Label(main_frame, text="")
-        self.progress_label.pack(pady=10)
-    
-    def show_current_flag(self):
-        if 0 <= self.current_index < len(self.flag_paths):
-            flag_info = self.flag_paths[self.current_index]
-            
-            # Update progress label
-            self.progress_label.config(
-                text=f"Progress: {self.current_index + 1}/{len(self.flag_paths)}"
-            )
-            
-            # Display country name
-            self.info_label.config(
-                text=f"Country: {flag_info['country']}"
-            )
-            
-            # Load and display the actual flag
-            actual_flag_path = os.path.join(self.actual_flags_dir, f"{flag_info['iso_code']}.png")
-            if os.path.exists(actual_flag_path):
-                self.load_and_display_image(actual_flag_path, self.actual_flag_label)
-            else:
-                self.actual_flag_label.config(image=None, text=f"Actual flag not found")
-            
-            # Load and display the AI-generated flag
-            self.load_and_display_image(flag_info['path'], self.ai_flag_label)
-    
-    def load_and_display_image(self, image_path, label_widget):
-        try:
-            img = Image.open(image_path)
-            # Resize image if needed while maintaining aspect ratio
-            width, height = img.size
-            max_size = 300
-            if width > max_size or height > max_size:
-                ratio = min(max_size/width, max_size/height)
-                new_width = int(width * ratio)
-                new_height = int(height * ratio)
-                img = img.resize((new_width, new_height), Image.LANCZOS)
-            
-            photo = ImageTk.PhotoImage(img)
-            label_widget.config(image=photo)
-            label_widget.image = photo  # Keep a reference
-        except Exception as e:
-            label_widget.config(image=None, text=f"Error loading image: {e}")
-    
-    def rate_flag(self, score):
-        if 0 <= self.current_index < len(self.flag_paths):
-            flag_info = self.flag_paths[self.current_index]
-            key = (flag_info['ai_folder'], flag_info['subfolder'], flag_info['country'])
-            self.ratings[key] = score
-            
-            # Move to the next flag
-            self.current_index += 1
-            
-            if self.current_index < len(self.flag_paths):
-                self.show_current_flag()
-            else:
-                self.finish_rating()
-    
-    def finish_rating(self):
-        # Clear the display
-        self.actual_flag_label.config(image=None)
-        self.ai_flag_label.config(image=None)
-        self.info_label.config(text="Rating completed! Generating results...")
-        
-        # Calculate averages and generate JSON
-        results = self.calculate_averages()
-        
-        # Save results to JSON file
-        with open('flag_ratings.json', 'w') as f:
-            json.dump(results, f, indent=4)
-        
-        # Show completion message
-        self.info_label.config(text="Ratings saved to flag_ratings.json")
-        
-        # Generate and display charts
-        self.generate_charts(results)
-    
-    def calculate_averages(self):
-        results = {
-            "overall_average": 0,
-            "ai_folders": {}
-        }
-        
-        total_score = 0
-        total_count = 0
-        
-        # Group ratings by AI folder and subfolder
-        for (ai_folder, subfolder, country), score in self.ratings.items():
-            # Initialize AI folder if not exists
-            if ai_folder not in results["ai_folders"]:
-                results["ai_folders"][ai_folder] = {
-                    "average": 0,
-                    "subfolders": {}
-                }
-            
-            # Initialize subfolder if not exists
-            if subfolder not in results["ai_folders"][ai_folder]["subfolders"]:
-                results["ai_folders"][ai_folder]["subfolders"][subfolder] = {
-                    "average": 0,
-                    "flags": {}
-                }
-            
-            # Add flag rating
-            results["ai_folders"][ai_folder]["subfolders"][subfolder]["flags"][country] = score
-            
-            # Update totals
-            total_score += score
-            total_count += 1
-        
-        # Calculate averages for each subfolder
-        for ai_folder in results["ai_folders"]:
-            ai_total = 0
-            ai_count = 0
-            
-            for subfolder in results["ai_folders"][ai_folder]["subfolders"]:
-                subfolder_data = results["ai_folders"][ai_folder]["subfolders"][subfolder]
-                subfolder_total = sum(subfolder_data["flags"].values())
-                subfolder_count = len(subfolder_data["flags"])
-                
-                if subfolder_count > 0:
-                    subfolder_data["average"] = round(subfolder_total / subfolder_count, 2)
-                    ai_total += subfolder_total
-                    ai_count += subfolder_count
-            
-            # Calculate average for AI folder
-            if ai_count > 0:
-                results["ai_folders"][ai_folder]["average"] = round(ai_total / ai_count, 2)
-        
-        # Calculate overall average
-        if total_count > 0:
-            results["overall_average"] = round(total_score / total_count, 2)
-        
-        return results
-    
-    def generate_charts(self, results):
-        # Create a new window for charts
-        chart_window = tk.Toplevel(self.root)
-        chart_window.title("Rating Results")
-        chart_window.geometry("1000x700")
-        
-        # Create notebook (tabbed interface)
-        notebook = ttk.Notebook(chart_window)
-        notebook.pack(fill=tk.BOTH, expand=True)
-        
-        # Create tab for AI folder comparison
-        ai_tab = ttk.Frame(notebook)
-        notebook.add(ai_tab, text="AI Models Comparison")
-        
-        # Create figure for AI comparison
-        ai_fig = plt.Figure(figsize=(10, 6))
-        ai_ax = ai_fig.add_subplot(111)
-        
-        # Extract AI folder averages
-        ai_names = list(results["ai_folders"].keys())
-        ai_scores = [results["ai_folders"][ai]["average"] for ai in ai_names]
-        
-        # Sort by score for better visualization
-        sorted_data = sorted(zip(ai_names, ai_scores), key=lambda x: x[1], reverse=True)
-        sorted_ai_names, sorted_ai_scores = zip(*sorted_data) if sorted_data else ([], [])
-        
-        # Create bar chart
-        bars = ai_ax.bar(sorted_ai_names, sorted_ai_scores)
-        ai_ax.set_ylim(0, 10)
-        ai_ax.set_title("Average Similarity Scores by AI Model")
-        ai_ax.set_ylabel("Average Score")
-        ai_ax.set_xlabel("AI Model")
-        
-        # Add value labels on top of bars
-        for bar in bars:
-            height = bar.get_height()
-            ai_ax.text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                    f'{height:.2f}', ha='center', va='bottom')
-        
-        # Add the figure to the tab
-        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-        canvas = FigureCanvasTkAgg(ai_fig, ai_tab)
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-        
-        # Create tabs for each AI folder to show subfolder comparisons
-        for ai_folder in results["ai_folders"]:
-            ai_detail_tab = ttk.Frame(notebook)
-            notebook.add(ai_detail_tab, text=ai_folder)
-            
-            # Create figure for subfolder comparison
-            subfolder_fig = plt.Figure(figsize=(10, 6))
-            subfolder_ax = subfolder_fig.add_subplot(111)
-            
-            # Extract subfolder averages
-            subfolder_names = list(results["ai_folders"][ai_folder]["subfolders"].keys())
-            subfolder_scores = [results["ai_folders"][ai_folder]["subfolders"][sf]["average"] 
-                              for sf in subfolder_names]
-            
-            # Sort by score
-            sorted_data = sorted(zip(subfolder_names, subfolder_scores), key=lambda x: x[1], reverse=True)
-            sorted_subfolder_names, sorted_subfolder_scores = zip(*sorted_data) if sorted_data else ([], [])
-            
-            # Create bar chart
-            bars = subfolder_ax.bar(sorted_subfolder_names, sorted_subfolder_scores)
-            subfolder_ax.set_ylim(0, 10)
-            subfolder_ax.set_title(f"Average Similarity Scores for {ai_folder} Subfolders")
-            subfolder_ax.set_ylabel("Average Score")
-            subfolder_ax.set_xlabel("Subfolder")
-            
-            # Add value labels on top of bars
-            for bar in bars:
-                height = bar.get_height()
-                subfolder_ax.text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                        f'{height:.2f}', ha='center', va='bottom')
-            
-            # Add the figure to the tab
-            canvas = FigureCanvasTkAgg(subfolder_fig, ai_detail_tab)
-            canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-            
-            # Create a tab for detailed flag scores in this AI folder
-            flag_detail_tab = ttk.Frame(notebook)
-            notebook.add(flag_detail_tab, text=f"{ai_folder} - Flag Details")
-            
-            # Create a figure for flag comparison
-            flag_fig = plt.Figure(figsize=(12, 6))
-            flag_ax = flag_fig.add_subplot(111)
-            
-            # Collect all flag scores across subfolders
-            flag_data = {}
-            for subfolder in results["ai_folders"][ai_folder]["subfolders"]:
-                for country, score in results["ai_folders"][ai_folder]["subfolders"][subfolder]["flags"].items():
-                    if country not in flag_data:
-                        flag_data[country] = []
-                    flag_data[country].append((subfolder, score))
-            
-            # Prepare data for grouped bar chart
-            countries = list(flag_data.keys())
-            subfolders = sorted(set(subfolder for country_data in flag_data.values() 
-                                  for subfolder, _ in country_data))
-            
-            # Create a grouped bar chart
-            x = np.arange(len(countries))
-            width = 0.8 / len(subfolders)
-            
-            for i, subfolder in enumerate(subfolders):
-                scores = []
-                for country in countries:
-                    score = next((score for sf, score in flag_data[country] if sf == subfolder), 0)
-                    scores.append(score)
-                
-                offset = width * i - width * (len(subfolders) - 1) / 2
-                bars = flag_ax.bar(x + offset, scores, width, label=subfolder)
-                
-                # Add value labels
-                for j, bar in enumerate(bars):
-                    if scores[j] > 0:  # Only add label if there's a score
-                        height = bar.get_height()
-                        flag_ax.text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                                f'{height:.1f}', ha='center', va='bottom', fontsize=8)
-            
-            flag_ax.set_ylim(0, 10)
-            flag_ax.set_title(f"Flag Scores for {ai_folder}")
-            flag_ax.set_ylabel("Score")
-            flag_ax.set_xticks(x)
-            flag_ax.set_xticklabels(countries)
-            flag_ax.legend(title="Subfolder")
-            
-            # Add the figure to the tab
-            canvas = FigureCanvasTkAgg(flag_fig, flag_detail_tab)
-            canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-
-if __name__ == "__main__":
-    root = tk.Tk()
-    app = FlagRatingApp(root)
+import os
+import json
+import tkinter as tk
+from tkinter import ttk, simpledialog
+from PIL import Image, ImageTk
+import matplotlib.pyplot as plt
+import random
+import argparse
+import getpass
+import threading
+import queue
+from collections import OrderedDict
+import numpy as np  # Required for grouped bar chart
+from rating_journal import RatingJournal, RatingAggregator
+from pairwise import PairwiseRanker
+from corpus_manifest import CorpusManifest
+
+# Mapping of country names to ISO codes
+COUNTRY_TO_ISO = {
+    "Germany": "DE",
+    "Sweden": "SE",
+    "Brazil": "BR",
+    "Nepal": "NP",
+    "Zambia": "ZM",
+    "Australia": "AU",
+    "Bhutan": "BT",
+    "Saudi Arabia": "SA",
+    "Kazakhstan": "KZ",
+    "Tanzania": "TZ"
+}
+
+# Number of upcoming flags to decode in the background
+PREFETCH_AHEAD = 5
+
+class ImagePrefetcher:
+    """Decode and resize images on a background thread into a bounded LRU cache."""
+    def __init__(self, max_size=300, capacity=24):
+        self.max_size = max_size
+        self.capacity = capacity
+        self.cache = OrderedDict()  # path -> resized PIL image, oldest first
+        self.pending = set()
+        self.lock = threading.Lock()
+        self.requests = queue.Queue()
+        
+        # Daemon worker so an open rating session never blocks interpreter exit
+        self.worker = threading.Thread(target=self.run_worker, daemon=True)
+        self.worker.start()
+    
+    def load_image(self, image_path):
+        """Open an image and shrink it to fit max_size, keeping the aspect ratio."""
+        img = Image.open(image_path)
+        img.load()
+        width, height = img.size
+        if width > self.max_size or height > self.max_size:
+            ratio = min(self.max_size/width, self.max_size/height)
+            new_width = int(width * ratio)
+            new_height = int(height * ratio)
+            img = img.resize((new_width, new_height), Image.LANCZOS)
+        return img
+    
+    def store(self, image_path, img):
+        with self.lock:
+            self.cache[image_path] = img
+            self.cache.move_to_end(image_path)
+            while len(self.cache) > self.capacity:
+                self.cache.popitem(last=False)
+    
+    def prefetch(self, image_paths):
+        """Queue images for background decoding, skipping ones already cached or queued."""
+        with self.lock:
+            for image_path in image_paths:
+                if image_path in self.cache or image_path in self.pending:
+                    continue
+                self.pending.add(image_path)
+                self.requests.put(image_path)
+    
+    def get(self, image_path):
+        """Return the resized image, decoding it now if the worker has not reached it yet."""
+        with self.lock:
+            img = self.cache.get(image_path)
+            if img is not None:
+                self.cache.move_to_end(image_path)
+                return img
+        img = self.load_image(image_path)
+        self.store(image_path, img)
+        return img
+    
+    def run_worker(self):
+        while True:
+            image_path = self.requests.get()
+            try:
+                with self.lock:
+                    already_cached = image_path in self.cache
+                if not already_cached:
+                    self.store(image_path, self.load_image(image_path))
+            except Exception:
+                # Leave failures to the synchronous path so the error is shown in the UI
+                pass
+            finally:
+                with self.lock:
+                    self.pending.discard(image_path)
+
+class FlagRatingApp:
+    def __init__(self, root, rater=None):
+        self.root = root
+        self.root.title("Flag Rating Application")
+        self.root.geometry("1000x700")  # Larger window for side-by-side display
+        
+        # Data structures to store paths and ratings
+        self.ai_folders = []
+        self.flag_paths = []
+        self.current_index = 0
+        self.ratings = {}
+        self.aggregator = RatingAggregator()
+        self.actual_flags_dir = "actual-flags"
+        self.prefetcher = ImagePrefetcher()
+        
+        # Find all AI folders and flag images
+        self.find_flag_images()
+        
+        # Resume an interrupted session from its journal, or start a new one
+        self.journal = RatingJournal()
+        self.seed, previous_ratings = self.journal.load()
+        if self.seed is None:
+            self.seed = random.randrange(2**32)
+            self.journal.start_session(self.seed, rater=rater or self.ask_rater())
+        
+        for entry in previous_ratings:
+            key = (entry['ai_folder'], entry['subfolder'], entry['country'])
+            self.ratings[key] = entry['score']
+            self.aggregator.add(key, entry['score'])
+        
+        # Shuffle the flag paths to randomize the order; sorting first makes the seed reproduce it
+        self.flag_paths.sort(key=lambda flag_info: flag_info['path'])
+        random.Random(self.seed).shuffle(self.flag_paths)
+        self.skip_rated_flags()
+        
+        # Create UI elements
+        self.setup_ui()
+        
+        # Start showing flags
+        if not self.flag_paths:
+            self.info_label.config(text="No flag images found!")
+        elif self.current_index < len(self.flag_paths):
+            self.show_current_flag()
+        else:
+            self.finish_rating()
+    
+    def ask_rater(self):
+        """Name for a new session's journal, so people sharing an OS account stay separate raters."""
+        name = simpledialog.askstring("Rater", "Your name (recorded with your ratings):",
+                                      initialvalue=getpass.getuser(), parent=self.root)
+        return (name or "").strip() or getpass.getuser()
+    
+    def find_flag_images(self):
+        # The shared manifest only re-lists folders that changed since the last run
+        manifest = CorpusManifest().refresh()
+        self.ai_folders = manifest.model_folders()
+        
+        for flag_info in manifest.flag_images():
+            # Only include flags that have a corresponding actual flag
+            if flag_info['country'] in COUNTRY_TO_ISO:
+                flag_info['iso_code'] = COUNTRY_TO_ISO[flag_info['country']]
+                self.flag_paths.append(flag_info)
+    
+    def flag_key(self, flag_info):
+        return (flag_info['ai_folder'], flag_info['subfolder'], flag_info['country'])
+    
+    def skip_rated_flags(self):
+        # Move past flags that already have a rating in the journal
+        while (self.current_index < len(self.flag_paths) and
+               self.flag_key(self.flag_paths[self.current_index]) in self.ratings):
+            self.current_index += 1
+    
+    def setup_ui(self):
+        # Main frame
+        main_frame = ttk.Frame(self.root)
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        
+        # Title label
+        title_label = ttk.Label(main_frame, text="Flag Comparison and Rating", font=("Arial", 16, "bold"))
+        title_label.pack(pady=(0, 20))
+        
+        # Frame for displaying flags side by side
+        self.flags_frame = ttk.Frame(main_frame)
+        self.flags_frame.pack(fill=tk.BOTH, expand=True)
+        
+        # Left side - Actual flag
+        self.actual_flag_frame = ttk.LabelFrame(self.flags_frame, text="Actual Flag")
+        self.actual_flag_frame.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
+        
+        self.actual_flag_label = ttk.Label(self.actual_flag_frame)
+        self.actual_flag_label.pack(padx=10, pady=10, expand=True)
+        
+        # Right side - AI-generated flag
+        self.ai_flag_frame = ttk.LabelFrame(self.flags_frame, text="AI-Generated Flag")
+        self.ai_flag_frame.grid(row=0, column=1, padx=10, pady=10, sticky="nsew")
+        
+        self.ai_flag_label = ttk.Label(self.ai_flag_frame)
+        self.ai_flag_label.pack(padx=10, pady=10, expand=True)
+        
+        # Configure grid weights
+        self.flags_frame.columnconfigure(0, weight=1)
+        self.flags_frame.columnconfigure(1, weight=1)
+        self.flags_frame.rowconfigure(0, weight=1)
+        
+        # Info label for country name
+        self.info_label = ttk.Label(main_frame, font=("Arial", 14))
+        self.info_label.pack(pady=10)
+        
+        # Frame for rating buttons
+        rating_frame = ttk.Frame(main_frame)
+        rating_frame.pack(pady=10)
+        
+        rating_label = ttk.Label(rating_frame, text="Rate similarity (1-10):", font=("Arial", 12))
+        rating_label.grid(row=0, column=0, columnspan=10, pady=(0, 10))
+        
+        # Create rating buttons (1-10)
+        for i in range(1, 11):
+            btn = ttk.Button(rating_frame, text=str(i), width=5,
+                            command=lambda score=i: self.rate_flag(score))
+            btn.grid(row=1, column=i-1, padx=5)
+        
+        # Progress label
+        self.progress_label = ttk.Label(main_frame, text="")
+        self.progress_label.pack(pady=10)
+    
+    def show_current_flag(self):
+        if 0 <= self.current_index < len(self.flag_paths):
+            flag_info = self.flag_paths[self.current_index]
+            
+            # Update progress label
+            self.progress_label.config(
+                text=f"Progress: {self.current_index + 1}/{len(self.flag_paths)}"
+            )
+            
+            # Display country name
+            self.info_label.config(
+                text=f"Country: {flag_info['country']}"
+            )
+            
+            # Load and display the actual flag
+            actual_flag_path = self.actual_flag_path(flag_info)
+            if os.path.exists(actual_flag_path):
+                self.load_and_display_image(actual_flag_path, self.actual_flag_label)
+            else:
+                self.actual_flag_label.config(image=None, text=f"Actual flag not found")
+            
+            # Load and display the AI-generated flag
+            self.load_and_display_image(flag_info['path'], self.ai_flag_label)
+            
+            # Decode the next few flags while the rater looks at this one
+            self.prefetch_upcoming()
+    
+    def actual_flag_path(self, flag_info):
+        return os.path.join(self.actual_flags_dir, f"{flag_info['iso_code']}.png")
+    
+    def prefetch_upcoming(self):
+        upcoming = self.flag_paths[self.current_index + 1:self.current_index + 1 + PREFETCH_AHEAD]
+        image_paths = []
+        for flag_info in upcoming:
+            image_paths.append(flag_info['path'])
+            actual_flag_path = self.actual_flag_path(flag_info)
+            if os.path.exists(actual_flag_path):
+                image_paths.append(actual_flag_path)
+        self.prefetcher.prefetch(image_paths)
+    
+    def load_and_display_image(self, image_path, label_widget):
+        try:
+            # Resized image comes from the prefetch cache when available
+            img = self.prefetcher.get(image_path)
+            
+            photo = ImageTk.PhotoImage(img)
+            label_widget.config(image=photo)
+            label_widget.image = photo  # Keep a reference
+        except Exception as e:
+            label_widget.config(image=None, text=f"Error loading image: {e}")
+    
+    def rate_flag(self, score):
+        if 0 <= self.current_index < len(self.flag_paths):
+            flag_info = self.flag_paths[self.current_index]
+            key = self.flag_key(flag_info)
+            
+            # Persist before updating memory so a crash never loses an acknowledged rating
+            self.journal.append(*key, score)
+            self.ratings[key] = score
+            self.aggregator.add(key, score)
+            
+            # Move to the next flag
+            self.current_index += 1
+            self.skip_rated_flags()
+            
+            if self.current_index < len(self.flag_paths):
+                self.show_current_flag()
+            else:
+                self.finish_rating()
+    
+    def finish_rating(self):
+        # Clear the display
+        self.actual_flag_label.config(image=None)
+        self.ai_flag_label.config(image=None)
+        self.info_label.config(text="Rating completed! Generating results...")
+        
+        # Calculate averages and generate JSON
+        results = self.calculate_averages()
+        
+        # Save results to JSON file
+        with open('flag_ratings.json', 'w') as f:
+            json.dump(results, f, indent=4)
+        
+        # The session is complete, so the next run should start a new shuffle
+        self.journal.archive(self.seed)
+        
+        # Show completion message
+        self.info_label.config(text="Ratings saved to flag_ratings.json")
+        
+        # Generate and display charts
+        self.generate_charts(results)
+    
+    def calculate_averages(self):
+        # Totals are folded in as each rating arrives, so this only formats them
+        return self.aggregator.results()
+    
+    def generate_charts(self, results):
+        # Create a new window for charts
+        chart_window = tk.Toplevel(self.root)
+        chart_window.title("Rating Results")
+        chart_window.geometry("1000x700")
+        
+        # Create notebook (tabbed interface)
+        notebook = ttk.Notebook(chart_window)
+        notebook.pack(fill=tk.BOTH, expand=True)
+        
+        # Tabs start empty; each figure is drawn the first time its tab is selected
+        pending_figures = {}
+        
+        def add_tab(text, build_figure):
+            tab = ttk.Frame(notebook)
+            notebook.add(tab, text=text)
+            pending_figures[str(tab)] = (tab, build_figure)
+        
+        def render_selected_tab(event=None):
+            selected = notebook.select()
+            if selected not in pending_figures:
+                return  # Already rendered, the canvas stays cached in the tab
+            tab, build_figure = pending_figures.pop(selected)
+            
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+            canvas = FigureCanvasTkAgg(build_figure(), tab)
+            canvas.draw()
+            canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        
+        # Create tab for AI folder comparison
+        add_tab("AI Models Comparison", lambda: self.build_comparison_figure(results))
+        
+        # Create tabs for each AI folder to show subfolder and flag comparisons
+        for ai_folder in results["ai_folders"]:
+            add_tab(ai_folder, lambda ai_folder=ai_folder: self.build_subfolder_figure(results, ai_folder))
+            add_tab(f"{ai_folder} - Flag Details",
+                    lambda ai_folder=ai_folder: self.build_flag_detail_figure(results, ai_folder))
+        
+        notebook.bind("<<NotebookTabChanged>>", render_selected_tab)
+        render_selected_tab()
+    
+    def build_comparison_figure(self, results):
+        # Create figure for AI comparison
+        ai_fig = plt.Figure(figsize=(10, 6))
+        ai_ax = ai_fig.add_subplot(111)
+        
+        # Extract AI folder averages
+        ai_names = list(results["ai_folders"].keys())
+        ai_scores = [results["ai_folders"][ai]["average"] for ai in ai_names]
+        
+        # Sort by score for better visualization
+        sorted_data = sorted(zip(ai_names, ai_scores), key=lambda x: x[1], reverse=True)
+        sorted_ai_names, sorted_ai_scores = zip(*sorted_data) if sorted_data else ([], [])
+        
+        # Create bar chart
+        bars = ai_ax.bar(sorted_ai_names, sorted_ai_scores)
+        ai_ax.set_ylim(0, 10)
+        ai_ax.set_title("Average Similarity Scores by AI Model")
+        ai_ax.set_ylabel("Average Score")
+        ai_ax.set_xlabel("AI Model")
+        
+        # Add value labels on top of bars
+        for bar in bars:
+            height = bar.get_height()
+            ai_ax.text(bar.get_x() + bar.get_width()/2., height + 0.1,
+                    f'{height:.2f}', ha='center', va='bottom')
+        
+        return ai_fig
+    
+    def build_subfolder_figure(self, results, ai_folder):
+        # Create figure for subfolder comparison
+        subfolder_fig = plt.Figure(figsize=(10, 6))
+        subfolder_ax = subfolder_fig.add_subplot(111)
+        
+        # Extract subfolder averages
+        subfolder_names = list(results["ai_folders"][ai_folder]["subfolders"].keys())
+        subfolder_scores = [results["ai_folders"][ai_folder]["subfolders"][sf]["average"] 
+                          for sf in subfolder_names]
+        
+        # Sort by score
+        sorted_data = sorted(zip(subfolder_names, subfolder_scores), key=lambda x: x[1], reverse=True)
+        sorted_subfolder_names, sorted_subfolder_scores = zip(*sorted_data) if sorted_data else ([], [])
+        
+        # Create bar chart
+        bars = subfolder_ax.bar(sorted_subfolder_names, sorted_subfolder_scores)
+        subfolder_ax.set_ylim(0, 10)
+        subfolder_ax.set_title(f"Average Similarity Scores for {ai_folder} Subfolders")
+        subfolder_ax.set_ylabel("Average Score")
+        subfolder_ax.set_xlabel("Subfolder")
+        
+        # Add value labels on top of bars
+        for bar in bars:
+            height = bar.get_height()
+            subfolder_ax.text(bar.get_x() + bar.get_width()/2., height + 0.1,
+                    f'{height:.2f}', ha='center', va='bottom')
+        
+        return subfolder_fig
+    
+    def build_flag_detail_figure(self, results, ai_folder):
+        # Create a figure for flag comparison
+        flag_fig = plt.Figure(figsize=(12, 6))
+        flag_ax = flag_fig.add_subplot(111)
+        
+        # Collect all flag scores across subfolders
+        flag_data = {}
+        for subfolder in results["ai_folders"][ai_folder]["subfolders"]:
+            for country, score in results["ai_folders"][ai_folder]["subfolders"][subfolder]["flags"].items():
+                if country not in flag_data:
+                    flag_data[country] = []
+                flag_data[country].append((subfolder, score))
+        
+        # Prepare data for grouped bar chart
+        countries = list(flag_data.keys())
+        subfolders = sorted(set(subfolder for country_data in flag_data.values() 
+                              for subfolder, _ in country_data))
+        
+        # Create a grouped bar chart
+        x = np.arange(len(countries))
+        width = 0.8 / len(subfolders)
+        
+        for i, subfolder in enumerate(subfolders):
+            scores = []
+            for country in countries:
+                score = next((score for sf, score in flag_data[country] if sf == subfolder), 0)
+                scores.append(score)
+            
+            offset = width * i - width * (len(subfolders) - 1) / 2
+            bars = flag_ax.bar(x + offset, scores, width, label=subfolder)
+            
+            # Add value labels
+            for j, bar in enumerate(bars):
+                if scores[j] > 0:  # Only add label if there's a score
+                    height = bar.get_height()
+                    flag_ax.text(bar.get_x() + bar.get_width()/2., height + 0.1,
+                            f'{height:.1f}', ha='center', va='bottom', fontsize=8)
+        
+        flag_ax.set_ylim(0, 10)
+        flag_ax.set_title(f"Flag Scores for {ai_folder}")
+        flag_ax.set_ylabel("Score")
+        flag_ax.set_xticks(x)
+        flag_ax.set_xticklabels(countries)
+        flag_ax.legend(title="Subfolder")
+        
+        return flag_fig
+
+class PairwiseRatingApp(FlagRatingApp):
+    """Rank flags from "which is closer to the reference" choices instead of 1-10 scores.
+
+    The next pair is chosen adaptively by a Bradley-Terry model, so a stable model ranking
+    needs far fewer judgments than rating every image.
+    """
+    def __init__(self, root, rater=None):
+        self.root = root
+        self.root.title("Flag Pairwise Comparison")
+        self.root.geometry("1200x700")
+        
+        self.ai_folders = []
+        self.flag_paths = []
+        self.actual_flags_dir = "actual-flags"
+        self.prefetcher = ImagePrefetcher(max_size=260)
+        self.current_pair = None
+        
+        self.find_flag_images()
+        self.flags_by_key = {self.flag_key(flag_info): flag_info for flag_info in self.flag_paths}
+        
+        # Comparisons are journaled the same way as absolute ratings
+        self.journal = RatingJournal("flag_comparisons.journal")
+        self.seed, previous_comparisons = self.journal.load()
+        if self.seed is None:
+            self.seed = random.randrange(2**32)
+            self.journal.start_session(self.seed, rater=rater or self.ask_rater())
+        
+        self.ranker = PairwiseRanker(sorted(self.flags_by_key), seed=self.seed)
+        for entry in previous_comparisons:
+            winner, loser = tuple(entry['winner']), tuple(entry['loser'])
+            if winner in self.flags_by_key and loser in self.flags_by_key:
+                self.ranker.record(winner, loser, refit=False)
+        self.ranker.fit()
+        
+        self.setup_ui()
+        
+        if len(self.flag_paths) < 2:
+            self.info_label.config(text="Not enough flag images found!")
+        else:
+            self.show_next_pair()
+    
+    def setup_ui(self):
+        main_frame = ttk.Frame(self.root)
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        
+        title_label = ttk.Label(main_frame, text="Which flag is closer to the actual flag?", font=("Arial", 16, "bold"))
+        title_label.pack(pady=(0, 20))
+        
+        self.flags_frame = ttk.Frame(main_frame)
+        self.flags_frame.pack(fill=tk.BOTH, expand=True)
+        
+        # Candidate A, actual flag, candidate B
+        self.left_flag_frame = ttk.LabelFrame(self.flags_frame, text="Flag A")
+        self.left_flag_frame.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
+        self.left_flag_label = ttk.Label(self.left_flag_frame)
+        self.left_flag_label.pack(padx=10, pady=10, expand=True)
+        
+        self.actual_flag_frame = ttk.LabelFrame(self.flags_frame, text="Actual Flag")
+        self.actual_flag_frame.grid(row=0, column=1, padx=10, pady=10, sticky="nsew")
+        self.actual_flag_label = ttk.Label(self.actual_flag_frame)
+        self.actual_flag_label.pack(padx=10, pady=10, expand=True)
+        
+        self.right_flag_frame = ttk.LabelFrame(self.flags_frame, text="Flag B")
+        self.right_flag_frame.grid(row=0, column=2, padx=10, pady=10, sticky="nsew")
+        self.right_flag_label = ttk.Label(self.right_flag_frame)
+        self.right_flag_label.pack(padx=10, pady=10, expand=True)
+        
+        for column in range(3):
+            self.flags_frame.columnconfigure(column, weight=1)
+        self.flags_frame.rowconfigure(0, weight=1)
+        
+        self.info_label = ttk.Label(main_frame, font=("Arial", 14))
+        self.info_label.pack(pady=10)
+        
+        choice_frame = ttk.Frame(main_frame)
+        choice_frame.pack(pady=10)
+        ttk.Button(choice_frame, text="A is closer", width=15,
+                   command=lambda: self.choose(0)).grid(row=0, column=0, padx=10)
+        ttk.Button(choice_frame, text="B is closer", width=15,
+                   command=lambda: self.choose(1)).grid(row=0, column=1, padx=10)
+        ttk.Button(choice_frame, text="Finish", width=15,
+                   command=self.finish_rating).grid(row=0, column=2, padx=10)
+        
+        self.progress_label = ttk.Label(main_frame, text="")
+        self.progress_label.pack(pady=10)
+    
+    def show_next_pair(self):
+        if self.ranker.is_stable():
+            self.finish_rating()
+            return
+        
+        self.current_pair = self.ranker.next_pair()
+        if self.current_pair is None:
+            # No country has flags from two models, so there is nothing to compare
+            self.finish_rating()
+            return
+        left_info, right_info = (self.flags_by_key[key] for key in self.current_pair)
+        
+        self.progress_label.config(
+            text=f"Comparisons: {self.ranker.judgments} of at most {self.ranker.max_judgments} "
+                 f"(rating every flag would take {len(self.flag_paths)})"
+        )
+        self.info_label.config(text=f"Country: {left_info['country']}")
+        
+        actual_flag_path = self.actual_flag_path(left_info)
+        if os.path.exists(actual_flag_path):
+            self.load_and_display_image(actual_flag_path, self.actual_flag_label)
+        else:
+            self.actual_flag_label.config(image=None, text=f"Actual flag not found")
+        self.load_and_display_image(left_info['path'], self.left_flag_label)
+        self.load_and_display_image(right_info['path'], self.right_flag_label)
+    
+    def choose(self, index):
+        if self.current_pair is None:
+            return
+        winner = self.current_pair[index]
+        loser = self.current_pair[1 - index]
+        
+        self.journal.append_comparison(winner, loser)
+        self.ranker.record(winner, loser)
+        self.show_next_pair()
+    
+    def finish_rating(self):
+        self.current_pair = None
+        for label in (self.left_flag_label, self.actual_flag_label, self.right_flag_label):
+            label.config(image=None)
+        
+        results = self.ranker.results()
+        with open('flag_pairwise_ranking.json', 'w') as f:
+            json.dump(results, f, indent=4)
+        self.journal.archive(self.seed)
+        
+        ranking = ", ".join(results["models"])
+        text = f"Ranking after {results['judgments']} comparisons: {ranking}\nSaved to flag_pairwise_ranking.json"
+        if results["unresolved"]:
+            close = "; ".join(f"{a} / {b}" for a, b in results["unresolved"])
+            text += f"\nToo close to call: {close}"
+        self.info_label.config(text=text)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rate AI-generated flags against the originals.")
+    parser.add_argument("--pairwise", action="store_true", help="Rank flags from pairwise choices instead of scores")
+    parser.add_argument("--rater", help="Your name, recorded with a new session (asked for when not given)")
+    args = parser.parse_args()
+
+    root = tk.Tk()
+    if args.pairwise:
+        app = PairwiseRatingApp(root, args.rater)
+    else:
+        app = FlagRatingApp(root, args.rater)
     root.mainloop()
\ No newline at end of file
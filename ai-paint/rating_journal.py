@@ -0,0 +1,160 @@
+import os
+import json
+
+
+class RatingJournal:
+    """Append-only JSON-lines log of a rating session, fsynced after every write."""
+    def __init__(self, path="flag_ratings.journal"):
+        self.path = path
+        self.file = None
+
+    def read_records(self, offset=0):
+        """Return the complete records after a byte offset and the offset just past them."""
+        records = []
+        if not os.path.exists(self.path):
+            return records, offset
+
+        with open(self.path, 'rb') as f:
+            f.seek(offset)
+            for line in f:
+                # Stop at a line still being written (or torn by a crash)
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break
+                records.append(record)
+                offset += len(line)
+
+        return records, offset
+
+    def load(self):
+        """Read an existing journal and return (seed, ratings or comparisons in the order given)."""
+        seed = None
+        entries = []
+        records, valid_length = self.read_records()
+
+        for record in records:
+            if record.get("type") == "session":
+                seed = record["seed"]
+            elif record.get("type") in ("rating", "comparison"):
+                entries.append(record)
+
+        # A crash mid-write can leave a partial last line; drop it so new appends stay parseable
+        if os.path.exists(self.path) and valid_length < os.path.getsize(self.path):
+            with open(self.path, 'r+b') as f:
+                f.truncate(valid_length)
+
+        return seed, entries
+
+    def open(self):
+        if self.file is None:
+            self.file = open(self.path, 'a')
+
+    def write(self, record):
+        self.open()
+        self.file.write(json.dumps(record) + "\n")
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def start_session(self, seed, rater=None):
+        """Record the shuffle seed so a restarted session sees the same flag order."""
+        self.write({"type": "session", "seed": seed, "rater": rater})
+
+    def append(self, ai_folder, subfolder, country, score):
+        self.write({
+            "type": "rating",
+            "ai_folder": ai_folder,
+            "subfolder": subfolder,
+            "country": country,
+            "score": score
+        })
+
+    def append_comparison(self, winner, loser):
+        """Record a pairwise judgment; winner and loser are (ai_folder, subfolder, country) keys."""
+        self.write({
+            "type": "comparison",
+            "winner": list(winner),
+            "loser": list(loser)
+        })
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def archive(self, seed):
+        """Move a finished journal aside so the next run starts a fresh session."""
+        self.close()
+        if not os.path.exists(self.path):
+            return None
+
+        base, ext = os.path.splitext(self.path)
+        archived_path = f"{base}-{seed}{ext}"
+        os.replace(self.path, archived_path)
+        return archived_path
+
+
+class RatingAggregator:
+    """Running per-folder and per-subfolder totals, updated one rating at a time."""
+    def __init__(self):
+        self.scores = {}  # (ai_folder, subfolder, country) -> score
+        self.ai_totals = {}  # ai_folder -> [total, count]
+        self.subfolder_totals = {}  # (ai_folder, subfolder) -> [total, count]
+        self.total_score = 0
+        self.total_count = 0
+
+    def add(self, key, score):
+        """Fold one rating in; rating the same flag again replaces the earlier score."""
+        ai_folder, subfolder, country = key
+        ai_total = self.ai_totals.setdefault(ai_folder, [0, 0])
+        subfolder_total = self.subfolder_totals.setdefault((ai_folder, subfolder), [0, 0])
+
+        previous = self.scores.get(key)
+        if previous is not None:
+            ai_total[0] -= previous
+            subfolder_total[0] -= previous
+            self.total_score -= previous
+        else:
+            ai_total[1] += 1
+            subfolder_total[1] += 1
+            self.total_count += 1
+
+        self.scores[key] = score
+        ai_total[0] += score
+        subfolder_total[0] += score
+        self.total_score += score
+
+    def results(self):
+        """Build the flag_ratings.json structure from the running totals."""
+        results = {
+            "overall_average": 0,
+            "ai_folders": {}
+        }
+
+        for (ai_folder, subfolder, country), score in self.scores.items():
+            ai_data = results["ai_folders"].setdefault(ai_folder, {
+                "average": 0,
+                "subfolders": {}
+            })
+            subfolder_data = ai_data["subfolders"].setdefault(subfolder, {
+                "average": 0,
+                "flags": {}
+            })
+            subfolder_data["flags"][country] = score
+
+        for ai_folder, ai_data in results["ai_folders"].items():
+            total, count = self.ai_totals[ai_folder]
+            if count > 0:
+                ai_data["average"] = round(total / count, 2)
+
+            for subfolder, subfolder_data in ai_data["subfolders"].items():
+                total, count = self.subfolder_totals[(ai_folder, subfolder)]
+                if count > 0:
+                    subfolder_data["average"] = round(total / count, 2)
+
+        if self.total_count > 0:
+            results["overall_average"] = round(self.total_score / self.total_count, 2)
+
+        return results
@@ -0,0 +1,199 @@
+import ssl
+import json
+import random
+import asyncio
+from urllib.parse import urlsplit
+
+# Statuses worth retrying: timeouts, rate limits and server-side failures
+RETRY_STATUSES = {408, 409, 429, 500, 502, 503, 504}
+
+
+class LLMError(Exception):
+    """A request that failed for good, after any retries."""
+
+
+class HTTPConnectionPool:
+    """Keep-alive HTTP/1.1 connections to one host, reused across requests.
+
+    Idle connections are handed out most recently used first, since those are the least
+    likely to have been closed by the server; at most `max_idle` are kept open.
+    """
+    def __init__(self, host, port, use_ssl=False, max_idle=16):
+        self.host = host
+        self.port = port
+        self.ssl_context = ssl.create_default_context() if use_ssl else None
+        self.max_idle = max_idle
+        self.idle = []
+        self.opened = 0  # connections opened so far, to see how well they are reused
+
+    async def acquire(self):
+        """(reader, writer, reused) for a connection to the host."""
+        while self.idle:
+            reader, writer = self.idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                return reader, writer, True
+            writer.close()
+        reader, writer = await asyncio.open_connection(self.host, self.port, ssl=self.ssl_context)
+        self.opened += 1
+        return reader, writer, False
+
+    def release(self, reader, writer, reusable):
+        if reusable and len(self.idle) < self.max_idle and not writer.is_closing():
+            self.idle.append((reader, writer))
+        else:
+            writer.close()
+
+    async def request(self, method, path, body=b"", headers=None):
+        """Send one request and return (status, headers, body)."""
+        for attempt in range(2):
+            reader, writer, reused = await self.acquire()
+            try:
+                status, response_headers, data, reusable = await self.exchange(
+                    reader, writer, method, path, body, headers or {})
+            except (ConnectionError, EOFError):
+                writer.close()
+                # An idle connection the server has since closed; try once more on a new one
+                if reused and attempt == 0:
+                    continue
+                raise
+            except BaseException:
+                # Includes cancellation by a timeout: the connection is mid-response, so drop it
+                writer.close()
+                raise
+            self.release(reader, writer, reusable)
+            return status, response_headers, data
+
+    async def exchange(self, reader, writer, method, path, body, headers):
+        lines = [f"{method} {path} HTTP/1.1", f"Host: {self.host}", f"Content-Length: {len(body)}",
+                 "Connection: keep-alive"]
+        lines += [f"{name}: {value}" for name, value in headers.items()]
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+        await writer.drain()
+
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionResetError("connection closed by server")
+        status = int(status_line.split(None, 2)[1])
+
+        response_headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            response_headers[name.strip().lower()] = value.strip()
+
+        reusable = response_headers.get("connection", "").lower() != "close"
+        if response_headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b";")[0], 16)
+                if size == 0:
+                    # Skip any trailers up to the blank line
+                    while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                        pass
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            data = b"".join(chunks)
+        elif "content-length" in response_headers:
+            data = await reader.readexactly(int(response_headers["content-length"]))
+        else:
+            # Body runs to the end of the connection
+            data = await reader.read()
+            reusable = False
+        return status, response_headers, data, reusable
+
+    async def close(self):
+        idle, self.idle = self.idle, []
+        for reader, writer in idle:
+            writer.close()
+        for reader, writer in idle:
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+
+
+class LLMClient:
+    """Chat completions from an OpenAI-compatible endpoint over pooled HTTP connections.
+
+    At most `concurrency` requests are in flight at once. Rate limits, server errors,
+    timeouts and dropped connections are retried with exponential backoff and jitter,
+    honouring Retry-After when the server sends it.
+    """
+    def __init__(self, base_url, api_key=None, concurrency=8, retries=4, timeout=120.0, backoff=1.0):
+        parts = urlsplit(base_url)
+        use_ssl = parts.scheme == "https"
+        self.path = parts.path.rstrip("/") + "/chat/completions"
+        self.pool = HTTPConnectionPool(parts.hostname, parts.port or (443 if use_ssl else 80), use_ssl,
+                                       max_idle=concurrency)
+        self.api_key = api_key
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.retries = retries
+        self.timeout = timeout
+        self.backoff = backoff
+
+        # Totals for the run summary
+        self.requests = 0
+        self.retried = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+
+    async def chat(self, model, prompt, **params):
+        """Text of the reply to a single user message."""
+        payload = {"model": model, "messages": [{"role": "user", "content": prompt}], **params}
+        body = json.dumps(payload).encode("utf-8")
+        headers = {"Content-Type": "application/json"}
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+
+        for attempt in range(self.retries + 1):
+            retry_after = None
+            async with self.semaphore:
+                self.requests += 1
+                try:
+                    status, response_headers, data = await asyncio.wait_for(
+                        self.pool.request("POST", self.path, body, headers), self.timeout)
+                    if status == 200:
+                        return self.reply_text(model, data)
+                except (OSError, EOFError, ValueError, asyncio.TimeoutError) as e:
+                    error = f"{type(e).__name__}: {e}"
+                else:
+                    error = f"HTTP {status}: {data[:200].decode('utf-8', errors='replace')}"
+                    if status not in RETRY_STATUSES:
+                        raise LLMError(f"{model}: {error}")
+                    retry_after = response_headers.get("retry-after")
+
+            if attempt == self.retries:
+                break
+            self.retried += 1
+            # Wait outside the semaphore so other requests can use the slot meanwhile
+            delay = self.backoff * 2 ** attempt * (0.5 + random.random() / 2)
+            if retry_after is not None and retry_after.replace(".", "", 1).isdigit():
+                delay = float(retry_after)
+            await asyncio.sleep(delay)
+
+        raise LLMError(f"{model}: giving up after {self.retries + 1} attempts ({error})")
+
+    def reply_text(self, model, data):
+        """Message text of a 200 response; a body without one is an LLMError, not retried."""
+        try:
+            reply = json.loads(data)
+            text = reply["choices"][0]["message"]["content"]
+        except (ValueError, KeyError, IndexError, TypeError) as e:
+            raise LLMError(f"{model}: malformed response ({type(e).__name__}: {e}): "
+                           f"{data[:200].decode('utf-8', errors='replace')}")
+        if not isinstance(text, str):
+            raise LLMError(f"{model}: response has no message text ({reply['choices'][0].get('finish_reason')})")
+        usage = reply.get("usage")
+        if isinstance(usage, dict):
+            self.count_usage(usage)
+        return text
+
+    def count_usage(self, usage):
+        self.prompt_tokens += usage.get("prompt_tokens", 0)
+        self.completion_tokens += usage.get("completion_tokens", 0)
+
+    async def close(self):
+        await self.pool.close()
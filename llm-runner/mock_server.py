@@ -0,0 +1,150 @@
+import json
+import time
+import random
+import asyncio
+import hashlib
+import argparse
+
+# Paint grid: columns A-Z then a-x, rows 1-30
+PAINT_COLUMNS = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwx"
+PAINT_ROWS = 30
+COLORS = ["#FFFFFF", "#000000", "#DC143C", "#0000FF", "#008000", "#FFD700", "#FF8C00", "#00843D"]
+DIRECTIONS = ("up", "down", "left", "right")
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 503: "Service Unavailable"}
+
+
+def synthetic_reply(model, prompt):
+    """Deterministic stand-in reply: the same model and prompt always get the same text."""
+    digest = hashlib.sha256(f"{model}\n{prompt}".encode("utf-8")).digest()
+    rng = random.Random(digest)
+    if "move" in prompt.lower():
+        lines = [f"move {rng.choice(DIRECTIONS)} {rng.randint(1, 6)}" for _ in range(rng.randint(4, 16))]
+    else:
+        lines = [f"bg:{rng.choice(COLORS)}"]
+        for _ in range(rng.randint(2, 8)):
+            left, right = sorted(rng.sample(range(len(PAINT_COLUMNS)), 2))
+            top, bottom = sorted(rng.sample(range(1, PAINT_ROWS + 1), 2))
+            lines.append(f"{PAINT_COLUMNS[left]}{top}-{PAINT_COLUMNS[right]}{bottom}:{rng.choice(COLORS)}")
+    return "\n".join(lines)
+
+
+class MockModelServer:
+    """Local stand-in for an OpenAI-compatible chat completions endpoint.
+
+    Replies come from `canned` (a dict of prompt substring -> reply text, first match wins)
+    or are made up from a hash of the model and prompt. Each request waits about `latency`
+    seconds and fails with 503 with probability `error_rate`, so retries and throughput
+    can be tried out without any network.
+    """
+    def __init__(self, canned=None, latency=0.0, error_rate=0.0, seed=None):
+        self.canned = canned or {}
+        self.latency = latency
+        self.error_rate = error_rate
+        self.rng = random.Random(seed)
+        self.requests = 0
+        self.connections = 0
+
+    def reply_text(self, model, prompt):
+        for key, text in self.canned.items():
+            if key in prompt:
+                return text
+        return synthetic_reply(model, prompt)
+
+    async def handle_connection(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, path, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+
+                status, payload = await self.respond(method, path, body)
+                data = json.dumps(payload).encode("utf-8")
+                keep_alive = headers.get("connection", "").lower() != "close"
+                writer.write((f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+                              f"Content-Type: application/json\r\nContent-Length: {len(data)}\r\n"
+                              f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n").encode("latin-1") + data)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def respond(self, method, path, body):
+        """(status, JSON payload) for one request."""
+        self.requests += 1
+        if method != "POST" or not path.rstrip("/").endswith("/chat/completions"):
+            return 404, {"error": {"message": f"No route for {method} {path}"}}
+        try:
+            request = json.loads(body)
+            model = request["model"]
+            prompt = "\n".join(message["content"] for message in request["messages"])
+        except (ValueError, KeyError, TypeError) as e:
+            return 400, {"error": {"message": f"Malformed request: {e}"}}
+
+        if self.latency:
+            await asyncio.sleep(self.latency * (0.5 + self.rng.random()))
+        if self.rng.random() < self.error_rate:
+            return 503, {"error": {"message": "Simulated overload"}}
+
+        text = self.reply_text(model, prompt)
+        return 200, {
+            "id": f"mock-{self.requests}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": text}, "finish_reason": "stop"}],
+            # Rough counts, about four characters per token
+            "usage": {"prompt_tokens": len(prompt) // 4, "completion_tokens": len(text) // 4,
+                      "total_tokens": (len(prompt) + len(text)) // 4},
+        }
+
+    async def start(self, host="127.0.0.1", port=8000):
+        return await asyncio.start_server(self.handle_connection, host, port)
+
+
+def load_canned(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        canned = json.load(f)
+    # A list reply is taken as lines of commands
+    return {key: "\n".join(value) if isinstance(value, list) else value for key, value in canned.items()}
+
+
+async def serve(args):
+    canned = load_canned(args.canned) if args.canned else None
+    server = MockModelServer(canned, args.latency, args.error_rate, args.seed)
+    listener = await server.start(args.host, args.port)
+    print(f"Mock model server on http://{args.host}:{args.port}/v1 (Ctrl+C to stop)")
+    async with listener:
+        await listener.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for an OpenAI-compatible model endpoint.")
+    parser.add_argument("--host", default="127.0.0.1", help="Address to listen on")
+    parser.add_argument("--port", type=int, default=8000, help="Port to listen on")
+    parser.add_argument("--latency", type=float, default=0.0, help="Mean seconds to wait before each reply")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 503")
+    parser.add_argument("--canned", help="JSON file mapping prompt substrings to reply text or command lists")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for latency and error draws")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+import os
+import json
+import time
+import asyncio
+import hashlib
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".response-cache")
+DEFAULT_MAX_BYTES = 256 << 20
+
+
+def cache_key(model, prompt, params, sample=0):
+    """Hex digest naming a response; params are sorted so their order does not matter."""
+    text = json.dumps({"model": model, "prompt": prompt, "params": params, "sample": sample},
+                      sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """Model replies on disk, one JSON file per reply named by its cache_key.
+
+    Files are spread over subdirectories by the first two hex digits. Each hit touches
+    the file's mtime, and once the files add up to more than `max_bytes` the least
+    recently used ones are deleted.
+    """
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.entries = {}  # key -> (size, last use)
+        self.total_bytes = 0
+        self.scan()
+
+    def scan(self):
+        if not os.path.isdir(self.cache_dir):
+            return
+        for bucket in os.scandir(self.cache_dir):
+            if not bucket.is_dir():
+                continue
+            for entry in os.scandir(bucket.path):
+                if entry.name.endswith(".json"):
+                    stat = entry.stat()
+                    self.entries[entry.name[:-5]] = (stat.st_size, stat.st_mtime)
+                    self.total_bytes += stat.st_size
+
+    def path_for(self, key):
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def get(self, key):
+        """Cached reply text, or None."""
+        if key not in self.entries:
+            return None
+        path = self.path_for(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                reply = json.load(f)["reply"]
+            now = time.time()
+            os.utime(path, (now, now))
+        except (OSError, ValueError, KeyError):
+            self.forget(key)
+            return None
+        self.entries[key] = (self.entries[key][0], now)
+        return reply
+
+    def put(self, key, model, prompt, params, sample, reply):
+        # The request is stored with the reply so entries can be inspected and checked
+        data = json.dumps({"model": model, "prompt": prompt, "params": params, "sample": sample,
+                           "reply": reply}, ensure_ascii=False).encode("utf-8")
+        path = self.path_for(key)
+        # Per-process temp name, since parallel runs may write the same reply at once
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+            # Rename into place so a reader never sees a half-written file
+            os.replace(temp_path, path)
+        except OSError as e:
+            print(f"Could not write response cache file {path}: {e}")
+            return
+
+        self.total_bytes -= self.entries.get(key, (0, 0))[0]
+        self.entries[key] = (len(data), time.time())
+        self.total_bytes += len(data)
+        self.evict()
+
+    def forget(self, key):
+        size, _ = self.entries.pop(key, (0, 0))
+        self.total_bytes -= size
+        try:
+            os.remove(self.path_for(key))
+        except OSError:
+            pass
+
+    def evict(self):
+        """Delete least recently used replies until the cache fits in max_bytes."""
+        if self.total_bytes <= self.max_bytes:
+            return
+        for key in sorted(self.entries, key=lambda key: self.entries[key][1]):
+            if self.total_bytes <= self.max_bytes:
+                break
+            self.forget(key)
+
+
+class CachedClient:
+    """LLMClient front that answers from a ResponseCache and shares identical requests.
+
+    A request whose key is already in flight waits for that call instead of sending its
+    own, so duplicates within one batch cost a single call. `sample` tells deliberate
+    repeats apart (the run folder of a flag, the sample number of a maze attempt) and is
+    not sent to the model.
+    With no cache, identical requests are still shared but nothing is kept.
+    """
+    def __init__(self, client, cache):
+        self.client = client
+        self.cache = cache
+        self.in_flight = {}  # key -> task of the call being made
+        self.hits = 0
+        self.shared = 0
+        self.misses = 0
+
+    async def chat(self, model, prompt, sample=0, **params):
+        key = cache_key(model, prompt, params, sample)
+        reply = self.cache.get(key) if self.cache is not None else None
+        if reply is not None:
+            self.hits += 1
+            return reply
+
+        task = self.in_flight.get(key)
+        if task is not None:
+            self.shared += 1
+        else:
+            self.misses += 1
+            task = asyncio.ensure_future(self.fetch(key, model, prompt, sample, params))
+            self.in_flight[key] = task
+        # Shielded so one waiter being cancelled does not cancel the call for the others
+        return await asyncio.shield(task)
+
+    async def fetch(self, key, model, prompt, sample, params):
+        try:
+            reply = await self.client.chat(model, prompt, **params)
+            if self.cache is not None:
+                self.cache.put(key, model, prompt, params, sample, reply)
+            return reply
+        finally:
+            del self.in_flight[key]
@@ -0,0 +1,205 @@
+import os
+import re
+import sys
+import json
+import time
+import asyncio
+import argparse
+from llm_client import LLMClient, LLMError
+from response_cache import DEFAULT_CACHE_DIR, DEFAULT_MAX_BYTES, CachedClient, ResponseCache
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# The maze prompts come from the maze application's own generator and text formats
+sys.path.insert(0, os.path.join(ROOT, "maze"))
+from maze_generator import ALGORITHMS, DEFAULT_ALGORITHM, generate_maze  # noqa: E402
+from maze_prompt import FORMATS, maze_footer, serialize  # noqa: E402
+
+DEFAULT_BASE_URL = os.environ.get("OPENAI_BASE_URL", "http://127.0.0.1:8000/v1")
+
+# The flags of the original experiments, as in rate-flags.py
+FLAGS = ["Germany", "Sweden", "Brazil", "Nepal", "Zambia", "Australia", "Bhutan", "Saudi Arabia",
+         "Kazakhstan", "Tanzania"]
+
+PAINT_PROMPT = """You are painting on a grid of 50 columns by 30 rows. Columns are labelled A to Z and then a to x \
+(A is the leftmost, x the rightmost); rows are numbered 1 (top) to 30 (bottom), so cells are written like A1, Q15 or x30.
+
+Paint with these commands, one per line:
+bg:<color> fills the whole grid
+<cell>-<cell>:<color> fills the rectangle between two corner cells, e.g. A1-x10:#FF0000
+<cell>,<cell>,...:<color> fills single cells, e.g. H8,I9:#FFFFFF
+Colors are hex codes like #DC143C or color names. Later commands paint over earlier ones.
+
+Draw the flag of {title}. Reply with the commands only, one per line."""
+
+MAZE_PROMPT = """{maze}
+You are at {player} and need to reach {goal}. Move with commands of the form `move <up|down|left|right> <steps>`; \
+you cannot move through walls. Reply with the commands only, one per line."""
+
+# Player and goal as each maze format shows them
+MARKERS = {"emoji": ("the red square 🟥", "the green square 🟩")}
+DEFAULT_MARKERS = ("P", "G")
+
+PAINT_COMMAND = re.compile(r"^(bg:.+|[A-Za-z]\d{1,2}(\s*[-,]\s*[A-Za-z]\d{1,2})*\s*:.+)$")
+MAZE_COMMAND = re.compile(r"\bmove\s+(up|down|left|right)(\s+\d+)?\b", re.IGNORECASE)
+# List bullets, numbering and code quotes around a command
+LINE_DECORATION = re.compile(r"^\s*(?:[-*•]|\d+[.)])?\s*`*|`*\s*$")
+
+
+def paint_commands(text):
+    """Paint commands from a reply, skipping prose, code fences and list markup."""
+    commands = []
+    for line in text.splitlines():
+        line = LINE_DECORATION.sub("", line)
+        if PAINT_COMMAND.match(line):
+            commands.append(line)
+    return commands
+
+
+def maze_commands(text):
+    """Move commands from a reply, in order, also when several share a line."""
+    return [" ".join(match.group(0).lower().split()) for match in MAZE_COMMAND.finditer(text)]
+
+
+def model_folder(model):
+    # Model names like "org/model" become a single folder name
+    return re.sub(r"[^\w.-]+", "-", model)
+
+
+def next_run_dirs(model_dir, count):
+    """The next `count` free run folders, numbered flags, flags2, flags3, ... as in the
+    existing model folders."""
+    paths = []
+    number = 1
+    while len(paths) < count:
+        path = os.path.join(model_dir, "flags" if number == 1 else f"flags{number}")
+        if not os.path.exists(path):
+            paths.append(path)
+        number += 1
+    return paths
+
+
+async def ask(client, model, prompt, params, sample=0):
+    """Reply text, or None with the error printed, so one failure does not stop a batch."""
+    try:
+        return await client.chat(model, prompt, sample=sample, **params)
+    except LLMError as e:
+        print(f"Failed: {e}")
+        return None
+
+
+async def run_paint(client, models, flags, runs, output_dir, params):
+    # Replies are cached per run folder, so a new folder always gets fresh replies rather
+    # than copies of an earlier run
+    run_dirs = {model: next_run_dirs(os.path.join(output_dir, model_folder(model)), runs) for model in models}
+    jobs = [(model, run_dir, title) for model in models for run_dir in run_dirs[model] for title in flags]
+    replies = await asyncio.gather(*(ask(client, model, PAINT_PROMPT.format(title=title), params,
+                                         os.path.basename(run_dir))
+                                     for model, run_dir, title in jobs))
+
+    results = {}
+    for (model, run_dir, title), reply in zip(jobs, replies):
+        if reply is not None:
+            results.setdefault(run_dir, []).append({"title": title, "commands": paint_commands(reply)})
+
+    written = []
+    for run_dir, entries in results.items():
+        os.makedirs(run_dir)
+        path = os.path.join(run_dir, "cmd.json")
+        with open(path, 'w') as f:
+            json.dump({"flags": entries}, f, indent=4)
+        written.append(path)
+    return written
+
+
+async def run_maze(client, models, seed, width, height, algorithm, prompt_format, samples, output, params):
+    maze = generate_maze(width, height, seed, algorithm)
+    player, goal = MARKERS.get(prompt_format, DEFAULT_MARKERS)
+    prompt = MAZE_PROMPT.format(maze=serialize(maze, prompt_format, player=(1, 1)) + maze_footer(seed, width, height, algorithm),
+                                player=player, goal=goal)
+
+    jobs = [(model, sample) for model in models for sample in range(samples)]
+    replies = await asyncio.gather(*(ask(client, model, prompt, params, sample) for model, sample in jobs))
+
+    attempts = []
+    for (model, sample), reply in zip(jobs, replies):
+        if reply is not None:
+            name = model if samples == 1 else f"{model}-{sample + 1}"
+            attempts.append({"name": name, "commands": maze_commands(reply)})
+    if not attempts:
+        return []
+
+    maze_info = {"seed": seed, "size": width} if width == height else {"seed": seed, "width": width, "height": height}
+    maze_info["algorithm"] = algorithm
+    with open(output, 'w') as f:
+        json.dump({"maze_info": maze_info, "attempts": attempts}, f, indent=4)
+    return [output]
+
+
+async def run(args):
+    params = {}
+    if args.temperature is not None:
+        params["temperature"] = args.temperature
+    if args.max_tokens is not None:
+        params["max_tokens"] = args.max_tokens
+
+    client = LLMClient(args.base_url, args.api_key, args.concurrency, args.retries, args.timeout)
+    cache = None if args.no_cache else ResponseCache(args.cache_dir, int(args.cache_size * (1 << 20)))
+    cached_client = CachedClient(client, cache)
+    start = time.perf_counter()
+    try:
+        if args.command == "paint":
+            written = await run_paint(cached_client, args.models, args.flags, args.runs, args.output_dir, params)
+        else:
+            height = args.height or args.size
+            output = args.output or f"solution_{args.seed}.json"
+            written = await run_maze(cached_client, args.models, args.seed, args.size, height, args.algorithm,
+                                     args.format, args.samples, output, params)
+    finally:
+        await client.close()
+    elapsed = time.perf_counter() - start
+
+    for path in written:
+        print(f"Wrote {path}")
+    print(f"{client.requests} requests ({client.retried} retried) over {client.pool.opened} connections in "
+          f"{elapsed:.2f}s, {client.requests / elapsed:.1f} requests/s, "
+          f"{client.prompt_tokens} prompt + {client.completion_tokens} completion tokens")
+    print(f"Responses: {cached_client.hits} from the cache, {cached_client.shared} shared with an identical "
+          f"request, {cached_client.misses} asked")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Send paint and maze prompts to an OpenAI-compatible endpoint in parallel.")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL, help="API base URL (default: $OPENAI_BASE_URL or the local mock server)")
+    parser.add_argument("--api-key", default=os.environ.get("OPENAI_API_KEY"), help="API key (default: $OPENAI_API_KEY)")
+    parser.add_argument("--concurrency", type=int, default=8, help="Requests in flight at once")
+    parser.add_argument("--retries", type=int, default=4, help="Retries per request on rate limits and server errors")
+    parser.add_argument("--timeout", type=float, default=120.0, help="Seconds to wait for each response")
+    parser.add_argument("--temperature", type=float, default=None, help="Sampling temperature to request")
+    parser.add_argument("--max-tokens", type=int, default=None, help="Reply length limit to request")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR, help="Where model replies are cached")
+    parser.add_argument("--cache-size", type=float, default=DEFAULT_MAX_BYTES / (1 << 20), help="Cache size limit in MB")
+    parser.add_argument("--no-cache", action="store_true", help="Always ask the model, and keep no replies")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    paint_parser = subparsers.add_parser("paint", help="Ask for flags and write <model>/flagsN/cmd.json")
+    paint_parser.add_argument("--models", nargs="+", required=True, help="Model names")
+    paint_parser.add_argument("--flags", nargs="+", default=FLAGS, help="Countries to draw (default: the original ten)")
+    paint_parser.add_argument("--runs", type=int, default=1, help="Separate flags folders to fill per model")
+    paint_parser.add_argument("--output-dir", default=os.path.join(ROOT, "ai-paint"), help="Where the model folders are")
+
+    maze_parser = subparsers.add_parser("maze", help="Ask for maze solutions and write a solution file")
+    maze_parser.add_argument("--models", nargs="+", required=True, help="Model names")
+    maze_parser.add_argument("--seed", type=int, required=True, help="Maze seed")
+    maze_parser.add_argument("--size", type=int, default=11, help="Maze width")
+    maze_parser.add_argument("--height", type=int, default=None, help="Maze height (default: same as size)")
+    maze_parser.add_argument("--algorithm", default=DEFAULT_ALGORITHM, choices=sorted(ALGORITHMS), help="Generation algorithm")
+    maze_parser.add_argument("--format", default="emoji", choices=sorted(FORMATS), help="Maze text format in the prompt")
+    maze_parser.add_argument("--samples", type=int, default=1, help="Attempts to request per model")
+    maze_parser.add_argument("-o", "--output", default=None, help="Solution file (default: solution_<seed>.json)")
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,543 +1,738 @@
-import tkinter as tk
-from tkinter import filedialog, messagebox, scrolledtext
-import json
-import random
-import os
-from PIL import Image, ImageTk
-import io
-
-class MazeApp:
-    def __init__(self, root):
-        self.root = root
-        self.root.title("Maze Solver")
-        self.root.geometry("1000x600")
-        
-        # Maze properties
-        self.maze_size = 15  # Default size
-        self.cell_size = 30
-        self.player_pos = [1, 1]  # Start position
-        self.current_seed = random.randint(1, 1000000)  # Random seed for maze generation
-        self.maze = self.generate_maze(self.maze_size, self.maze_size, self.current_seed)
-        self.goal_pos = [self.maze_size - 2, self.maze_size - 2]  # Goal position
-        
-        # Path tracking
-        self.path_visited = set([(1, 1)])  # Track visited cells
-        self.move_count = 0  # Track number of moves
-        
-        # Command history
-        self.command_history = []
-        self.current_attempt_name = "Player"
-        
-        # Create UI
-        self.create_ui()
-        
-    def create_ui(self):
-        # Main frame
-        main_frame = tk.Frame(self.root)
-        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        # Left frame for maze display
-        left_frame = tk.Frame(main_frame, width=500)
-        left_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5, pady=5)
-        
-        # Canvas for maze
-        self.canvas_frame = tk.Frame(left_frame)
-        self.canvas_frame.pack(fill=tk.BOTH, expand=True)
-        
-        self.canvas = tk.Canvas(self.canvas_frame, bg="white")
-        self.canvas.pack(fill=tk.BOTH, expand=True)
-        
-        # Seed input frame
-        seed_frame = tk.Frame(left_frame)
-        seed_frame.pack(fill=tk.X, pady=5)
-        
-        tk.Label(seed_frame, text="Seed:").pack(side=tk.LEFT)
-        self.seed_entry = tk.Entry(seed_frame, width=10)
-        self.seed_entry.pack(side=tk.LEFT, padx=5)
-        self.seed_entry.insert(0, str(self.current_seed))
-        
-        tk.Button(seed_frame, text="Apply Seed", command=self.apply_seed).pack(side=tk.LEFT, padx=5)
-        tk.Button(seed_frame, text="Random Seed", command=self.random_seed).pack(side=tk.LEFT, padx=5)
-        
-        # Maze size slider
-        size_frame = tk.Frame(left_frame)
-        size_frame.pack(fill=tk.X, pady=5)
-        
-        tk.Label(size_frame, text="Maze Size:").pack(side=tk.LEFT)
-        self.size_slider = tk.Scale(size_frame, from_=5, to=25, orient=tk.HORIZONTAL, 
-                                   length=200, command=self.update_maze_size)
-        self.size_slider.set(self.maze_size)
-        self.size_slider.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        
-        # Buttons under maze
-        button_frame = tk.Frame(left_frame)
-        button_frame.pack(fill=tk.X, pady=5)
-        
-        tk.Button(button_frame, text="New Maze", command=self.new_maze).pack(side=tk.LEFT, padx=5)
-        tk.Button(button_frame, text="Copy Maze", command=self.copy_maze).pack(side=tk.LEFT, padx=5)
-        tk.Button(button_frame, text="Reset Position", command=self.reset_position).pack(side=tk.LEFT, padx=5)
-        tk.Button(button_frame, text="Clear Path", command=self.clear_path).pack(side=tk.LEFT, padx=5)
-        
-        # Right frame for commands
-        right_frame = tk.Frame(main_frame, width=500)
-        right_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=5, pady=5)
-        
-        # Command input
-        command_label = tk.Label(right_frame, text="Enter Commands:")
-        command_label.pack(anchor=tk.W, pady=(0, 5))
-        
-        self.command_text = scrolledtext.ScrolledText(right_frame, height=10)
-        self.command_text.pack(fill=tk.BOTH, expand=True, pady=5)
-        
-        # Name input for attempts
-        name_frame = tk.Frame(right_frame)
-        name_frame.pack(fill=tk.X, pady=5)
-        
-        tk.Label(name_frame, text="Attempt Name:").pack(side=tk.LEFT)
-        self.name_entry = tk.Entry(name_frame)
-        self.name_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
-        self.name_entry.insert(0, "Player")
-        
-        # Buttons for commands
-        button_frame2 = tk.Frame(right_frame)
-        button_frame2.pack(fill=tk.X, pady=5)
-        
-        tk.Button(button_frame2, text="Execute Commands", command=self.execute_commands).pack(side=tk.LEFT, padx=5)
-        tk.Button(button_frame2, text="Load from JSON", command=self.load_from_json).pack(side=tk.LEFT, padx=5)
-        
-        # Command history display
-        history_label = tk.Label(right_frame, text="Command History:")
-        history_label.pack(anchor=tk.W, pady=(10, 5))
-        
-        self.history_text = scrolledtext.ScrolledText(right_frame, height=10)
-        self.history_text.pack(fill=tk.BOTH, expand=True, pady=5)
-        self.history_text.config(state=tk.DISABLED)
-        
-        # Draw initial maze
-        self.draw_maze()
-    
-    def generate_maze(self, width, height, seed=None):
-        # Set random seed if provided
-        if seed is not None:
-            random.seed(seed)
-        
-        # Initialize maze with walls
-        maze = [['#' for _ in range(width)] for _ in range(height)]
-        
-        # Use depth-first search to generate a proper maze
-        # Start with all cells as walls
-        # Then carve passages using DFS with backtracking
-        
-        # Only work with odd-indexed cells to ensure walls between all passages
-        stack = [(1, 1)]
-        visited = set([(1, 1)])
-        
-        # Mark the start as a passage
-        maze[1][1] = ' '
-        
-        # Directions: right, down, left, up
-        directions = [(0, 2), (2, 0), (0, -2), (-2, 0)]
-        
-        while stack:
-            current_row, current_col = stack[-1]
-            
-            # Find unvisited neighbors
-            neighbors = []
-            for dr, dc in directions:
-                new_row, new_col = current_row + dr, current_col + dc
-                if (0 < new_row < height - 1 and 0 < new_col < width - 1 and 
-                    (new_row, new_col) not in visited):
-                    neighbors.append((new_row, new_col, dr, dc))
-            
-            if neighbors:
-                # Choose a random unvisited neighbor
-                new_row, new_col, dr, dc = random.choice(neighbors)
-                
-                # Remove the wall between current cell and chosen cell
-                maze[current_row + dr//2][current_col + dc//2] = ' '
-                
-                # Mark the chosen cell as a passage
-                maze[new_row][new_col] = ' '
-                
-                # Add the chosen cell to visited set and stack
-                visited.add((new_row, new_col))
-                stack.append((new_row, new_col))
-            else:
-                # Backtrack
-                stack.pop()
-        
-        # Ensure the goal is open
-        maze[height-2][width-2] = ' '
-        
-        # Reset random seed to avoid affecting other random operations
-        random.seed()
-        
-        return maze
-    
-    def draw_maze(self):
-        self.canvas.delete("all")
-        
-        # Calculate canvas size
-        canvas_width = self.maze_size * self.cell_size
-        canvas_height = self.maze_size * self.cell_size
-        
-        # Configure canvas
-        self.canvas.config(width=canvas_width, height=canvas_height)
-        
-        # Draw maze
-        for i in range(self.maze_size):
-            for j in range(self.maze_size):
-                x1, y1 = j * self.cell_size, i * self.cell_size
-                x2, y2 = x1 + self.cell_size, y1 + self.cell_size
-                
-                if self.maze[i][j] == '#':
-                    self.canvas.create_rectangle(x1, y1, x2, y2, fill="black", outline="")
-                else:
-                    # Check if this cell is in the path
-                    if (i, j) in self.path_visited:
-                        self.canvas.create_rectangle(x1, y1, x2, y2, fill="light blue", outline="gray")
-                    else:
-                        self.canvas.create_rectangle(x1, y1, x2, y2, fill="white", outline="gray")
-        
-        # Draw goal
-        goal_x, goal_y = self.goal_pos[1] * self.cell_size, self.goal_pos[0] * self.cell_size
-        self.canvas.create_rectangle(
-            goal_x, goal_y, 
-            goal_x + self.cell_size, goal_y + self.cell_size, 
-            fill="green", outline=""
-        )
-        
-        # Draw player
-        player_x, player_y = self.player_pos[1] * self.cell_size, self.player_pos[0] * self.cell_size
-        self.canvas.create_oval(
-            player_x + 5, player_y + 5, 
-            player_x + self.cell_size - 5, player_y + self.cell_size - 5, 
-            fill="red", outline=""
-        )
-    
-    def new_maze(self):
-        self.random_seed()
-    
-    def reset_position(self):
-        self.player_pos = [1, 1]
-        self.path_visited = set([(1, 1)])
-        self.move_count = 0
-        self.draw_maze()
-        self.update_history("Position reset to start")
-    
-    def copy_maze(self):
-        """Create a text representation of the maze using emojis and copy it to clipboard"""
-        # Create a text representation of the maze
-        maze_text = ""
-        
-        for i in range(self.maze_size):
-            for j in range(self.maze_size):
-                # Check if this is the player position
-                if [i, j] == self.player_pos:
-                    maze_text += "🟥"  # Red square for player
-                # Check if this is the goal position
-                elif [i, j] == self.goal_pos:
-                    maze_text += "🟩"  # Green square for goal
-                # Check if this is a wall
-                elif self.maze[i][j] == '#':
-                    maze_text += "⬛"  # Black square for walls
-                # Otherwise it's a path
-                else:
-                    maze_text += "⬜"  # White square for paths
-            
-            # Add a newline at the end of each row
-            maze_text += "\n"
-        
-        # Add seed information
-        maze_text += f"\nMaze Seed: {self.current_seed}\n"
-        maze_text += f"Maze Size: {self.maze_size}x{self.maze_size}\n"
-        
-        # Copy to clipboard
-        self.root.clipboard_clear()
-        self.root.clipboard_append(maze_text)
-        
-        messagebox.showinfo("Success", "Maze copied to clipboard as emoji text")
-    
-    def execute_commands(self):
-        # Get commands from text area
-        command_text = self.command_text.get("1.0", tk.END).strip()
-        if not command_text:
-            messagebox.showinfo("Info", "No commands to execute")
-            return
-        
-        # Get attempt name
-        self.current_attempt_name = self.name_entry.get() or "Player"
-        
-        # Process commands
-        commands = command_text.split('\n')
-        
-        # Add to history
-        self.command_history.append({
-            "name": self.current_attempt_name,
-            "commands": commands
-        })
-        
-        # Execute each command
-        for cmd in commands:
-            self.process_command(cmd)
-    
-    def process_command(self, command):
-        command = command.strip().lower()
-        if not command:
-            return
-        
-        # Parse command
-        parts = command.split()
-        
-        if len(parts) < 2 or parts[0] != "move":
-            self.update_history(f"Invalid command: {command}")
-            return
-        
-        direction = parts[1]
-        steps = 1  # Default is 1 step
-        
-        # Check if steps are specified
-        if len(parts) > 2:
-            try:
-                steps = int(parts[2])
-            except ValueError:
-                self.update_history(f"Invalid step count in: {command}")
-                return
-        
-        # Process movement
-        moves_made = 0
-        for _ in range(steps):
-            new_pos = self.player_pos.copy()
-            
-            if direction == "up":
-                new_pos[0] -= 1
-            elif direction == "down":
-                new_pos[0] += 1
-            elif direction == "left":
-                new_pos[1] -= 1
-            elif direction == "right":
-                new_pos[1] += 1
-            else:
-                self.update_history(f"Unknown direction: {direction}")
-                return
-            
-            # Check if the move is valid
-            if (0 <= new_pos[0] < self.maze_size and 
-                0 <= new_pos[1] < self.maze_size and 
-                self.maze[new_pos[0]][new_pos[1]] != '#'):
-                self.player_pos = new_pos
-                # Add to path
-                self.path_visited.add((new_pos[0], new_pos[1]))
-                moves_made += 1
-                self.move_count += 1
-            else:
-                self.update_history(f"Cannot move {direction} - wall or boundary")
-                break
-        
-        if moves_made > 0:
-            self.update_history(f"Moved {direction} {moves_made} step(s). Total moves: {self.move_count}")
-        
-        # Check if player reached the goal
-        if self.player_pos == self.goal_pos:
-            self.update_history(f"Goal reached in {self.move_count} moves! Congratulations!")
-            messagebox.showinfo("Success", f"You've solved the maze in {self.move_count} moves!")
-        
-        # Update the maze display
-        self.draw_maze()
-    
-    def update_history(self, message):
-        self.history_text.config(state=tk.NORMAL)
-        self.history_text.insert(tk.END, f"{self.current_attempt_name}: {message}\n")
-        self.history_text.see(tk.END)
-        self.history_text.config(state=tk.DISABLED)
-    
-    def load_from_json(self):
-        filename = filedialog.askopenfilename(
-            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
-        )
-        if not filename:
-            return
-        
-        try:
-            with open(filename, 'r') as f:
-                data = json.load(f)
-            
-            # Check if this is the new format with maze info
-            if isinstance(data, dict) and "maze_info" in data and "attempts" in data:
-                # Load maze info
-                maze_info = data["maze_info"]
-                if "seed" in maze_info and "size" in maze_info:
-                    # Update maze size slider
-                    self.size_slider.set(maze_info["size"])
-                    
-                    # Update seed entry
-                    self.seed_entry.delete(0, tk.END)
-                    self.seed_entry.insert(0, str(maze_info["seed"]))
-                    
-                    # Apply the seed and size
-                    self.current_seed = maze_info["seed"]
-                    self.maze_size = maze_info["size"]
-                    self.maze = self.generate_maze(self.maze_size, self.maze_size, self.current_seed)
-                    self.goal_pos = [self.maze_size - 2, self.maze_size - 2]
-                    
-                    # Get the attempts
-                    attempts = data["attempts"]
-                else:
-                    messagebox.showwarning("Warning", "Maze information incomplete. Using current maze.")
-                    attempts = data["attempts"]
-            else:
-                # Old format - just a list of attempts
-                messagebox.showwarning("Warning", "Old format JSON without maze information. Using current maze.")
-                attempts = data
-            
-            if not isinstance(attempts, list):
-                messagebox.showerror("Error", "Invalid JSON format. Expected a list of attempts.")
-                return
-            
-            # Reset position
-            self.reset_position()
-            
-            # Clear command history display
-            self.history_text.config(state=tk.NORMAL)
-            self.history_text.delete("1.0", tk.END)
-            self.history_text.config(state=tk.DISABLED)
-            
-            # Prepare performance report
-            performance_report = []
-            
-            # Process each attempt
-            for attempt in attempts:
-                if "name" not in attempt or "commands" not in attempt:
-                    continue
-                
-                self.current_attempt_name = attempt["name"]
-                self.update_history(f"Starting attempt")
-                
-                # Reset path for each attempt
-                self.path_visited = set([(1, 1)])
-                self.player_pos = [1, 1]
-                self.move_count = 0
-                
-                for cmd in attempt["commands"]:
-                    self.process_command(cmd)
-                
-                # Record performance
-                reached_goal = self.player_pos == self.goal_pos
-                performance_report.append({
-                    "name": self.current_attempt_name,
-                    "moves": self.move_count,
-                    "reached_goal": reached_goal,
-                    "cells_visited": len(self.path_visited),
-                    "maze_seed": self.current_seed,
-                    "maze_size": self.maze_size
-                })
-                
-                self.update_history(f"Attempt completed. Total moves: {self.move_count}")
-            
-            # Generate performance report file
-            report_filename = os.path.splitext(filename)[0] + "_performance.json"
-            with open(report_filename, 'w') as f:
-                json.dump(performance_report, f, indent=2)
-            
-            # Display performance summary
-            self.show_performance_summary(performance_report)
-            
-            messagebox.showinfo("Success", f"Loaded {len(attempts)} attempts from {filename}\nPerformance report saved to {report_filename}")
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to load JSON: {str(e)}")
-    
-    def show_performance_summary(self, performance_report):
-        """Display a summary of the performance report in a new window"""
-        summary_window = tk.Toplevel(self.root)
-        summary_window.title("Performance Summary")
-        summary_window.geometry("500x400")
-        
-        # Create a frame for the summary
-        frame = tk.Frame(summary_window, padx=10, pady=10)
-        frame.pack(fill=tk.BOTH, expand=True)
-        
-        # Add a label
-        tk.Label(frame, text="Performance Summary", font=("Arial", 14, "bold")).pack(pady=(0, 10))
-        
-        # Create a text widget to display the summary
-        summary_text = scrolledtext.ScrolledText(frame, height=20, width=60)
-        summary_text.pack(fill=tk.BOTH, expand=True)
-        
-        # Sort performance by number of moves (if reached goal) or by cells visited
-        def sort_key(item):
-            if item["reached_goal"]:
-                return (0, item["moves"])  # Reached goal, sort by moves
-            else:
-                return (1, -item["cells_visited"])  # Didn't reach goal, sort by cells visited (descending)
-        
-        sorted_report = sorted(performance_report, key=sort_key)
-        
-        # Add header
-        summary_text.insert(tk.END, f"{'Rank':<5}{'Name':<15}{'Moves':<10}{'Goal':<10}{'Cells Visited':<15}\n")
-        summary_text.insert(tk.END, "-" * 55 + "\n")
-        
-        # Add each attempt
-        for i, attempt in enumerate(sorted_report, 1):
-            goal_status = "Yes" if attempt["reached_goal"] else "No"
-            summary_text.insert(tk.END, f"{i:<5}{attempt['name']:<15}{attempt['moves']:<10}{goal_status:<10}{attempt['cells_visited']:<15}\n")
-        
-        # Add statistics
-        summary_text.insert(tk.END, "\nStatistics:\n")
-        summary_text.insert(tk.END, "-" * 55 + "\n")
-        
-        # Calculate statistics
-        completed_attempts = [a for a in performance_report if a["reached_goal"]]
-        if completed_attempts:
-            avg_moves = sum(a["moves"] for a in completed_attempts) / len(completed_attempts)
-            min_moves = min(a["moves"] for a in completed_attempts)
-            best_performer = next(a["name"] for a in performance_report if a["reached_goal"] and a["moves"] == min_moves)
-            
-            summary_text.insert(tk.END, f"Attempts that reached goal: {len(completed_attempts)}/{len(performance_report)}\n")
-            summary_text.insert(tk.END, f"Average moves for successful attempts: {avg_moves:.1f}\n")
-            summary_text.insert(tk.END, f"Best performance: {best_performer} ({min_moves} moves)\n")
-        else:
-            summary_text.insert(tk.END, "No attempts reached the goal.\n")
-        
-        # Make the text widget read-only
-        summary_text.config(state=tk.DISABLED)
-    
-    def update_maze_size(self, val):
-        new_size = int(val)
-        if new_size != self.maze_size:
-            self.maze_size = new_size
-            self.maze = self.generate_maze(self.maze_size, self.maze_size, self.current_seed)
-            self.goal_pos = [self.maze_size - 2, self.maze_size - 2]
-            self.reset_position()
-            self.draw_maze()
-
-    def clear_path(self):
-        # Keep only the current position in the path
-        self.path_visited = set([(self.player_pos[0], self.player_pos[1])])
-        self.draw_maze()
-        self.update_history("Path cleared")
-
-    def apply_seed(self):
-        try:
-            new_seed = int(self.seed_entry.get())
-            self.current_seed = new_seed
-            self.maze = self.generate_maze(self.maze_size, self.maze_size, self.current_seed)
-            self.reset_position()
-            self.draw_maze()
-            self.update_history(f"Applied seed: {self.current_seed}")
-        except ValueError:
-            messagebox.showerror("Error", "Seed must be an integer")
-
-    def random_seed(self):
-        self.current_seed = random.randint(1, 1000000)
-        self.seed_entry.delete(0, tk.END)
-        self.seed_entry.insert(0, str(self.current_seed))
-        self.maze = self.generate_maze(self.maze_size, self.maze_size, self.current_seed)
-        self.reset_position()
-        self.draw_maze()
-        self.update_history(f"Generated random seed: {self.current_seed}")
-
-if __name__ == "__main__":
-    root = tk.Tk()
-    app = MazeApp(root)
-    root.mainloop()
+import tkinter as tk
+from tkinter import filedialog, messagebox, scrolledtext
+import json
+import random
+import os
+import time
+from PIL import Image, ImageTk
+import io
+from maze_core import MazeSimulation, performance_record, size_label
+from maze_cache import MazeCache
+from maze_generator import ALGORITHMS, DEFAULT_ALGORITHM
+from maze_prompt import FORMATS, maze_footer, serialize
+
+# Canvas zoom limits and the cell size a new maze starts at, in pixels
+MIN_CELL_SIZE = 4
+MAX_CELL_SIZE = 60
+DEFAULT_CELL_SIZE = 30
+# New mazes are zoomed to fit about this many pixels, within the limits above
+FIT_PIXELS = 600
+
+MAX_MAZE_SIZE = 1001
+# Generation runs on the Tk thread; Wilson's algorithm takes seconds above this size
+ALGORITHM_MAX_SIZE = {"wilson": 501}
+# Extra rows and columns rendered around the visible part of the canvas
+VIEWPORT_MARGIN = 2
+
+# Instant replay works in slices of this many seconds, then lets Tk handle events
+REPLAY_SLICE_SECONDS = 0.03
+# History lines are buffered and written at most this often, and only the latest kept
+HISTORY_FLUSH_MS = 100
+MAX_HISTORY_LINES = 5000
+
+
+def size_error(width, height, algorithm):
+    """Why a width x height maze of this algorithm cannot be generated here, or None."""
+    limit = ALGORITHM_MAX_SIZE.get(algorithm, MAX_MAZE_SIZE)
+    if not (5 <= width <= limit and 5 <= height <= limit):
+        return f"Width and height must be between 5 and {limit} for {algorithm} mazes"
+    return None
+
+
+class MazeApp:
+    def __init__(self, root):
+        self.root = root
+        self.root.title("Maze Solver")
+        self.root.geometry("1000x600")
+        
+        # Maze properties
+        self.maze_width = 15  # Default size
+        self.maze_height = 15
+        self.cell_size = DEFAULT_CELL_SIZE
+        self.current_seed = random.randint(1, 1000000)  # Random seed for maze generation
+        self.algorithm = DEFAULT_ALGORITHM  # Name of the generation algorithm in ALGORITHMS
+        self.prompt_format = "emoji"  # Text format used by Copy Maze, from maze_prompt.FORMATS
+        self.maze_cache = MazeCache()
+        self.drawn_maze = None  # Maze the canvas items were built for
+        self.drawn_cell_size = None  # Cell size they were built at
+        self.render_pending = False
+        
+        # Position, visited cells and move count live in the headless simulation
+        self.set_maze(self.generate_maze(self.maze_width, self.maze_height, self.current_seed))
+        
+        # Command history
+        self.command_history = []
+        self.current_attempt_name = "Player"
+        self.history_buffer = []
+        self.history_flush_pending = False
+        
+        # Replay of a loaded file, advanced by after() callbacks
+        self.replay = None  # generator that yields after every command
+        self.replay_job = None
+        
+        # Create UI
+        self.create_ui()
+        
+    def create_ui(self):
+        # Main frame
+        main_frame = tk.Frame(self.root)
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        # Left frame for maze display
+        left_frame = tk.Frame(main_frame, width=500)
+        left_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+        # Canvas for maze
+        self.canvas_frame = tk.Frame(left_frame)
+        self.canvas_frame.pack(fill=tk.BOTH, expand=True)
+        
+        self.canvas = tk.Canvas(self.canvas_frame, bg="white")
+        x_scrollbar = tk.Scrollbar(self.canvas_frame, orient=tk.HORIZONTAL, command=self.scroll_x)
+        y_scrollbar = tk.Scrollbar(self.canvas_frame, orient=tk.VERTICAL, command=self.scroll_y)
+        self.canvas.config(xscrollcommand=x_scrollbar.set, yscrollcommand=y_scrollbar.set)
+        
+        self.canvas.grid(row=0, column=0, sticky="nsew")
+        y_scrollbar.grid(row=0, column=1, sticky="ns")
+        x_scrollbar.grid(row=1, column=0, sticky="ew")
+        self.canvas_frame.rowconfigure(0, weight=1)
+        self.canvas_frame.columnconfigure(0, weight=1)
+        
+        # Only cells near the viewport have items, so re-render whenever the view changes.
+        # The wheel scrolls (Shift: sideways) and zooms with Control.
+        self.canvas.bind("<Configure>", lambda event: self.schedule_render())
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.canvas.bind(sequence, self.on_mouse_wheel)
+        
+        # Seed input frame
+        seed_frame = tk.Frame(left_frame)
+        seed_frame.pack(fill=tk.X, pady=5)
+        
+        tk.Label(seed_frame, text="Seed:").pack(side=tk.LEFT)
+        self.seed_entry = tk.Entry(seed_frame, width=10)
+        self.seed_entry.pack(side=tk.LEFT, padx=5)
+        self.seed_entry.insert(0, str(self.current_seed))
+        
+        tk.Button(seed_frame, text="Apply Seed", command=self.apply_seed).pack(side=tk.LEFT, padx=5)
+        tk.Button(seed_frame, text="Random Seed", command=self.random_seed).pack(side=tk.LEFT, padx=5)
+        
+        # Maze size and zoom
+        size_frame = tk.Frame(left_frame)
+        size_frame.pack(fill=tk.X, pady=5)
+        
+        tk.Label(size_frame, text="Width:").pack(side=tk.LEFT)
+        self.width_spinbox = tk.Spinbox(size_frame, from_=5, to=MAX_MAZE_SIZE, width=6)
+        self.width_spinbox.pack(side=tk.LEFT, padx=5)
+        tk.Label(size_frame, text="Height:").pack(side=tk.LEFT)
+        self.height_spinbox = tk.Spinbox(size_frame, from_=5, to=MAX_MAZE_SIZE, width=6)
+        self.height_spinbox.pack(side=tk.LEFT, padx=5)
+        self.show_maze_size()
+        
+        tk.Button(size_frame, text="Apply Size", command=self.apply_size).pack(side=tk.LEFT, padx=5)
+        tk.Button(size_frame, text="Zoom In", command=lambda: self.zoom(1.25)).pack(side=tk.LEFT, padx=5)
+        tk.Button(size_frame, text="Zoom Out", command=lambda: self.zoom(0.8)).pack(side=tk.LEFT, padx=5)
+        
+        # Generation algorithm
+        algorithm_frame = tk.Frame(left_frame)
+        algorithm_frame.pack(fill=tk.X, pady=5)
+        
+        tk.Label(algorithm_frame, text="Algorithm:").pack(side=tk.LEFT)
+        self.algorithm_var = tk.StringVar(value=self.algorithm)
+        tk.OptionMenu(algorithm_frame, self.algorithm_var, *ALGORITHMS,
+                      command=self.update_algorithm).pack(side=tk.LEFT, padx=5)
+        
+        # Buttons under maze
+        button_frame = tk.Frame(left_frame)
+        button_frame.pack(fill=tk.X, pady=5)
+        
+        tk.Button(button_frame, text="New Maze", command=self.new_maze).pack(side=tk.LEFT, padx=5)
+        tk.Button(button_frame, text="Copy Maze", command=self.copy_maze).pack(side=tk.LEFT, padx=5)
+        self.prompt_format_var = tk.StringVar(value=self.prompt_format)
+        tk.OptionMenu(button_frame, self.prompt_format_var, *FORMATS).pack(side=tk.LEFT)
+        tk.Button(button_frame, text="Reset Position", command=self.reset_position).pack(side=tk.LEFT, padx=5)
+        tk.Button(button_frame, text="Clear Path", command=self.clear_path).pack(side=tk.LEFT, padx=5)
+        
+        # Right frame for commands
+        right_frame = tk.Frame(main_frame, width=500)
+        right_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+        # Command input
+        command_label = tk.Label(right_frame, text="Enter Commands:")
+        command_label.pack(anchor=tk.W, pady=(0, 5))
+        
+        self.command_text = scrolledtext.ScrolledText(right_frame, height=10)
+        self.command_text.pack(fill=tk.BOTH, expand=True, pady=5)
+        
+        # Name input for attempts
+        name_frame = tk.Frame(right_frame)
+        name_frame.pack(fill=tk.X, pady=5)
+        
+        tk.Label(name_frame, text="Attempt Name:").pack(side=tk.LEFT)
+        self.name_entry = tk.Entry(name_frame)
+        self.name_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        self.name_entry.insert(0, "Player")
+        
+        # Buttons for commands
+        button_frame2 = tk.Frame(right_frame)
+        button_frame2.pack(fill=tk.X, pady=5)
+        
+        tk.Button(button_frame2, text="Execute Commands", command=self.execute_commands).pack(side=tk.LEFT, padx=5)
+        tk.Button(button_frame2, text="Load from JSON", command=self.load_from_json).pack(side=tk.LEFT, padx=5)
+        tk.Button(button_frame2, text="Stop Replay", command=self.stop_replay).pack(side=tk.LEFT, padx=5)
+        
+        # Replay speed: a delay between commands, or as fast as possible at 0
+        speed_frame = tk.Frame(right_frame)
+        speed_frame.pack(fill=tk.X, pady=5)
+        
+        tk.Label(speed_frame, text="Replay delay (ms, 0 = instant):").pack(side=tk.LEFT)
+        self.replay_delay = tk.Scale(speed_frame, from_=0, to=500, resolution=10, orient=tk.HORIZONTAL, length=200)
+        self.replay_delay.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        
+        # Command history display
+        history_label = tk.Label(right_frame, text="Command History:")
+        history_label.pack(anchor=tk.W, pady=(10, 5))
+        
+        self.history_text = scrolledtext.ScrolledText(right_frame, height=10)
+        self.history_text.pack(fill=tk.BOTH, expand=True, pady=5)
+        self.history_text.config(state=tk.DISABLED)
+        
+        # Draw initial maze
+        self.draw_maze()
+    
+    def set_maze(self, maze):
+        self.maze = maze
+        self.sim = MazeSimulation(maze)
+    
+    def generate_maze(self, width, height, seed=None):
+        # Seeds and sizes seen before come from memory or the on-disk cache
+        return self.maze_cache.get(width, height, seed, self.algorithm)
+    
+    def draw_maze(self):
+        # Items are created once per maze and cell size; afterwards only changed cells and
+        # the player move
+        if self.items_outdated():
+            self.build_maze_items()
+        else:
+            self.update_maze_items()
+    
+    def items_outdated(self):
+        # Loading a file for the maze on screen keeps the same Maze but resets the cell size
+        return self.drawn_maze is not self.maze or self.drawn_cell_size != self.cell_size
+    
+    def build_maze_items(self):
+        self.canvas.delete("all")
+        self.drawn_maze = self.maze
+        self.drawn_cell_size = self.cell_size
+        self.cell_items = {}  # cell index -> rectangle id, open cells in the rendered window only
+        self.drawn_visited = bytearray(len(self.maze.cells))  # visited flags as last drawn
+        self.drawn_window = None
+        
+        # The scroll region covers the whole maze, but walls are a single background
+        # rectangle and open cells only get items while they are near the viewport
+        canvas_width = self.maze.width * self.cell_size
+        canvas_height = self.maze.height * self.cell_size
+        self.canvas.config(scrollregion=(0, 0, canvas_width, canvas_height))
+        self.canvas.create_rectangle(0, 0, canvas_width, canvas_height, fill="black", outline="")
+        
+        # Draw goal
+        goal_x, goal_y = self.sim.goal_pos[1] * self.cell_size, self.sim.goal_pos[0] * self.cell_size
+        self.goal_item = self.canvas.create_rectangle(
+            goal_x, goal_y, 
+            goal_x + self.cell_size, goal_y + self.cell_size, 
+            fill="green", outline=""
+        )
+        
+        # Draw player
+        self.player_item = self.canvas.create_oval(0, 0, 0, 0, fill="red", outline="")
+        
+        self.render_viewport()
+        self.update_maze_items()
+    
+    def visible_window(self):
+        """Rows and columns (as half-open ranges) in view, plus VIEWPORT_MARGIN on each side."""
+        size = self.cell_size
+        left, top = self.canvas.canvasx(0), self.canvas.canvasy(0)
+        right, bottom = left + self.canvas.winfo_width(), top + self.canvas.winfo_height()
+        return (max(0, int(top // size) - VIEWPORT_MARGIN),
+                min(self.maze.height, int(bottom // size) + 1 + VIEWPORT_MARGIN),
+                max(0, int(left // size) - VIEWPORT_MARGIN),
+                min(self.maze.width, int(right // size) + 1 + VIEWPORT_MARGIN))
+    
+    def schedule_render(self):
+        # Scrolling fires many events; render once when Tk is next idle
+        if not self.render_pending:
+            self.render_pending = True
+            self.root.after_idle(self.render_viewport)
+    
+    def render_viewport(self):
+        """Create items for open cells that came into view and delete those that left it."""
+        self.render_pending = False
+        if self.items_outdated():
+            return
+        window = self.visible_window()
+        if window == self.drawn_window:
+            return
+        row_start, row_end, col_start, col_end = window
+        
+        cells, width, size = self.maze.cells, self.maze.width, self.cell_size
+        for cell in [cell for cell in self.cell_items
+                     if not (row_start <= cell // width < row_end and col_start <= cell % width < col_end)]:
+            self.canvas.delete(self.cell_items.pop(cell))
+        
+        visited = self.sim.path_visited.flags
+        for i in range(row_start, row_end):
+            for j in range(col_start, col_end):
+                cell = i * width + j
+                if cells[cell] or cell in self.cell_items:
+                    continue
+                x1, y1 = j * size, i * size
+                fill = "light blue" if visited[cell] else "white"
+                self.cell_items[cell] = self.canvas.create_rectangle(
+                    x1, y1, x1 + size, y1 + size, fill=fill, outline="gray"
+                )
+        self.drawn_window = window
+        
+        # New cells are stacked on top; keep the goal and player above them
+        self.canvas.tag_raise(self.goal_item)
+        self.canvas.tag_raise(self.player_item)
+    
+    def update_maze_items(self):
+        # Recolour only cells whose visited state changed since the last draw; cells outside
+        # the rendered window have no item and are coloured when they scroll into view
+        visited = self.sim.path_visited
+        for cell in visited.changed(self.drawn_visited):
+            if cell in self.cell_items:
+                self.canvas.itemconfig(self.cell_items[cell], fill="light blue" if cell in visited else "white")
+        self.drawn_visited = bytearray(visited.flags)
+        
+        # Move the player, scrolling it back into view if it walked out
+        row, col = self.sim.player_pos
+        player_x, player_y = col * self.cell_size, row * self.cell_size
+        inset = self.cell_size // 6
+        self.canvas.coords(
+            self.player_item,
+            player_x + inset, player_y + inset, 
+            player_x + self.cell_size - inset, player_y + self.cell_size - inset
+        )
+        view_width, view_height = self.canvas.winfo_width(), self.canvas.winfo_height()
+        left, top = self.canvas.canvasx(0), self.canvas.canvasy(0)
+        if view_width > 1 and not (left <= player_x and player_x + self.cell_size <= left + view_width and
+                                   top <= player_y and player_y + self.cell_size <= top + view_height):
+            self.center_view(row, col)
+    
+    def center_view(self, row, col):
+        """Scroll so that (row, col) is in the middle of the canvas."""
+        total_width = self.maze.width * self.cell_size
+        total_height = self.maze.height * self.cell_size
+        x = (col + 0.5) * self.cell_size - self.canvas.winfo_width() / 2
+        y = (row + 0.5) * self.cell_size - self.canvas.winfo_height() / 2
+        self.canvas.xview_moveto(max(0, x / total_width))
+        self.canvas.yview_moveto(max(0, y / total_height))
+        self.schedule_render()
+    
+    def zoom(self, factor):
+        cell_size = max(MIN_CELL_SIZE, min(MAX_CELL_SIZE, round(self.cell_size * factor)))
+        if cell_size == self.cell_size:
+            return
+        # Keep whatever is in the middle of the view there after zooming
+        row = (self.canvas.canvasy(0) + self.canvas.winfo_height() / 2) / self.cell_size
+        col = (self.canvas.canvasx(0) + self.canvas.winfo_width() / 2) / self.cell_size
+        self.cell_size = cell_size
+        self.build_maze_items()
+        self.center_view(int(row), int(col))
+    
+    def scroll_x(self, *args):
+        self.canvas.xview(*args)
+        self.schedule_render()
+    
+    def scroll_y(self, *args):
+        self.canvas.yview(*args)
+        self.schedule_render()
+    
+    def on_mouse_wheel(self, event):
+        # Button-4/5 are the X11 wheel; elsewhere the direction is in event.delta
+        towards_top = event.num == 4 or event.delta > 0
+        if event.state & 0x0004:  # Control
+            self.zoom(1.25 if towards_top else 0.8)
+            return
+        units = -3 if towards_top else 3
+        if event.state & 0x0001:  # Shift
+            self.canvas.xview_scroll(units, "units")
+        else:
+            self.canvas.yview_scroll(units, "units")
+        self.schedule_render()
+    
+    def new_maze(self):
+        self.random_seed()
+    
+    def reset_position(self):
+        self.stop_replay()
+        self.sim.reset()
+        self.draw_maze()
+        self.update_history("Position reset to start")
+    
+    def copy_maze(self):
+        """Copy a text representation of the maze in the selected format to the clipboard"""
+        self.prompt_format = self.prompt_format_var.get()
+        maze_text = serialize(self.maze, self.prompt_format, self.sim.player_pos, self.sim.goal_pos)
+        maze_text += maze_footer(self.current_seed, self.maze_width, self.maze_height, self.algorithm)
+        
+        # Copy to clipboard
+        self.root.clipboard_clear()
+        self.root.clipboard_append(maze_text)
+        
+        # Only the chosen format is built; maze_prompt.py compares all of them from the command line
+        self.update_history(f"Copied {len(maze_text)} characters as {self.prompt_format} text")
+        
+        messagebox.showinfo("Success", f"Maze copied to clipboard as {self.prompt_format} text")
+    
+    def execute_commands(self):
+        self.stop_replay()
+        # Get commands from text area
+        command_text = self.command_text.get("1.0", tk.END).strip()
+        if not command_text:
+            messagebox.showinfo("Info", "No commands to execute")
+            return
+        
+        # Get attempt name
+        self.current_attempt_name = self.name_entry.get() or "Player"
+        
+        # Process commands
+        commands = command_text.split('\n')
+        
+        # Add to history
+        self.command_history.append({
+            "name": self.current_attempt_name,
+            "commands": commands
+        })
+        
+        # Execute each command
+        for cmd in commands:
+            self.process_command(cmd)
+    
+    def process_command(self, command, redraw=True, notify=True):
+        result = self.sim.process_command(command)
+        for message in result.messages:
+            self.update_history(message)
+        
+        if not result.completed:
+            return result
+        
+        # Replays pass notify=False: the goal is already in the history, and a modal
+        # dialog would stop the batch until dismissed
+        if result.reached_goal and notify:
+            messagebox.showinfo("Success", f"You've solved the maze in {self.sim.move_count} moves!")
+        
+        # Update the maze display
+        if redraw:
+            self.draw_maze()
+        return result
+    
+    def update_history(self, message):
+        # Lines are written to the widget in one insert per flush rather than one per message
+        self.history_buffer.append(f"{self.current_attempt_name}: {message}\n")
+        if not self.history_flush_pending:
+            self.history_flush_pending = True
+            self.root.after(HISTORY_FLUSH_MS, self.flush_history)
+    
+    def flush_history(self):
+        self.history_flush_pending = False
+        if not self.history_buffer:
+            return
+        text = "".join(self.history_buffer)
+        self.history_buffer.clear()
+        
+        self.history_text.config(state=tk.NORMAL)
+        self.history_text.insert(tk.END, text)
+        self.history_text.delete("1.0", f"end-{MAX_HISTORY_LINES + 1}l")
+        self.history_text.see(tk.END)
+        self.history_text.config(state=tk.DISABLED)
+    
+    def clear_history(self):
+        self.history_buffer.clear()
+        self.history_text.config(state=tk.NORMAL)
+        self.history_text.delete("1.0", tk.END)
+        self.history_text.config(state=tk.DISABLED)
+    
+    def load_from_json(self):
+        filename = filedialog.askopenfilename(
+            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+        )
+        if not filename:
+            return
+        self.stop_replay()
+        
+        try:
+            with open(filename, 'r') as f:
+                data = json.load(f)
+            
+            # Check if this is the new format with maze info
+            if isinstance(data, dict) and "maze_info" in data and "attempts" in data:
+                # Load maze info
+                maze_info = data["maze_info"]
+                # Square mazes give one "size"; others give "width" and "height"
+                width = maze_info.get("width", maze_info.get("size"))
+                height = maze_info.get("height", maze_info.get("size"))
+                if "seed" in maze_info and width and height:
+                    # Files without an algorithm predate the choice. Check it and the size
+                    # first, since generation runs on the Tk thread
+                    algorithm = maze_info.get("algorithm", DEFAULT_ALGORITHM)
+                    if algorithm not in ALGORITHMS:
+                        messagebox.showerror("Error", f"Unknown maze algorithm: {algorithm}")
+                        return
+                    error = size_error(width, height, algorithm)
+                    if error:
+                        messagebox.showerror("Error", f"This file's maze is {width}x{height}. {error}")
+                        return
+
+                    # Update seed entry
+                    self.seed_entry.delete(0, tk.END)
+                    self.seed_entry.insert(0, str(maze_info["seed"]))
+                    
+                    # Apply the seed, size and algorithm
+                    self.algorithm = algorithm
+                    self.algorithm_var.set(algorithm)
+                    self.current_seed = maze_info["seed"]
+                    self.set_maze_size(width, height)
+                    self.set_maze(self.generate_maze(self.maze_width, self.maze_height, self.current_seed))
+                    
+                    # Get the attempts
+                    attempts = data["attempts"]
+                else:
+                    messagebox.showwarning("Warning", "Maze information incomplete. Using current maze.")
+                    attempts = data["attempts"]
+            else:
+                # Old format - just a list of attempts
+                messagebox.showwarning("Warning", "Old format JSON without maze information. Using current maze.")
+                attempts = data
+            
+            if not isinstance(attempts, list):
+                messagebox.showerror("Error", "Invalid JSON format. Expected a list of attempts.")
+                return
+            
+            # Reset position
+            self.reset_position()
+            
+            # Clear command history display
+            self.clear_history()
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load JSON: {str(e)}")
+            return
+        
+        # Attempts are replayed from after() callbacks so the window stays responsive
+        self.replay = self.replay_attempts(attempts)
+        self.replay_report = []
+        self.replay_filename = filename
+        self.replay_count = len(attempts)
+        self.replay_step()
+    
+    def replay_attempts(self, attempts):
+        """Run every attempt, yielding after each command so replay_step can pace it."""
+        for attempt in attempts:
+            if "name" not in attempt or "commands" not in attempt:
+                continue
+            
+            self.current_attempt_name = attempt["name"]
+            self.update_history(f"Starting attempt")
+            
+            # Reset path for each attempt
+            self.sim.reset()
+            
+            for cmd in attempt["commands"]:
+                self.process_command(cmd, redraw=False, notify=False)
+                yield
+            
+            # Record performance, including the gap to the shortest path
+            self.replay_report.append(
+                performance_record(self.current_attempt_name, self.sim, self.current_seed, self.maze_size_label(), self.algorithm)
+            )
+            
+            self.update_history(f"Attempt completed. Total moves: {self.sim.move_count}")
+    
+    def replay_step(self):
+        """Advance the replay by one command when animating, or by one time slice when instant."""
+        self.replay_job = None
+        delay = self.replay_delay.get()
+        deadline = time.perf_counter() + REPLAY_SLICE_SECONDS
+        try:
+            while True:
+                next(self.replay)
+                if delay or time.perf_counter() >= deadline:
+                    break
+        except StopIteration:
+            self.replay = None
+            self.draw_maze()
+            self.finish_replay()
+            return
+        except Exception as e:
+            self.replay = None
+            messagebox.showerror("Error", f"Replay failed: {str(e)}")
+            return
+        
+        self.draw_maze()
+        self.replay_job = self.root.after(delay or 1, self.replay_step)
+    
+    def stop_replay(self):
+        """Stop a running replay. Anything that changes the maze, the position or the path
+        calls this first, so a report never mixes mazes or manual commands."""
+        if self.replay is None:
+            return
+        if self.replay_job is not None:
+            self.root.after_cancel(self.replay_job)
+            self.replay_job = None
+        self.replay = None
+        self.update_history("Replay stopped")
+    
+    def finish_replay(self):
+        try:
+            # Generate performance report file
+            report_filename = os.path.splitext(self.replay_filename)[0] + "_performance.json"
+            with open(report_filename, 'w') as f:
+                json.dump(self.replay_report, f, indent=2)
+        except OSError as e:
+            messagebox.showerror("Error", f"Failed to save performance report: {str(e)}")
+            return
+        self.flush_history()
+        
+        # Display performance summary
+        self.show_performance_summary(self.replay_report)
+        
+        messagebox.showinfo("Success", f"Loaded {self.replay_count} attempts from {self.replay_filename}\nPerformance report saved to {report_filename}")
+    
+    def show_performance_summary(self, performance_report):
+        """Display a summary of the performance report in a new window"""
+        summary_window = tk.Toplevel(self.root)
+        summary_window.title("Performance Summary")
+        summary_window.geometry("500x400")
+        
+        # Create a frame for the summary
+        frame = tk.Frame(summary_window, padx=10, pady=10)
+        frame.pack(fill=tk.BOTH, expand=True)
+        
+        # Add a label
+        tk.Label(frame, text="Performance Summary", font=("Arial", 14, "bold")).pack(pady=(0, 10))
+        
+        # Create a text widget to display the summary
+        summary_text = scrolledtext.ScrolledText(frame, height=20, width=60)
+        summary_text.pack(fill=tk.BOTH, expand=True)
+        
+        # Sort performance by number of moves (if reached goal) or by cells visited
+        def sort_key(item):
+            if item["reached_goal"]:
+                return (0, item["moves"])  # Reached goal, sort by moves
+            else:
+                return (1, -item["cells_visited"])  # Didn't reach goal, sort by cells visited (descending)
+        
+        sorted_report = sorted(performance_report, key=sort_key)
+        
+        # Add header
+        summary_text.insert(tk.END, f"{'Rank':<5}{'Name':<15}{'Moves':<10}{'Goal':<10}{'Cells Visited':<15}\n")
+        summary_text.insert(tk.END, "-" * 55 + "\n")
+        
+        # Add each attempt
+        for i, attempt in enumerate(sorted_report, 1):
+            goal_status = "Yes" if attempt["reached_goal"] else "No"
+            summary_text.insert(tk.END, f"{i:<5}{attempt['name']:<15}{attempt['moves']:<10}{goal_status:<10}{attempt['cells_visited']:<15}\n")
+        
+        # Add statistics
+        summary_text.insert(tk.END, "\nStatistics:\n")
+        summary_text.insert(tk.END, "-" * 55 + "\n")
+        
+        # Calculate statistics
+        completed_attempts = [a for a in performance_report if a["reached_goal"]]
+        if completed_attempts:
+            avg_moves = sum(a["moves"] for a in completed_attempts) / len(completed_attempts)
+            min_moves = min(a["moves"] for a in completed_attempts)
+            best_performer = next(a["name"] for a in performance_report if a["reached_goal"] and a["moves"] == min_moves)
+            
+            summary_text.insert(tk.END, f"Attempts that reached goal: {len(completed_attempts)}/{len(performance_report)}\n")
+            summary_text.insert(tk.END, f"Average moves for successful attempts: {avg_moves:.1f}\n")
+            summary_text.insert(tk.END, f"Best performance: {best_performer} ({min_moves} moves)\n")
+        else:
+            summary_text.insert(tk.END, "No attempts reached the goal.\n")
+        
+        optimal_moves = performance_report[0].get("optimal_moves") if performance_report else None
+        if optimal_moves is not None:
+            summary_text.insert(tk.END, f"Shortest possible path: {optimal_moves} moves\n")
+        
+        # Make the text widget read-only
+        summary_text.config(state=tk.DISABLED)
+    
+    def set_maze_size(self, width, height):
+        self.maze_width = width
+        self.maze_height = height
+        self.cell_size = max(MIN_CELL_SIZE, min(DEFAULT_CELL_SIZE, FIT_PIXELS // max(width, height)))
+        self.show_maze_size()
+    
+    def show_maze_size(self):
+        for spinbox, value in ((self.width_spinbox, self.maze_width), (self.height_spinbox, self.maze_height)):
+            spinbox.delete(0, tk.END)
+            spinbox.insert(0, str(value))
+    
+    def maze_size_label(self):
+        return size_label(self.maze_width, self.maze_height)
+    
+    def apply_size(self):
+        self.stop_replay()
+        try:
+            width = int(self.width_spinbox.get())
+            height = int(self.height_spinbox.get())
+        except ValueError:
+            messagebox.showerror("Error", "Width and height must be integers")
+            return
+        error = size_error(width, height, self.algorithm)
+        if error:
+            messagebox.showerror("Error", error)
+            return
+        if (width, height) != (self.maze_width, self.maze_height):
+            self.set_maze_size(width, height)
+            self.set_maze(self.generate_maze(self.maze_width, self.maze_height, self.current_seed))
+            self.reset_position()
+            self.draw_maze()
+            self.update_history(f"Maze size set to {width}x{height}")
+
+    def update_algorithm(self, algorithm):
+        self.stop_replay()
+        if algorithm != self.algorithm:
+            limit = ALGORITHM_MAX_SIZE.get(algorithm, MAX_MAZE_SIZE)
+            if max(self.maze_width, self.maze_height) > limit:
+                messagebox.showerror("Error", f"{algorithm} mazes can be at most {limit}x{limit} here")
+                self.algorithm_var.set(self.algorithm)
+                return
+            self.algorithm = algorithm
+            self.set_maze(self.generate_maze(self.maze_width, self.maze_height, self.current_seed))
+            self.reset_position()
+            self.draw_maze()
+            self.update_history(f"Switched to {self.algorithm} maze generation")
+
+    def clear_path(self):
+        self.stop_replay()
+        self.sim.clear_path()
+        self.draw_maze()
+        self.update_history("Path cleared")
+
+    def apply_seed(self):
+        self.stop_replay()
+        try:
+            new_seed = int(self.seed_entry.get())
+            self.current_seed = new_seed
+            self.set_maze(self.generate_maze(self.maze_width, self.maze_height, self.current_seed))
+            self.reset_position()
+            self.draw_maze()
+            self.update_history(f"Applied seed: {self.current_seed}")
+        except ValueError:
+            messagebox.showerror("Error", "Seed must be an integer")
+
+    def random_seed(self):
+        self.stop_replay()
+        self.current_seed = random.randint(1, 1000000)
+        self.seed_entry.delete(0, tk.END)
+        self.seed_entry.insert(0, str(self.current_seed))
+        self.set_maze(self.generate_maze(self.maze_width, self.maze_height, self.current_seed))
+        self.reset_position()
+        self.draw_maze()
+        self.update_history(f"Generated random seed: {self.current_seed}")
+
+if __name__ == "__main__":
+    root = tk.Tk()
+    app = MazeApp(root)
+    root.mainloop()
@@ -0,0 +1,177 @@
+import numpy as np
+from maze_core import DIRECTIONS
+
+# Direction codes index the stacked jump tables; code ^ 1 is the opposite direction
+DIRECTION_CODES = {direction: code for code, direction in enumerate(("up", "down", "left", "right"))}
+NO_MOVE = -1
+
+# With keep_paths, attempts are replayed in groups small enough that their visited
+# bitmaps (one bit per cell per attempt) stay within this many bytes
+MAX_VISITED_BYTES = 1 << 26
+
+
+def parse_command(command):
+    """(direction code, steps, invalid) for one command, following MazeSimulation.apply_command."""
+    command = command.strip().lower()
+    if not command:
+        return NO_MOVE, 0, False
+
+    parts = command.split()
+    if len(parts) < 2 or parts[0] != "move":
+        return NO_MOVE, 0, True
+
+    steps = 1
+    if len(parts) > 2:
+        try:
+            steps = int(parts[2])
+        except ValueError:
+            return NO_MOVE, 0, True
+
+    # A zero or negative step count never looks at the direction
+    if steps <= 0:
+        return NO_MOVE, 0, False
+    if parts[1] not in DIRECTIONS:
+        return NO_MOVE, 0, True
+    return DIRECTION_CODES[parts[1]], steps, False
+
+
+class BatchReplay:
+    """Replays many attempts against one maze together, as NumPy operations over all of them.
+
+    Each command index is one vectorized step for every attempt: the jump tables give how
+    far each attempt can go, and the cells of all runs are then listed in one array to keep
+    the visited, revisit and closest-approach metrics exact. Visited cells are kept as
+    (attempt, cell) keys rather than a map per attempt, so the work follows the number of
+    moves, not the size of the maze. The performance of each attempt is the same as
+    MazeSimulation.run_attempt gives.
+    """
+    def __init__(self, maze, start=(1, 1)):
+        self.maze = maze
+        self.start = tuple(start)
+        self.start_index = start[0] * maze.width + start[1]
+        self.goal_index = maze.goal[0] * maze.width + maze.goal[1]
+        self.cell_count = len(maze.cells)
+
+        self.jumps = np.stack([np.asarray(maze.jump_table(direction), dtype=np.int64) for direction in DIRECTION_CODES])
+        self.strides = np.array([-maze.width, maze.width, -1, 1], dtype=np.int64)
+        self.goal_distances = np.asarray(maze.goal_distances, dtype=np.int64)
+
+    def run(self, attempts, keep_paths=False):
+        """Performance dicts, as from MazeSimulation.performance(), for lists of commands.
+
+        With keep_paths, each also has "visited": the attempt's visited cells at one bit per
+        cell, in the layout of VisitedCells.pack().
+        """
+        if not keep_paths:
+            return self.run_group(attempts)
+        group = max(1, MAX_VISITED_BYTES // ((self.cell_count + 7) // 8))
+        performances = []
+        for start in range(0, len(attempts), group):
+            performances.extend(self.run_group(attempts[start:start + group], keep_paths))
+        return performances
+
+    def parse(self, attempts):
+        """Padded (attempts x commands) arrays of direction codes, steps and parse errors."""
+        longest = max((len(commands) for commands in attempts), default=0)
+        directions = np.full((len(attempts), longest), NO_MOVE, dtype=np.int64)
+        steps = np.zeros((len(attempts), longest), dtype=np.int64)
+        invalid = np.zeros((len(attempts), longest), dtype=bool)
+        for row, commands in enumerate(attempts):
+            for column, command in enumerate(commands):
+                direction, count, bad = parse_command(command)
+                directions[row, column] = direction
+                # No run is longer than the maze, so larger counts only matter as collisions
+                steps[row, column] = min(count, self.cell_count + 1)
+                invalid[row, column] = bad
+        return directions, steps, invalid
+
+    def run_group(self, attempts, keep_paths=False):
+        count = len(attempts)
+        directions, steps, parse_errors = self.parse(attempts)
+        distances = self.goal_distances
+        start_distance = int(distances[self.start_index])
+        unreached = np.iinfo(np.int64).max
+
+        positions = np.full(count, self.start_index, dtype=np.int64)
+        # Every cell entered, as attempt * cell_count + cell; duplicates are removed at the end
+        offsets = np.arange(count, dtype=np.int64) * self.cell_count
+        entered = [offsets + positions]
+
+        move_count = np.zeros(count, dtype=np.int64)
+        wall_collisions = np.zeros(count, dtype=np.int64)
+        backtracks = np.zeros(count, dtype=np.int64)
+        first_invalid = np.full(count, -1, dtype=np.int64)
+        last_direction = np.full(count, NO_MOVE, dtype=np.int64)
+        closest = np.full(count, start_distance, dtype=np.int64)  # -1 while unknown
+        progress = np.zeros(directions.shape, dtype=np.int64)
+
+        for column in range(directions.shape[1]):
+            direction = directions[:, column]
+            moving = direction != NO_MOVE
+            code = np.where(moving, direction, 0)
+
+            free = self.jumps[code, positions]
+            moves = np.where(moving, np.minimum(steps[:, column], free), 0)
+            collided = moving & (steps[:, column] > free)
+            wall_collisions += collided
+            first_invalid = np.where((first_invalid < 0) & (collided | parse_errors[:, column]), column, first_invalid)
+
+            moved = moves > 0
+            backtracks += moved & (last_direction == (code ^ 1))
+            last_direction = np.where(moved, code, last_direction)
+
+            walking = np.flatnonzero(moved)
+            if len(walking):
+                # The cells of every run in one array, grouped by attempt in order
+                lengths = moves[walking]
+                run_starts = np.cumsum(lengths) - lengths
+                owner = np.repeat(walking, lengths)
+                step = np.arange(1, len(owner) + 1, dtype=np.int64) - np.repeat(run_starts, lengths)
+                cells = positions[owner] + self.strides[code[owner]] * step
+                entered.append(offsets[owner] + cells)
+
+                reached = distances[cells]
+                nearest = np.minimum.reduceat(np.where(reached >= 0, reached, unreached), run_starts)
+                current = closest[walking]
+                closest[walking] = np.where((nearest != unreached) & ((current < 0) | (nearest < current)),
+                                            nearest, current)
+                positions[walking] = cells[run_starts + lengths - 1]
+
+            move_count += moves
+            progress[:, column] = distances[positions]
+
+        visited = np.unique(np.concatenate(entered))
+        visited_rows = visited // self.cell_count
+        cells_visited = np.bincount(visited_rows, minlength=count)
+        # A move either enters a new cell or counts as a revisit
+        revisits = move_count - (cells_visited - 1)
+        optimal_moves = start_distance if start_distance >= 0 else None
+
+        if keep_paths:
+            bitmaps = np.zeros((count, (self.cell_count + 7) // 8), dtype=np.uint8)
+            visited_cells = visited - visited_rows * self.cell_count
+            np.bitwise_or.at(bitmaps, (visited_rows, visited_cells >> 3),
+                             np.left_shift(1, visited_cells & 7).astype(np.uint8))
+
+        performances = []
+        for row, commands in enumerate(attempts):
+            reached_goal = bool(positions[row] == self.goal_index)
+            moves_made = int(move_count[row])
+            remaining = int(distances[positions[row]])
+            performances.append({
+                "moves": moves_made,
+                "reached_goal": reached_goal,
+                "cells_visited": int(cells_visited[row]),
+                "optimal_moves": optimal_moves,
+                "optimality_gap": moves_made - optimal_moves if reached_goal and optimal_moves is not None else None,
+                "remaining_distance": remaining if remaining >= 0 else None,
+                "wall_collisions": int(wall_collisions[row]),
+                "revisits": int(revisits[row]),
+                "backtracks": int(backtracks[row]),
+                "first_invalid_command": int(first_invalid[row]) if first_invalid[row] >= 0 else None,
+                "closest_distance": int(closest[row]) if closest[row] >= 0 else None,
+                "progress": progress[row, :len(commands)]
+            })
+            if keep_paths:
+                performances[-1]["visited"] = bitmaps[row].tobytes()
+        return performances
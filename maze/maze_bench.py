@@ -0,0 +1,133 @@
+import os
+import sys
+import glob
+import json
+import time
+import random
+import platform
+import argparse
+import statistics
+from maze_generator import ALGORITHMS, DEFAULT_ALGORITHM, generate_maze
+from maze_batch import BatchReplay
+from maze_core import DIRECTIONS, MazeSimulation, path_to_commands
+
+DEFAULT_SIZES = [11, 25, 101, 501, 2001]
+SOLUTIONS_GLOB = os.path.join(os.path.dirname(os.path.abspath(__file__)), "solutions", "*.json")
+
+
+def solution_seeds():
+    """Seeds used in the recorded experiments, from maze_info in the solution files."""
+    seeds = []
+    for path in sorted(glob.glob(SOLUTIONS_GLOB)):
+        if path.endswith("_performance.json"):
+            continue
+        with open(path, 'r') as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            seed = data.get("maze_info", {}).get("seed")
+            if seed is not None and seed not in seeds:
+                seeds.append(seed)
+    return seeds
+
+
+def random_attempt(rng, length):
+    """Plausible but aimless LLM-style attempt: short moves in random directions."""
+    return [f"move {rng.choice(('up', 'down', 'left', 'right'))} {rng.randint(1, 4)}" for _ in range(length)]
+
+
+def measure(function, repeats):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def benchmark_maze(size, seed, repeats, batch_attempts, algorithm=DEFAULT_ALGORITHM):
+    """Time generation, solving and replay for one maze; returns one row per benchmark."""
+    rows = []
+
+    def record(benchmark, timings, **extra):
+        rows.append({
+            "benchmark": benchmark,
+            "size": size,
+            "seed": seed,
+            "algorithm": algorithm,
+            "repeats": len(timings),
+            "seconds_min": min(timings),
+            "seconds_median": statistics.median(timings),
+            **extra
+        })
+
+    # Generation always runs the algorithm; the maze cache is deliberately bypassed
+    record("generate", measure(lambda: generate_maze(size, size, seed, algorithm), repeats))
+    maze = generate_maze(size, size, seed, algorithm)
+
+    # Solving: full BFS distance field from the goal
+    record("solve_bfs", measure(lambda: maze.distances_from(*maze.goal), repeats))
+    optimal_commands = path_to_commands(maze.shortest_path(), maze.width)
+
+    # Jump tables are built on first replay; time them separately so replay numbers are steady-state
+    record("build_jump_tables", measure(lambda: [maze.build_jump_table(direction) for direction in DIRECTIONS], 1))
+    for direction in DIRECTIONS:
+        maze.jump_table(direction)
+    sim = MazeSimulation(maze)
+
+    record("replay_single", measure(lambda: sim.run_attempt(optimal_commands), repeats),
+           commands=len(optimal_commands))
+
+    rng = random.Random(seed)
+    attempts = [random_attempt(rng, 50) for _ in range(batch_attempts)]
+
+    def replay_batch():
+        for commands in attempts:
+            sim.run_attempt(commands)
+
+    record("replay_batch", measure(replay_batch, repeats), attempts=batch_attempts, commands_per_attempt=50)
+
+    # The same attempts advanced together with NumPy
+    batch = BatchReplay(maze)
+    record("replay_vectorized", measure(lambda: batch.run(attempts), repeats),
+           attempts=batch_attempts, commands_per_attempt=50)
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark maze generation, solving and replay.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Maze sizes to benchmark")
+    parser.add_argument("--algorithms", nargs="+", default=[DEFAULT_ALGORITHM], choices=sorted(ALGORITHMS),
+                        help="Generation algorithms to benchmark")
+    parser.add_argument("--random-seeds", type=int, default=2, help="Random seeds to add to the solution seeds")
+    parser.add_argument("--repeats", type=int, default=3, help="Timed runs per benchmark")
+    parser.add_argument("--batch-attempts", type=int, default=200, help="Attempts in the batch replay benchmark")
+    parser.add_argument("-o", "--output", default="maze_benchmark.json", help="Where to write the results")
+    args = parser.parse_args()
+
+    # Random seeds come from a fixed generator so runs stay comparable over time
+    seeds = solution_seeds()
+    seeds += random.Random(0).sample(range(1, 1000001), args.random_seeds)
+
+    results = []
+    for algorithm in args.algorithms:
+        for size in args.sizes:
+            for seed in seeds:
+                rows = benchmark_maze(size, seed, args.repeats, args.batch_attempts, algorithm)
+                results.extend(rows)
+                summary = ", ".join(f"{row['benchmark']} {row['seconds_min'] * 1000:.1f} ms" for row in rows)
+                print(f"{algorithm} size {size} seed {seed}: {summary}")
+
+    report = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "results": results
+    }
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"Results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+import os
+import time
+import zlib
+import struct
+from collections import OrderedDict
+from maze_core import Maze
+from maze_generator import DEFAULT_ALGORITHM, generate_maze
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".maze-cache")
+DEFAULT_MEMORY_BYTES = 256 << 20
+DEFAULT_DISK_BYTES = 256 << 20
+
+# File header: magic, width, height
+HEADER = struct.Struct("<4sII")
+MAGIC = b"MAZ1"
+
+
+class MazeCache:
+    """Generated mazes keyed by (algorithm, seed, width, height).
+
+    Lookups go to an in-memory LRU first, then to a directory of compressed grids, and
+    only generate the maze when neither has it. The memory tier is bounded by `max_bytes`
+    counting each maze's distance field and jump tables, which are far larger than the
+    grid; the directory is bounded by `max_disk_bytes`, least recently used files first.
+    """
+    def __init__(self, max_bytes=DEFAULT_MEMORY_BYTES, cache_dir=DEFAULT_CACHE_DIR,
+                 max_disk_bytes=DEFAULT_DISK_BYTES):
+        self.max_bytes = max_bytes
+        self.cache_dir = cache_dir
+        self.max_disk_bytes = max_disk_bytes
+        self.memory = OrderedDict()
+        self.files = None  # file name -> (size, last use), listed on first disk access
+        self.disk_bytes = 0
+
+    def get(self, width, height, seed, algorithm=DEFAULT_ALGORITHM):
+        # Without a seed the maze is not reproducible, so there is nothing to cache
+        if seed is None:
+            return generate_maze(width, height, seed, algorithm)
+
+        key = (algorithm, seed, width, height)
+        maze = self.memory.get(key)
+        if maze is not None:
+            self.memory.move_to_end(key)
+            return maze
+
+        maze = self.load(key)
+        if maze is None:
+            maze = generate_maze(width, height, seed, algorithm)
+            self.save(key, maze)
+
+        self.memory[key] = maze
+        self.trim_memory()
+        return maze
+
+    def trim_memory(self):
+        """Drop least recently used mazes until the rest fit in max_bytes, always keeping
+        the newest. Sizes are measured here because the tables are built after a maze is
+        handed out."""
+        total = sum(maze.nbytes for maze in self.memory.values())
+        while total > self.max_bytes and len(self.memory) > 1:
+            _, maze = self.memory.popitem(last=False)
+            total -= maze.nbytes
+
+    def scan(self):
+        self.files = {}
+        self.disk_bytes = 0
+        if not os.path.isdir(self.cache_dir):
+            return
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith(".maze"):
+                stat = entry.stat()
+                self.files[entry.name] = (stat.st_size, stat.st_mtime)
+                self.disk_bytes += stat.st_size
+
+    def path_for(self, key):
+        algorithm, seed, width, height = key
+        return os.path.join(self.cache_dir, f"{algorithm}-{seed}-{width}x{height}.maze")
+
+    def load(self, key):
+        try:
+            with open(self.path_for(key), 'rb') as f:
+                data = f.read()
+            magic, width, height = HEADER.unpack_from(data)
+            cells = bytearray(zlib.decompress(data[HEADER.size:]))
+        except (OSError, struct.error, zlib.error):
+            return None
+
+        if magic != MAGIC or (width, height) != key[2:] or len(cells) != width * height:
+            return None
+        self.touch(key)
+        return Maze(width, height, cells)
+
+    def touch(self, key):
+        # A hit marks the file as recently used, so pruning keeps it
+        path = self.path_for(key)
+        if self.files is None:
+            self.scan()
+        try:
+            now = time.time()
+            os.utime(path, (now, now))
+            size = os.path.getsize(path)
+        except OSError:
+            return
+        name = os.path.basename(path)
+        # Another process may have written the file since the directory was listed
+        self.disk_bytes += size - self.files.get(name, (0, 0))[0]
+        self.files[name] = (size, now)
+
+    def save(self, key, maze):
+        path = self.path_for(key)
+        # Per-process temp name, since parallel evaluators may write the same maze at once
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(temp_path, 'wb') as f:
+                f.write(HEADER.pack(MAGIC, maze.width, maze.height))
+                f.write(zlib.compress(bytes(maze.cells)))
+            # Rename into place so a reader never sees a half-written file
+            os.replace(temp_path, path)
+            size = os.path.getsize(path)
+        except OSError as e:
+            print(f"Could not write maze cache file {path}: {e}")
+            return
+
+        if self.files is None:
+            self.scan()
+        name = os.path.basename(path)
+        self.disk_bytes += size - self.files.get(name, (0, 0))[0]
+        self.files[name] = (size, time.time())
+        self.prune()
+
+    def prune(self):
+        """Delete least recently used files until the directory fits in max_disk_bytes."""
+        if self.disk_bytes <= self.max_disk_bytes:
+            return
+        for name in sorted(self.files, key=lambda name: self.files[name][1]):
+            if self.disk_bytes <= self.max_disk_bytes:
+                break
+            self.disk_bytes -= self.files.pop(name)[0]
+            try:
+                os.remove(os.path.join(self.cache_dir, name))
+            except OSError:
+                pass
@@ -0,0 +1,458 @@
+from array import array
+
+DIRECTIONS = {
+    "up": (-1, 0),
+    "down": (1, 0),
+    "left": (0, -1),
+    "right": (0, 1),
+}
+
+OPPOSITE_DIRECTIONS = {
+    "up": "down",
+    "down": "up",
+    "left": "right",
+    "right": "left",
+}
+
+# bytes.translate table mapping 0 -> ' ' and 1 -> '#'
+WALL_CHARS = bytes([32, 35]) + bytes(254)
+# bytes.translate tables between 0/1 flags and the digits '0'/'1'
+BIT_DIGITS = b"01" + bytes(254)
+DIGIT_BITS = bytes(48) + b"\x00\x01" + bytes(206)
+
+
+class Maze:
+    """Maze grid stored as one byte per cell (1 = wall, 0 = open), row-major."""
+    def __init__(self, width, height, cells=None):
+        self.width = width
+        self.height = height
+        self.cells = cells if cells is not None else bytearray(b'\x01') * (width * height)
+
+    def index(self, row, col):
+        return row * self.width + col
+
+    @property
+    def goal(self):
+        return (self.height - 2, self.width - 2)
+
+    def distances_from(self, row, col):
+        """Breadth-first distance in moves from (row, col) to every cell; -1 where unreachable."""
+        width = self.width
+        distances = array('i', [-1]) * len(self.cells)
+        source = row * width + col
+        if self.cells[source]:
+            return distances
+
+        # Generated mazes are walled on every edge, so open cells never need a bounds check.
+        # `blocked` starts as the walls and gains each cell as it is reached.
+        blocked = bytearray(self.cells)
+        blocked[source] = 1
+        distances[source] = 0
+        frontier = [source]
+        distance = 0
+        while frontier:
+            distance += 1
+            next_frontier = []
+            push = next_frontier.append
+            for index in frontier:
+                for neighbour in (index - width, index + width, index - 1, index + 1):
+                    if not blocked[neighbour]:
+                        blocked[neighbour] = 1
+                        distances[neighbour] = distance
+                        push(neighbour)
+            frontier = next_frontier
+        return distances
+
+    @property
+    def goal_distances(self):
+        """Distance field to the goal, computed on first use and kept with the maze."""
+        if getattr(self, '_goal_distances', None) is None:
+            self._goal_distances = self.distances_from(*self.goal)
+        return self._goal_distances
+
+    def jump_table(self, direction):
+        """For every cell, how many free cells lie in `direction` before a wall or the edge.
+
+        Built per direction on first use in linear time, one slice per corridor rather than
+        one step per cell, and kept with the maze like the distance field.
+        """
+        tables = self.__dict__.setdefault('_jump_tables', {})
+        if direction not in tables:
+            tables[direction] = self.build_jump_table(direction)
+        return tables[direction]
+
+    @property
+    def nbytes(self):
+        """Memory held by the grid and by the distance field and jump tables built so far."""
+        size = len(self.cells)
+        distances = self.__dict__.get('_goal_distances')
+        if distances is not None:
+            size += distances.itemsize * len(distances)
+        for table in self.__dict__.get('_jump_tables', {}).values():
+            size += table.itemsize * len(table)
+        return size
+
+    def build_jump_table(self, direction):
+        width, height = self.width, self.height
+        length = max(width, height)
+        typecode = 'H' if length < 2**16 else 'I'
+        counting_down = array(typecode, range(length - 1, -1, -1))
+        counting_up = array(typecode, range(length))
+        forward = direction in ("right", "down")
+
+        def runs(line):
+            # Each open stretch counts down towards its far end (forward) or up from its near end
+            table = array(typecode)
+            for position, segment in enumerate(line.split(b'\x01')):
+                if position:
+                    table.append(0)  # the wall between segments
+                run = len(segment)
+                table.extend(counting_down[length - run:] if forward else counting_up[:run])
+            return table
+
+        if direction in ("left", "right"):
+            table = array(typecode)
+            for start in range(0, width * height, width):
+                table.extend(runs(self.cells[start:start + width]))
+        elif direction in ("up", "down"):
+            table = array(typecode, bytes(array(typecode).itemsize * width * height))
+            for col in range(width):
+                table[col::width] = runs(self.cells[col::width])
+        else:
+            raise ValueError(f"Unknown direction: {direction}")
+        return table
+
+    def shortest_path(self, row=1, col=1):
+        """Cell indices of a shortest path from (row, col) to the goal, or [] if there is none."""
+        distances = self.goal_distances
+        width = self.width
+        index = row * width + col
+        if distances[index] < 0:
+            return []
+
+        # Walk down the distance field; some neighbour is always exactly one step closer
+        path = [index]
+        while distances[index] > 0:
+            for neighbour in (index - width, index + width, index - 1, index + 1):
+                if distances[neighbour] == distances[index] - 1:
+                    index = neighbour
+                    break
+            path.append(index)
+        return path
+
+    def distance_to_goal(self, row, col):
+        distance = self.goal_distances[row * self.width + col]
+        return distance if distance >= 0 else None
+
+    def is_wall(self, row, col):
+        return self.cells[row * self.width + col] == 1
+
+    def is_open(self, row, col):
+        return (0 <= row < self.height and
+                0 <= col < self.width and
+                not self.cells[row * self.width + col])
+
+    def rows(self):
+        """Rows as '#'/' ' strings, the layout the app originally kept in memory."""
+        text = self.cells.translate(WALL_CHARS).decode('ascii')
+        return [text[start:start + self.width] for start in range(0, len(text), self.width)]
+
+    def __eq__(self, other):
+        return (isinstance(other, Maze) and self.width == other.width and
+                self.height == other.height and self.cells == other.cells)
+
+
+class VisitedCells:
+    """Visited flags for every cell of a maze, one byte per cell indexed like Maze.cells.
+
+    The number of visited cells is kept as cells are added, so it never needs a scan, and
+    straight runs are marked with a single slice assignment. pack() stores the flags at
+    one bit per cell for keeping many attempts' paths.
+    """
+    def __init__(self, size):
+        self.flags = bytearray(size)
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, index):
+        return self.flags[index] == 1
+
+    def __iter__(self):
+        """Indices of visited cells, in order."""
+        return find_ones(self.flags)
+
+    def add(self, index):
+        if not self.flags[index]:
+            self.flags[index] = 1
+            self.count += 1
+
+    def add_run(self, origin, stride, length):
+        """Mark the `length` cells after `origin` in steps of `stride`; returns how many were already visited."""
+        if stride > 0:
+            run = slice(origin + stride, origin + stride * length + 1, stride)
+        else:
+            run = slice(origin + stride * length, origin, -stride)
+        already = self.flags[run].count(1)
+        self.flags[run] = b'\x01' * length
+        self.count += length - already
+        return already
+
+    def clear(self):
+        self.flags[:] = bytes(len(self.flags))
+        self.count = 0
+
+    def changed(self, previous):
+        """Indices whose flag differs from `previous`, a bytearray of the same layout."""
+        difference = int.from_bytes(self.flags, 'little') ^ int.from_bytes(previous, 'little')
+        if not difference:
+            return iter(())
+        return find_ones(difference.to_bytes(len(self.flags), 'little'))
+
+    def pack(self):
+        """Flags at one bit per cell, bit i of the little-endian result being cell i."""
+        if not self.flags:
+            return b""
+        bits = int(self.flags.translate(BIT_DIGITS)[::-1], 2)
+        return bits.to_bytes((len(self.flags) + 7) // 8, 'little')
+
+    @classmethod
+    def unpack(cls, packed, size):
+        visited = cls(size)
+        bits = int.from_bytes(packed, 'little')
+        if bits:
+            digits = format(bits, 'b').encode('ascii')
+            visited.flags[:len(digits)] = digits[::-1].translate(DIGIT_BITS)
+            visited.count = visited.flags.count(1)
+        return visited
+
+
+def find_ones(flags):
+    index = flags.find(1)
+    while index >= 0:
+        yield index
+        index = flags.find(1, index + 1)
+
+
+class CommandResult:
+    """Outcome of one command: history messages, whether it ran, and whether the goal was reached."""
+    def __init__(self, messages, completed=True, reached_goal=False):
+        self.messages = messages
+        self.completed = completed
+        self.reached_goal = reached_goal
+
+
+class MazeSimulation:
+    """Player movement through a maze, with no Tk dependency.
+
+    MazeApp drives this for interactive play and drawing; batch evaluation can use it
+    directly to replay attempts without a window. Trajectory metrics are gathered as the
+    commands run, so an attempt never has to be replayed a second time to score it.
+    """
+    def __init__(self, maze, start=(1, 1)):
+        self.maze = maze
+        self.height = maze.height
+        self.width = maze.width
+        self.start = list(start)
+        self.goal_pos = list(maze.goal)
+        self.reset()
+
+    def reset(self):
+        self.player_pos = self.start.copy()
+        self.path_visited = VisitedCells(len(self.maze.cells))
+        self.path_visited.add(self.start[0] * self.width + self.start[1])
+        self.move_count = 0
+
+        # Trajectory metrics
+        self.command_index = 0
+        self.wall_collisions = 0
+        self.revisits = 0
+        self.backtracks = 0
+        self.first_invalid_command = None
+        self.last_direction = None
+        self.closest_distance = self.maze.distance_to_goal(*self.start)
+        self.progress = array('i')  # distance to goal after each command, -1 if unreachable
+
+    def clear_path(self):
+        # Keep only the current position in the path
+        self.path_visited.clear()
+        self.path_visited.add(self.player_pos[0] * self.width + self.player_pos[1])
+
+    def is_open(self, row, col):
+        return self.maze.is_open(row, col)
+
+    def at_goal(self):
+        return self.player_pos == self.goal_pos
+
+    def process_command(self, command):
+        """Apply one "move <direction> [steps]" command and return a CommandResult."""
+        result = self.apply_command(command)
+
+        row, col = self.player_pos
+        self.progress.append(self.maze.goal_distances[row * self.width + col])
+        self.command_index += 1
+        return result
+
+    def mark_invalid(self):
+        if self.first_invalid_command is None:
+            self.first_invalid_command = self.command_index
+
+    def apply_command(self, command):
+        command = command.strip().lower()
+        if not command:
+            return CommandResult([], completed=False)
+
+        # Parse command
+        parts = command.split()
+
+        if len(parts) < 2 or parts[0] != "move":
+            self.mark_invalid()
+            return CommandResult([f"Invalid command: {command}"], completed=False)
+
+        direction = parts[1]
+        steps = 1  # Default is 1 step
+
+        # Check if steps are specified
+        if len(parts) > 2:
+            try:
+                steps = int(parts[2])
+            except ValueError:
+                self.mark_invalid()
+                return CommandResult([f"Invalid step count in: {command}"], completed=False)
+
+        # A zero or negative step count never looks at the direction
+        if steps > 0 and direction not in DIRECTIONS:
+            self.mark_invalid()
+            return CommandResult([f"Unknown direction: {direction}"], completed=False)
+
+        messages = []
+
+        # Process movement: the jump table gives the free run ahead in one lookup
+        moves_made = 0
+        if steps > 0:
+            row, col = self.player_pos
+            free = self.maze.jump_table(direction)[row * self.width + col]
+            moves_made = min(steps, free)
+
+            if moves_made > 0:
+                self.record_run(row, col, direction, moves_made)
+
+            if steps > free:
+                self.wall_collisions += 1
+                self.mark_invalid()
+                messages.append(f"Cannot move {direction} - wall or boundary")
+
+        if moves_made > 0:
+            messages.append(f"Moved {direction} {moves_made} step(s). Total moves: {self.move_count}")
+
+        # Check if player reached the goal
+        reached_goal = self.at_goal()
+        if reached_goal:
+            messages.append(f"Goal reached in {self.move_count} moves! Congratulations!")
+
+        return CommandResult(messages, reached_goal=reached_goal)
+
+    def record_run(self, row, col, direction, moves_made):
+        """Move along a straight run and update the path and trajectory metrics."""
+        dr, dc = DIRECTIONS[direction]
+
+        # Add every cell passed over to the path; cells already there count as revisits
+        stride = dr * self.width + dc
+        origin = row * self.width + col
+        self.revisits += self.path_visited.add_run(origin, stride, moves_made)
+
+        # Closest approach to the goal anywhere along the run, read as one slice of the field
+        if stride > 0:
+            passed = self.maze.goal_distances[origin + stride:origin + stride * moves_made + 1:stride]
+        else:
+            passed = self.maze.goal_distances[origin + stride * moves_made:origin:-stride]
+        nearest = min(passed)
+        if nearest >= 0 and (self.closest_distance is None or nearest < self.closest_distance):
+            self.closest_distance = nearest
+
+        # Reversing the previous movement direction is a backtrack
+        if self.last_direction == OPPOSITE_DIRECTIONS[direction]:
+            self.backtracks += 1
+        self.last_direction = direction
+
+        self.player_pos = [row + dr * moves_made, col + dc * moves_made]
+        self.move_count += moves_made
+
+    def run_attempt(self, commands):
+        """Replay an attempt from the start position and return its performance record."""
+        self.reset()
+        for command in commands:
+            self.process_command(command)
+        return self.performance()
+
+    def performance(self):
+        """Performance of the attempt so far, including how it compares to the shortest path."""
+        optimal_moves = self.maze.distance_to_goal(*self.start)
+        reached_goal = self.at_goal()
+        return {
+            "moves": self.move_count,
+            "reached_goal": reached_goal,
+            "cells_visited": len(self.path_visited),
+            "optimal_moves": optimal_moves,
+            "optimality_gap": self.move_count - optimal_moves if reached_goal and optimal_moves is not None else None,
+            "remaining_distance": self.maze.distance_to_goal(*self.player_pos),
+            "wall_collisions": self.wall_collisions,
+            "revisits": self.revisits,
+            "backtracks": self.backtracks,
+            "first_invalid_command": self.first_invalid_command,
+            "closest_distance": self.closest_distance,
+            "progress": self.progress
+        }
+
+
+def path_to_commands(path, width):
+    """Turn a list of adjacent cell indices into "move <direction> <steps>" commands."""
+    step_names = {-width: "up", width: "down", -1: "left", 1: "right"}
+    commands = []
+    direction = None
+    steps = 0
+    for previous, current in zip(path, path[1:]):
+        step_direction = step_names[current - previous]
+        if step_direction == direction:
+            steps += 1
+            continue
+        if direction is not None:
+            commands.append(f"move {direction} {steps}")
+        direction, steps = step_direction, 1
+    if direction is not None:
+        commands.append(f"move {direction} {steps}")
+    return commands
+
+
+def size_label(width, height):
+    """Maze size as reports record it: a number for square mazes as before, else "WxH"."""
+    return width if width == height else f"{width}x{height}"
+
+
+def performance_record(name, sim, seed, size, algorithm="dfs"):
+    """One entry of a *_performance.json report."""
+    return report_entry(name, sim.performance(), seed, size, algorithm)
+
+
+def report_entry(name, performance, seed, size, algorithm="dfs"):
+    """Report entry from a performance dict, from MazeSimulation or a batch replay."""
+    return {
+        "name": name,
+        "moves": performance["moves"],
+        "reached_goal": performance["reached_goal"],
+        "cells_visited": performance["cells_visited"],
+        "maze_seed": seed,
+        "maze_size": size,
+        "maze_algorithm": algorithm,
+        "optimal_moves": performance["optimal_moves"],
+        "optimality_gap": performance["optimality_gap"],
+        "remaining_distance": performance["remaining_distance"],
+        "wall_collisions": performance["wall_collisions"],
+        "revisits": performance["revisits"],
+        "backtracks": performance["backtracks"],
+        "first_invalid_command": performance["first_invalid_command"],
+        "closest_distance": performance["closest_distance"],
+        # Stored as an array while replaying; a plain list only when written to JSON
+        "progress": performance["progress"].tolist()
+    }
@@ -0,0 +1,187 @@
+import os
+import re
+import glob
+import argparse
+from maze_core import Maze
+from maze_generator import DEFAULT_ALGORITHM, generate_maze
+
+DEFAULT_CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "mazes")
+
+# Grid characters of the emoji (Copy Maze) and ASCII prompt formats, as wall bytes
+CELL_BYTES = str.maketrans({"⬛": "\x01", "#": "\x01", "⬜": "\x00", ".": "\x00", " ": "\x00",
+                            "🟥": "\x00", "P": "\x00", "🟩": "\x00", "G": "\x00"})
+PLAYER_MARKS = ("🟥", "P")
+GOAL_MARKS = ("🟩", "G")
+
+FOOTER = re.compile(r"^Maze (Seed|Size|Algorithm): *(\S+)\s*$")
+# Footers sit in the last few lines, so indexing only reads this much of each file
+FOOTER_BYTES = 512
+
+
+class CorpusMaze:
+    """A maze read back from a corpus file, with the seed, size and markers it was saved with."""
+    def __init__(self, path, maze, seed, algorithm, player, goal):
+        self.path = path
+        self.maze = maze
+        self.seed = seed
+        self.algorithm = algorithm
+        self.player = player
+        self.goal = goal
+
+    def verify(self):
+        """List of problems comparing the stored grid with a fresh maze from the same seed."""
+        problems = []
+        if self.seed is None:
+            return ["no Maze Seed footer"]
+        if self.goal is not None and self.goal != self.maze.goal:
+            problems.append(f"goal marked at {self.goal}, expected {self.maze.goal}")
+        expected = generate_maze(self.maze.width, self.maze.height, self.seed, self.algorithm)
+        if expected != self.maze:
+            differing = sum(1 for a, b in zip(expected.cells, self.maze.cells) if a != b)
+            problems.append(f"{differing} cells differ from seed {self.seed} ({self.algorithm})")
+        return problems
+
+
+def parse_footer(line, info):
+    match = FOOTER.match(line)
+    if not match:
+        return False
+    key, value = match.groups()
+    if key == "Seed":
+        info["seed"] = int(value)
+    elif key == "Size":
+        width, height = value.lower().split("x")
+        info["size"] = (int(width), int(height))
+    else:
+        info["algorithm"] = value
+    return True
+
+
+def parse_maze_lines(lines, path="<text>"):
+    """Build a CorpusMaze from an iterable of lines in the Copy Maze layout.
+
+    Grid rows come first, one character per cell, followed by `Maze Seed:`, `Maze Size:`
+    and optionally `Maze Algorithm:` footers. Lines are consumed one at a time, so a file
+    never has to be held in memory as text.
+    """
+    cells = bytearray()
+    width = None
+    height = 0
+    player = goal = None
+    info = {}
+
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if not line or line.startswith("Legend:"):
+            continue
+        if parse_footer(line, info):
+            continue
+
+        row = line.translate(CELL_BYTES)
+        # Anything left after stripping cell bytes is not a grid character
+        if row.strip("\x00\x01"):
+            raise ValueError(f"{path}: unexpected characters in row {height}")
+        if width is None:
+            width = len(row)
+        elif len(row) != width:
+            raise ValueError(f"{path}: row {height} has {len(row)} cells, expected {width}")
+
+        for mark in PLAYER_MARKS:
+            if mark in line:
+                player = (height, line.index(mark))
+        for mark in GOAL_MARKS:
+            if mark in line:
+                goal = (height, line.index(mark))
+        cells += row.encode("latin-1")
+        height += 1
+
+    if width is None:
+        raise ValueError(f"{path}: no maze grid found")
+    if "size" in info and info["size"] != (width, height):
+        raise ValueError(f"{path}: grid is {width}x{height} but the footer says {info['size'][0]}x{info['size'][1]}")
+
+    maze = Maze(width, height, cells)
+    return CorpusMaze(path, maze, info.get("seed"), info.get("algorithm", DEFAULT_ALGORITHM), player, goal)
+
+
+def read_maze_file(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return parse_maze_lines(f, path)
+
+
+def read_footer(path):
+    """Seed, size and algorithm from the end of a maze file, without parsing the grid."""
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        f.seek(max(0, f.tell() - FOOTER_BYTES))
+        tail = f.read().decode("utf-8", errors="ignore")
+    info = {}
+    for line in tail.splitlines():
+        parse_footer(line.strip(), info)
+    return info
+
+
+class MazeCorpus:
+    """Stored maze files in a directory, indexed by file name and by seed.
+
+    The index is built from the footers alone; a grid is parsed the first time it is asked
+    for and kept afterwards.
+    """
+    def __init__(self, directory=DEFAULT_CORPUS_DIR, pattern="*.txt"):
+        self.directory = directory
+        self.files = {}  # file name -> footer info
+        self.seeds = {}  # seed -> file names
+        self.loaded = {}  # file name -> CorpusMaze
+        for path in sorted(glob.glob(os.path.join(directory, pattern))):
+            name = os.path.basename(path)
+            info = read_footer(path)
+            self.files[name] = info
+            if "seed" in info:
+                self.seeds.setdefault(info["seed"], []).append(name)
+
+    def __len__(self):
+        return len(self.files)
+
+    def by_file(self, name):
+        name = os.path.basename(name)
+        if name not in self.files:
+            raise KeyError(name)
+        if name not in self.loaded:
+            self.loaded[name] = read_maze_file(os.path.join(self.directory, name))
+        return self.loaded[name]
+
+    def by_seed(self, seed, width=None, height=None, algorithm=DEFAULT_ALGORITHM):
+        """The stored maze for a seed (and size, if given), or None if the corpus has none."""
+        for name in self.seeds.get(seed, []):
+            info = self.files[name]
+            if info.get("algorithm", DEFAULT_ALGORITHM) != algorithm:
+                continue
+            if width is not None and info.get("size") != (width, height):
+                continue
+            return self.by_file(name)
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check stored maze files against the generator.")
+    parser.add_argument("directory", nargs="?", default=DEFAULT_CORPUS_DIR, help="Directory of maze .txt files")
+    args = parser.parse_args()
+
+    corpus = MazeCorpus(args.directory)
+    failures = 0
+    for name in corpus.files:
+        try:
+            stored = corpus.by_file(name)
+        except (OSError, ValueError) as e:
+            print(f"{name}: {e}")
+            failures += 1
+            continue
+        problems = stored.verify()
+        failures += bool(problems)
+        size = f"{stored.maze.width}x{stored.maze.height}"
+        print(f"{name}: seed {stored.seed}, {size}, {'; '.join(problems) if problems else 'matches the generator'}")
+    print(f"{len(corpus) - failures}/{len(corpus)} maze files verified")
+
+
+if __name__ == "__main__":
+    main()
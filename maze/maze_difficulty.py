@@ -0,0 +1,175 @@
+import csv
+import bisect
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from maze_core import path_to_commands
+from maze_generator import ALGORITHMS, DEFAULT_ALGORITHM, generate_maze
+
+# Upper bounds of the corridor-length histogram bins, in moves; the last bin is open-ended
+CORRIDOR_BINS = (1, 2, 4, 8, 16, 32)
+CORRIDOR_COLUMNS = [f"corridors_le_{bound}" for bound in CORRIDOR_BINS] + [f"corridors_gt_{CORRIDOR_BINS[-1]}"]
+
+BANDS = ("very easy", "easy", "medium", "hard", "very hard")
+
+COLUMNS = ["seed", "width", "height", "algorithm", "solution_length", "turns", "path_junctions",
+           "dead_ends", "junctions", "branching_factor", "corridor_count", "corridor_mean",
+           "corridor_max"] + CORRIDOR_COLUMNS + ["score", "band"]
+
+
+def difficulty_score(stats):
+    """Single number for ranking: every move counts, turns and decisions on the way count extra.
+
+    A turn is a change of direction the solver has to get right and a junction on the
+    optimal path is a point where it can go wrong, so they weigh more than plain moves.
+    """
+    if stats["solution_length"] is None:
+        return None
+    return stats["solution_length"] + 2 * stats["turns"] + 4 * stats["path_junctions"]
+
+
+def analyze_maze(maze, start=(1, 1)):
+    """Structural statistics of one maze, each computed in time linear in its cells."""
+    width, cells = maze.width, maze.cells
+    steps = (-width, width, -1, 1)
+
+    # Open neighbours of every open cell; generated mazes are walled on every edge
+    degree = bytearray(len(cells))
+    for index in range(width, len(cells) - width):
+        if not cells[index]:
+            degree[index] = (4 - cells[index - width] - cells[index + width] -
+                             cells[index - 1] - cells[index + 1])
+    dead_ends = degree.count(1)
+    passages = degree.count(2)
+    junctions = degree.count(3) + degree.count(4)
+
+    # Corridors: chains of two-way cells between dead ends and junctions, measured in moves.
+    # Each is walked once from either end, so the work stays linear in the cells.
+    corridor_lengths = []
+    for node in range(width, len(cells) - width):
+        if cells[node] or degree[node] == 2:
+            continue
+        for step in steps:
+            first = index = node + step
+            if cells[index]:
+                continue
+            previous = node
+            length = 1
+            while degree[index] == 2:
+                following = next(index + s for s in steps if index + s != previous and not cells[index + s])
+                previous, index = index, following
+                length += 1
+            # Keep the walk from the end that sorts first
+            if (node, first) < (index, previous):
+                corridor_lengths.append(length)
+
+    histogram = [0] * (len(CORRIDOR_BINS) + 1)
+    for length in corridor_lengths:
+        position = next((i for i, bound in enumerate(CORRIDOR_BINS) if length <= bound), len(CORRIDOR_BINS))
+        histogram[position] += 1
+
+    path = maze.shortest_path(*start)
+    solution_length = len(path) - 1 if path else None
+    commands = path_to_commands(path, width) if path else []
+
+    # Branching factor: ways on from a cell that is not a dead end, besides the way in
+    moving_cells = passages + junctions
+    exits = sum(degree) - dead_ends
+    branching = exits / moving_cells - 1 if moving_cells else 0.0
+
+    stats = {
+        "width": maze.width,
+        "height": maze.height,
+        "solution_length": solution_length,
+        "turns": max(0, len(commands) - 1),
+        "path_junctions": sum(1 for index in path[1:-1] if degree[index] >= 3),
+        "dead_ends": dead_ends,
+        "junctions": junctions,
+        "branching_factor": round(branching, 4),
+        "corridor_count": len(corridor_lengths),
+        "corridor_mean": round(sum(corridor_lengths) / len(corridor_lengths), 3) if corridor_lengths else 0.0,
+        "corridor_max": max(corridor_lengths, default=0),
+    }
+    stats.update(zip(CORRIDOR_COLUMNS, histogram))
+    stats["score"] = difficulty_score(stats)
+    return stats
+
+
+def analyze_seed(seed, width, height, algorithm):
+    stats = analyze_maze(generate_maze(width, height, seed, algorithm))
+    return {"seed": seed, "algorithm": algorithm, **stats}
+
+
+def assign_bands(rows):
+    """Label rows by score quintile within the sweep; equal scores share a band and
+    unsolvable mazes get none."""
+    scores = sorted(row["score"] for row in rows if row["score"] is not None)
+    for row in rows:
+        if row["score"] is None:
+            row["band"] = ""
+        else:
+            rank = bisect.bisect_left(scores, row["score"])
+            row["band"] = BANDS[rank * len(BANDS) // len(scores)]
+
+
+def parse_seed_range(text):
+    """"100-200" -> range(100, 201); "7" -> range(7, 8)."""
+    first, _, last = text.partition("-")
+    return range(int(first), int(last or first) + 1)
+
+
+def sweep(seeds, width, height, algorithm, workers=None):
+    seeds = list(seeds)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        chunksize = max(1, len(seeds) // (64 * (workers or 1)))
+        rows = list(pool.map(analyze_seed, seeds, [width] * len(seeds), [height] * len(seeds),
+                             [algorithm] * len(seeds), chunksize=chunksize))
+    assign_bands(rows)
+    return rows
+
+
+def write_table(rows, path):
+    # Sorted by seed, so the table doubles as an index for lookups
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=COLUMNS)
+        writer.writeheader()
+        writer.writerows(sorted(rows, key=lambda row: row["seed"]))
+
+
+def read_table(path):
+    """Rows of a written table keyed by seed."""
+    with open(path, newline='') as f:
+        return {int(row["seed"]): row for row in csv.DictReader(f)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Analyze maze difficulty over ranges of seeds.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    sweep_parser = subparsers.add_parser("sweep", help="Analyze a seed range and write a table")
+    sweep_parser.add_argument("seeds", type=parse_seed_range, help="Seed or seed range, e.g. 1-10000")
+    sweep_parser.add_argument("--width", type=int, default=11, help="Maze width")
+    sweep_parser.add_argument("--height", type=int, default=None, help="Maze height (default: same as width)")
+    sweep_parser.add_argument("--algorithm", default=DEFAULT_ALGORITHM, choices=sorted(ALGORITHMS), help="Generation algorithm")
+    sweep_parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    sweep_parser.add_argument("-o", "--output", default="maze_difficulty.csv", help="Where to write the table")
+
+    pick_parser = subparsers.add_parser("pick", help="List seeds in a difficulty band from a table")
+    pick_parser.add_argument("table", help="Table written by sweep")
+    pick_parser.add_argument("band", choices=BANDS, help="Difficulty band")
+    pick_parser.add_argument("-n", "--count", type=int, default=10, help="How many seeds to list")
+    args = parser.parse_args()
+
+    if args.command == "sweep":
+        height = args.height or args.width
+        rows = sweep(args.seeds, args.width, height, args.algorithm, args.workers)
+        write_table(rows, args.output)
+        print(f"Analyzed {len(rows)} {args.width}x{height} {args.algorithm} mazes -> {args.output}")
+    else:
+        rows = [row for row in read_table(args.table).values() if row["band"] == args.band]
+        for row in rows[:args.count]:
+            print(f"seed {row['seed']}: solution {row['solution_length']} moves, {row['turns']} turns, "
+                  f"{row['path_junctions']} junctions on the path, score {row['score']}")
+
+
+if __name__ == "__main__":
+    main()
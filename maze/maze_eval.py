@@ -0,0 +1,144 @@
+import os
+import glob
+import json
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from maze_cache import MazeCache
+from maze_generator import ALGORITHMS, DEFAULT_ALGORITHM
+from maze_batch import BatchReplay
+from maze_core import report_entry, size_label
+from maze_corpus import MazeCorpus
+
+# Attempts per task; files with more attempts than this are split across workers.
+# Each chunk is replayed as one vectorized batch, so chunks are fairly large.
+CHUNK_SIZE = 2048
+
+# One cache per worker process, so a maze is generated at most once per process
+_maze_cache = None
+# Stored mazes to use instead of generating, when --corpus is given
+_corpus = None
+
+
+def get_maze_cache():
+    global _maze_cache
+    if _maze_cache is None:
+        _maze_cache = MazeCache()
+    return _maze_cache
+
+
+def use_corpus(directory):
+    global _corpus
+    _corpus = MazeCorpus(directory)
+
+
+def load_maze(seed, width, height, algorithm):
+    """The stored maze for this seed if the corpus has one, otherwise a generated one."""
+    if _corpus is not None:
+        stored = _corpus.by_seed(seed, width, height, algorithm)
+        if stored is not None:
+            return stored.maze
+    return get_maze_cache().get(width, height, seed, algorithm)
+
+
+def load_solution_file(path, default_seed=None, default_width=None, default_height=None):
+    """Return (seed, width, height, algorithm, attempts) from a solution file in either the new or the old list format.
+
+    maze_info gives "size" for square mazes and "width"/"height" otherwise.
+    """
+    with open(path, 'r') as f:
+        data = json.load(f)
+
+    if isinstance(data, dict) and "attempts" in data:
+        maze_info = data.get("maze_info", {})
+        seed = maze_info.get("seed", default_seed)
+        width = maze_info.get("width", maze_info.get("size", default_width))
+        height = maze_info.get("height", maze_info.get("size", default_height))
+        # Files written before other algorithms existed are all depth-first mazes
+        algorithm = maze_info.get("algorithm", DEFAULT_ALGORITHM)
+        attempts = data["attempts"]
+    else:
+        # Old format - just a list of attempts
+        seed, width, height, algorithm, attempts = default_seed, default_width, default_height, DEFAULT_ALGORITHM, data
+
+    if seed is None or width is None or height is None:
+        raise ValueError("no maze seed and size in maze_info; give --seed and --size (or --width/--height)")
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"unknown maze algorithm {algorithm!r}")
+    if not isinstance(attempts, list):
+        raise ValueError("expected a list of attempts")
+    return seed, width, height, algorithm, attempts
+
+
+def evaluate_chunk(seed, width, height, algorithm, attempts):
+    """Replay a slice of one file's attempts and return their performance records."""
+    maze = load_maze(seed, width, height, algorithm)
+    size = size_label(width, height)
+    attempts = [attempt for attempt in attempts if "name" in attempt and "commands" in attempt]
+    performances = BatchReplay(maze).run([attempt["commands"] for attempt in attempts])
+    return [
+        report_entry(attempt["name"], performance, seed, size, algorithm)
+        for attempt, performance in zip(attempts, performances)
+    ]
+
+
+def find_solution_files(patterns):
+    paths = []
+    for pattern in patterns:
+        for path in sorted(glob.glob(pattern)):
+            # Reports sit next to their solution files and usually match the same glob
+            if path.endswith("_performance.json") or path in paths:
+                continue
+            paths.append(path)
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay maze solution files and write *_performance.json reports.")
+    parser.add_argument("files", nargs="+", help="Solution files or glob patterns, e.g. maze/solutions/*.json")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--seed", type=int, default=None, help="Maze seed for old-format files without maze_info")
+    parser.add_argument("--size", type=int, default=None, help="Maze size for old-format files without maze_info")
+    parser.add_argument("--width", type=int, default=None, help="Maze width, for non-square mazes (default: --size)")
+    parser.add_argument("--height", type=int, default=None, help="Maze height, for non-square mazes (default: --size)")
+    parser.add_argument("--corpus", default=None, help="Directory of stored maze files (e.g. mazes) to use before generating")
+    args = parser.parse_args()
+
+    default_width = args.width or args.size
+    default_height = args.height or args.size
+    paths = find_solution_files(args.files)
+    if not paths:
+        print("No solution files matched.")
+        return
+
+    # Every worker indexes the corpus once when it starts
+    corpus_options = {"initializer": use_corpus, "initargs": (args.corpus,)} if args.corpus else {}
+    with ProcessPoolExecutor(max_workers=args.workers, **corpus_options) as pool:
+        # Submit every chunk of every file up front so the pool stays busy across files
+        jobs = []
+        for path in paths:
+            try:
+                seed, width, height, algorithm, attempts = load_solution_file(path, args.seed, default_width, default_height)
+            except (OSError, ValueError) as e:
+                print(f"Skipping {path}: {e}")
+                continue
+            futures = [
+                pool.submit(evaluate_chunk, seed, width, height, algorithm, attempts[start:start + CHUNK_SIZE])
+                for start in range(0, len(attempts), CHUNK_SIZE)
+            ]
+            jobs.append((path, futures))
+
+        for path, futures in jobs:
+            performance_report = []
+            for future in futures:
+                performance_report.extend(future.result())
+
+            report_filename = os.path.splitext(path)[0] + "_performance.json"
+            with open(report_filename, 'w') as f:
+                json.dump(performance_report, f, indent=2)
+
+            reached = sum(1 for item in performance_report if item["reached_goal"])
+            print(f"{path}: {reached}/{len(performance_report)} reached the goal -> {report_filename}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,276 @@
+import random
+from array import array
+from maze_core import Maze
+
+
+def cell_grid(width, height, pad=0, value=1):
+    """Flat grid with `value` at every carvable (odd row, odd column) cell inside the border.
+
+    `pad` extra cells before and after let neighbour lookups run off the edge without a
+    bounds check; index `pad + i` corresponds to maze cell `i`.
+    """
+    grid = bytearray(width * height + 2 * pad)
+    columns = len(range(1, width - 1, 2))
+    for row in range(1, height - 1, 2):
+        start = pad + row * width + 1
+        grid[start:start + 2 * columns:2] = bytes([value]) * columns
+    return grid
+
+
+def choice_table(items):
+    """(options, count, draw width) for every subset of up to four items, indexed by bit mask.
+
+    random.choice and randrange draw getrandbits(count.bit_length()) until the value is
+    below count; doing the same inline with these keeps the random stream identical at a
+    fraction of the call cost.
+    """
+    table = []
+    for mask in range(16):
+        options = tuple(item for bit, item in enumerate(items) if mask & (1 << bit))
+        table.append((options, len(options), len(options).bit_length()))
+    return table
+
+
+def carve_dfs(maze, rng):
+    """Randomized depth-first search (recursive backtracker): long, winding corridors.
+
+    Draws random numbers in the same order the original list-of-lists generator did,
+    so a given seed and size always gives the same maze as before.
+    """
+    width, height = maze.width, maze.height
+    cells = maze.cells
+
+    # Only odd-indexed cells are carved so there is a wall between all passages.
+    # `fresh` marks odd cells inside the border that have not been carved yet; it is padded
+    # by two rows on each side so neighbour lookups never need a bounds check.
+    pad = 2 * width
+    fresh = cell_grid(width, height, pad)
+
+    # Directions: right, down, left, up (order matters for reproducing old mazes)
+    offsets = (2, 2 * width, -2, -2 * width)
+
+    # Candidate offsets for every combination of unvisited neighbours, in direction order
+    candidates = choice_table(offsets)
+    getrandbits = rng.getrandbits
+
+    right, down, left, up = (offset + pad for offset in offsets)
+    current = width + 1
+    cells[current] = 0
+    fresh[current + pad] = 0
+    stack = [current]
+    push = stack.append
+    pop = stack.pop
+
+    while True:
+        mask = (fresh[current + right] | fresh[current + down] << 1 |
+                fresh[current + left] << 2 | fresh[current + up] << 3)
+
+        if mask:
+            options, n, bits = candidates[mask]
+            r = getrandbits(bits)
+            while r >= n:
+                r = getrandbits(bits)
+            offset = options[r]
+
+            # Remove the wall between current cell and chosen cell, then carve the chosen cell
+            cells[current + (offset >> 1)] = 0
+            current += offset
+            cells[current] = 0
+            fresh[current + pad] = 0
+            push(current)
+        else:
+            # Backtrack
+            pop()
+            if not stack:
+                break
+            current = stack[-1]
+
+
+def carve_kruskal(maze, rng):
+    """Randomized Kruskal: remove walls in random order unless they would close a loop.
+
+    Gives many short dead ends. Connectivity is tracked with a union-find in an array('i')
+    over the carvable cells only, with the finds inlined (path halving) and union by size,
+    so generation is near-linear and needs no stack.
+    """
+    width, height = maze.width, maze.height
+    cells = maze.cells
+    cells[:] = cell_grid(width, height).translate(bytes([1, 0]) + bytes(254))
+
+    # Carvable cells are numbered row by row over the odd rows and columns. A wall is
+    # stored as twice the number of the cell left of or above it, plus 1 if it separates
+    # horizontal neighbours, so the shuffle moves plain ints and the loop needs no division.
+    columns = len(range(1, width - 1, 2))
+    rows = len(range(1, height - 1, 2))
+    walls = [2 * (row * columns + col) + 1 for row in range(rows) for col in range(columns - 1)]
+    walls += [2 * (row * columns + col) for row in range(rows - 1) for col in range(columns)]
+    rng.shuffle(walls)
+
+    parent = array('i', range(rows * columns))
+    size = array('i', [1]) * (rows * columns)
+
+    for wall in walls:
+        first = a = wall >> 1
+        b = a + 1 if wall & 1 else a + columns
+        while parent[a] != a:
+            parent[a] = a = parent[parent[a]]
+        while parent[b] != b:
+            parent[b] = b = parent[parent[b]]
+        if a == b:
+            continue
+        if size[a] < size[b]:
+            a, b = b, a
+        parent[b] = a
+        size[a] += size[b]
+
+        row, col = divmod(first, columns)
+        cells[(2 * row + 1) * width + 2 * col + 1 + (1 if wall & 1 else width)] = 0
+
+
+def carve_prim(maze, rng):
+    """Randomized Prim: grow one tree from the start by attaching a random frontier cell.
+
+    Gives short, branchy corridors radiating from the start. Frontier cells are removed by
+    swapping with the last entry, so each step is constant time; random draws are inlined
+    as in carve_dfs.
+    """
+    width, height = maze.width, maze.height
+    cells = maze.cells
+
+    # 0 = outside the grid, 1 = not reached, 2 = on the frontier, 3 = in the maze
+    pad = 2 * width
+    state = cell_grid(width, height, pad)
+    offsets = (2, 2 * width, -2, -2 * width)
+    right, down, left, up = offsets
+    joins = choice_table(offsets)
+    getrandbits = rng.getrandbits
+
+    frontier = []
+    push = frontier.append
+    current = width + 1
+    while True:
+        # Add the cell to the maze and its unreached neighbours to the frontier, in
+        # direction order
+        cells[current] = 0
+        index = current + pad
+        state[index] = 3
+        if state[index + right] == 1:
+            state[index + right] = 2
+            push(current + right)
+        if state[index + down] == 1:
+            state[index + down] = 2
+            push(current + down)
+        if state[index + left] == 1:
+            state[index + left] = 2
+            push(current + left)
+        if state[index + up] == 1:
+            state[index + up] = 2
+            push(current + up)
+        if not frontier:
+            break
+
+        n = len(frontier)
+        bits = n.bit_length()
+        r = getrandbits(bits)
+        while r >= n:
+            r = getrandbits(bits)
+        frontier[r], frontier[-1] = frontier[-1], frontier[r]
+        current = frontier.pop()
+
+        # Join it to a random neighbour that is already part of the maze
+        index = current + pad
+        mask = ((state[index + right] == 3) | (state[index + down] == 3) << 1 |
+                (state[index + left] == 3) << 2 | (state[index + up] == 3) << 3)
+        options, n, bits = joins[mask]
+        r = getrandbits(bits)
+        while r >= n:
+            r = getrandbits(bits)
+        cells[current + (options[r] >> 1)] = 0
+
+
+def carve_wilson(maze, rng):
+    """Wilson's algorithm: loop-erased random walks, giving a uniformly random spanning tree.
+
+    Unbiased, so mazes have no characteristic corridor shape. Each walk only remembers the
+    last direction taken from every cell, which erases loops implicitly. Early walks on a
+    large grid are long, so this is by far the slowest of the algorithms for big mazes.
+    """
+    width, height = maze.width, maze.height
+    cells = maze.cells
+
+    # 0 = outside the grid, 1 = not in the tree yet, 3 = in the tree
+    pad = 2 * width
+    state = cell_grid(width, height, pad)
+    offsets = (2, 2 * width, -2, -2 * width)
+    exits = bytearray(len(state))
+
+    # Directions that stay inside the grid never change, so each cell's choices are looked
+    # up once here rather than on every step of every walk
+    choices = choice_table(range(4))
+    moves = [None] * len(state)
+    for row in range(1, height - 1, 2):
+        for index in range(pad + row * width + 1, pad + row * width + width - 1, 2):
+            mask = ((state[index + 2] > 0) | (state[index + 2 * width] > 0) << 1 |
+                    (state[index - 2] > 0) << 2 | (state[index - 2 * width] > 0) << 3)
+            moves[index] = choices[mask]
+    getrandbits = rng.getrandbits
+
+    start = width + 1
+    cells[start] = 0
+    state[start + pad] = 3
+
+    for row in range(1, height - 1, 2):
+        for col in range(1, width - 1, 2):
+            origin = row * width + col + pad
+            if state[origin] == 3:
+                continue
+
+            # Random walk until the tree is hit, remembering the latest exit from each cell
+            index = origin
+            while state[index] != 3:
+                options, n, bits = moves[index]
+                r = getrandbits(bits)
+                while r >= n:
+                    r = getrandbits(bits)
+                direction = options[r]
+                exits[index] = direction
+                index += offsets[direction]
+
+            # Follow the remembered exits from the origin: that is the loop-erased walk
+            index = origin
+            while state[index] != 3:
+                state[index] = 3
+                offset = offsets[exits[index]]
+                cells[index - pad] = 0
+                cells[index - pad + (offset >> 1)] = 0
+                index += offset
+
+
+# Generation algorithms by name; each carves passages into an all-wall maze using `rng`
+ALGORITHMS = {
+    "dfs": carve_dfs,
+    "kruskal": carve_kruskal,
+    "prim": carve_prim,
+    "wilson": carve_wilson,
+}
+
+DEFAULT_ALGORITHM = "dfs"
+
+
+def generate_maze(width, height, seed=None, algorithm=DEFAULT_ALGORITHM):
+    """Generate a maze with the named algorithm from ALGORITHMS.
+
+    Every algorithm uses its own random.Random(seed), so generation is thread-safe, leaves
+    the global RNG alone and always gives the same maze for a seed, size and algorithm.
+    """
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unknown maze algorithm: {algorithm}")
+
+    rng = random.Random(seed)
+    maze = Maze(width, height)
+    ALGORITHMS[algorithm](maze, rng)
+
+    # Ensure the goal is open
+    maze.cells[(height - 2) * width + width - 2] = 0
+
+    return maze
@@ -0,0 +1,136 @@
+import re
+import argparse
+from itertools import groupby
+from maze_generator import ALGORITHMS, DEFAULT_ALGORITHM, generate_maze
+
+# Marker characters used while building every format; each format translates them
+WALL, OPEN, PLAYER, GOAL = "#", " ", "P", "G"
+
+EMOJI = str.maketrans({WALL: "⬛", OPEN: "⬜", PLAYER: "🟥", GOAL: "🟩"})
+ASCII = str.maketrans({OPEN: "."})
+
+# Roughly how BPE tokenizers split text before merging: words, short digit groups,
+# punctuation runs and whitespace
+TOKEN_PIECES = re.compile(r"[A-Za-z]+|\d{1,3}|[^\sA-Za-z\d\x80-\U0010ffff]+|\s+|[\x80-\U0010ffff]")
+
+
+def marked_rows(maze, player=None, goal=None):
+    """Maze rows as WALL/OPEN strings with the player and goal marked; the player wins a tie."""
+    rows = maze.rows()
+    goal = goal if goal is not None else maze.goal
+    for mark, position in ((GOAL, goal), (PLAYER, player)):
+        if position is not None:
+            row, col = position
+            rows[row] = rows[row][:col] + mark + rows[row][col + 1:]
+    return rows
+
+
+def emoji_text(rows):
+    """The original copy_maze format: one coloured square per cell."""
+    return "".join(row.translate(EMOJI) + "\n" for row in rows)
+
+
+def ascii_text(rows):
+    legend = f"Legend: {WALL} wall, . open, {PLAYER} you, {GOAL} goal\n"
+    return legend + "".join(row.translate(ASCII) + "\n" for row in rows)
+
+
+def coordinate_text(rows):
+    """Open cells listed by row; any cell not listed is a wall."""
+    lines = [f"Open cells as row: columns (0-based), all other cells are walls. {PLAYER} = you, {GOAL} = goal."]
+    for row_number, row in enumerate(rows):
+        columns = [f"{col}{char if char in (PLAYER, GOAL) else ''}"
+                   for col, char in enumerate(row) if char != WALL]
+        if columns:
+            lines.append(f"{row_number}: {' '.join(columns)}")
+    return "\n".join(lines) + "\n"
+
+
+def rle_text(rows):
+    """Each row as runs of count-and-symbol, with a count of 1 left out."""
+    legend = f"Rows run-length encoded as count then symbol ({WALL} wall, . open, {PLAYER} you, {GOAL} goal; no count means 1)\n"
+    lines = []
+    for row in rows:
+        runs = []
+        for char, run in groupby(row.translate(ASCII)):
+            count = sum(1 for _ in run)
+            runs.append(f"{count}{char}" if count > 1 else char)
+        lines.append("".join(runs))
+    return legend + "\n".join(lines) + "\n"
+
+
+FORMATS = {
+    "emoji": emoji_text,
+    "ascii": ascii_text,
+    "coords": coordinate_text,
+    "rle": rle_text,
+}
+
+
+def serialize(maze, format="emoji", player=None, goal=None):
+    """Maze text in one of FORMATS, built in time linear in the number of cells."""
+    if format not in FORMATS:
+        raise ValueError(f"Unknown prompt format: {format}")
+    return FORMATS[format](marked_rows(maze, player, goal))
+
+
+def maze_footer(seed, width, height, algorithm=DEFAULT_ALGORITHM):
+    """Seed and size lines as Copy Maze always wrote them; the algorithm line only for
+    non-default algorithms, so depth-first prompts match the recorded experiments."""
+    footer = f"\nMaze Seed: {seed}\nMaze Size: {width}x{height}\n"
+    if algorithm != DEFAULT_ALGORITHM:
+        footer += f"Maze Algorithm: {algorithm}\n"
+    return footer
+
+
+def estimate_tokens(text):
+    """Rough token count for GPT-style BPE tokenizers, without needing the tokenizer.
+
+    Words count one token per four letters, punctuation runs one per two characters, and
+    anything outside ASCII one per two UTF-8 bytes, which is about what emoji cost.
+    """
+    tokens = 0
+    for piece in TOKEN_PIECES.findall(text):
+        first = piece[0]
+        if first > "\x7f":
+            tokens += (len(first.encode("utf-8")) + 1) // 2
+        elif first.isalpha():
+            tokens += (len(piece) + 3) // 4
+        elif first.isspace() or first.isdigit():
+            tokens += 1
+        else:
+            tokens += (len(piece) + 1) // 2
+    return tokens
+
+
+def format_costs(maze, player=None, goal=None):
+    """Characters and estimated tokens of every format, cheapest first."""
+    rows = marked_rows(maze, player, goal)
+    costs = []
+    for name, build in FORMATS.items():
+        text = build(rows)
+        costs.append({"format": name, "characters": len(text), "tokens": estimate_tokens(text)})
+    costs.sort(key=lambda cost: cost["tokens"])
+    return costs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the prompt cost of each maze text format.")
+    parser.add_argument("--seed", type=int, required=True, help="Maze seed")
+    parser.add_argument("--width", type=int, default=11, help="Maze width")
+    parser.add_argument("--height", type=int, default=None, help="Maze height (default: same as width)")
+    parser.add_argument("--algorithm", default=DEFAULT_ALGORITHM, choices=sorted(ALGORITHMS), help="Generation algorithm")
+    parser.add_argument("--show", choices=sorted(FORMATS), help="Also print the maze in this format")
+    args = parser.parse_args()
+
+    height = args.height or args.width
+    maze = generate_maze(args.width, height, args.seed, args.algorithm)
+    for cost in format_costs(maze, player=(1, 1)):
+        print(f"{cost['format']:>8}: {cost['characters']:>9} characters, ~{cost['tokens']} tokens")
+    if args.show:
+        print()
+        print(serialize(maze, args.show, player=(1, 1)) + maze_footer(args.seed, args.width, height, args.algorithm))
+
+
+if __name__ == "__main__":
+    main()